@@ -62,9 +62,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.features.metrics.middleware.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'core.features.common.middleware.AsyncWhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -120,6 +121,30 @@ else:
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+CACHE_URL = os.environ.get('CACHE_URL')
+
+if CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+            'KEY_PREFIX': os.environ.get('CACHE_KEY_PREFIX', 'project-dashboard'),
+        }
+    }
+else:
+    # Per-process stand-in for local runs and tests.
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'project-dashboard',
+            'OPTIONS': {'MAX_ENTRIES': 5000},
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -176,6 +201,32 @@ CSRF_COOKIE_SECURE = os.environ.get('CSRF_COOKIE_SECURE', 'false').lower() == 't
 SESSION_COOKIE_SAMESITE = normalise_samesite(os.environ.get('SESSION_COOKIE_SAMESITE', 'Lax'))
 SESSION_COOKIE_SECURE = os.environ.get('SESSION_COOKIE_SECURE', 'false').lower() == 'true'
 
+FAST_LIST_SERIALIZATION = os.environ.get('FAST_LIST_SERIALIZATION', 'true').lower() == 'true'
+PROGRAM_SUMMARY_CACHE_TIMEOUT = int(os.environ.get('PROGRAM_SUMMARY_CACHE_TIMEOUT', '30'))
+ACTIVITY_LOG_MODE = os.environ.get('ACTIVITY_LOG_MODE', 'buffered')
+ACTIVITY_BUFFER_SIZE = int(os.environ.get('ACTIVITY_BUFFER_SIZE', '500'))
+ACTIVITY_BUFFER_LIMIT = int(os.environ.get('ACTIVITY_BUFFER_LIMIT', '100000'))
+ACTIVITY_FLUSH_INTERVAL = float(os.environ.get('ACTIVITY_FLUSH_INTERVAL', '1.0'))
+ACTIVITY_FLUSH_AFTER_RESPONSE = os.environ.get('ACTIVITY_FLUSH_AFTER_RESPONSE', 'true').lower() == 'true'
+ACTIVITY_ARCHIVE_DIR = os.environ.get('ACTIVITY_ARCHIVE_DIR', str(BASE_DIR / 'archive' / 'activity'))
+ACTIVITY_RETENTION_MONTHS = int(os.environ.get('ACTIVITY_RETENTION_MONTHS', '12'))
+ACTIVITY_PARTITIONS_AHEAD = int(os.environ.get('ACTIVITY_PARTITIONS_AHEAD', '3'))
+EVENT_STREAM_POLL_INTERVAL = float(os.environ.get('EVENT_STREAM_POLL_INTERVAL', '1.0'))
+EVENT_STREAM_GRACE = float(os.environ.get('EVENT_STREAM_GRACE', '2.0'))
+EVENT_STREAM_HEARTBEAT = float(os.environ.get('EVENT_STREAM_HEARTBEAT', '15'))
+EVENT_STREAM_RETRY_MS = int(os.environ.get('EVENT_STREAM_RETRY_MS', '3000'))
+EVENT_STREAM_BATCH_SIZE = int(os.environ.get('EVENT_STREAM_BATCH_SIZE', '500'))
+EVENT_STREAM_QUEUE_SIZE = int(os.environ.get('EVENT_STREAM_QUEUE_SIZE', '1000'))
+API_CACHE_ENABLED = os.environ.get('API_CACHE_ENABLED', 'true').lower() == 'true'
+API_CACHE_TIMEOUT = int(os.environ.get('API_CACHE_TIMEOUT', '300'))
+# Async list/detail views; config.asgi turns them on, WSGI keeps the sync views.
+ASYNC_READ_VIEWS = os.environ.get('ASYNC_READ_VIEWS', 'false').lower() == 'true'
+# Above this many rows, filters indexed only per project need ?project_id=.
+LIST_FILTER_SCAN_ROWS = int(os.environ.get('LIST_FILTER_SCAN_ROWS', '50000'))
+AUDIT_LOG_ENABLED = os.environ.get('AUDIT_LOG_ENABLED', 'true').lower() == 'true'
+REQUEST_METRICS_ENABLED = os.environ.get('REQUEST_METRICS_ENABLED', 'true').lower() == 'true'
+REQUEST_METRICS_SAMPLES = int(os.environ.get('REQUEST_METRICS_SAMPLES', '1000'))
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',
@@ -183,7 +234,10 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_FILTER_BACKENDS': [
+        'core.features.common.filters.ListFilterBackend',
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'core.features.common.pagination.ConfiguredPageNumberPagination',
     'PAGE_SIZE': 20,
     'PAGE_SIZE_QUERY_PARAM': 'page_size',
     'MAX_PAGE_SIZE': 1000,
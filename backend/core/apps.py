@@ -3,3 +3,25 @@ from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     name = 'core'
+
+    def ready(self):
+        from core.features.activity.recorder import connect_recorder_signals
+        from core.features.common.cache import connect_cache_signals
+        from core.features.projects.signals import connect_summary_signals
+        from core.features.search.index import connect_search_signals
+        from core.models import (
+            Approval,
+            BudgetItem,
+            Document,
+            MediaItem,
+            Milestone,
+            Project,
+            Rfi,
+            Risk,
+        )
+
+        # Before the summary receivers, which re-snapshot the loaded values.
+        connect_cache_signals([Project, BudgetItem, Milestone, Risk, Rfi, Document, MediaItem, Approval])
+        connect_search_signals()
+        connect_summary_signals()
+        connect_recorder_signals()
@@ -0,0 +1,216 @@
+import gzip
+import heapq
+import json
+import os
+import re
+from datetime import date, datetime
+from itertools import islice
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, models, transaction
+
+from core.features.common.cache import invalidate_all
+
+from .models import ActivityLog
+from .partitions import detach_month, drop_table, month_bounds
+
+ARCHIVE_NAME = re.compile(r'^activity-(\d{4})-(\d{2})\.ndjson\.gz$')
+EXPORT_CHUNK_SIZE = 2000
+DELETE_CHUNK_SIZE = 1000
+# Counts are keyed by the archive's size and mtime, so they never go stale.
+COUNT_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+def _encode(value):
+    # Full isoformat: DjangoJSONEncoder would cut datetimes to milliseconds.
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+def archive_dir() -> Path:
+    return Path(settings.ACTIVITY_ARCHIVE_DIR)
+
+
+def archive_path(month: date) -> Path:
+    return archive_dir() / f'activity-{month:%Y-%m}.ndjson.gz'
+
+
+def archived_months() -> list[date]:
+    directory = archive_dir()
+    if not directory.is_dir():
+        return []
+    months = []
+    for path in directory.iterdir():
+        match = ARCHIVE_NAME.match(path.name)
+        if match:
+            months.append(date(int(match[1]), int(match[2]), 1))
+    return sorted(months)
+
+
+def archive_month(month: date) -> int:
+    """Move ``month``'s rows into its gzipped NDJSON archive; returns the row count.
+
+    Archives hold one line per row in (created_at, id) order. Archiving a
+    month again (late rows) merges the new rows into what is already there.
+    Rows leave the database only once the archive holding them is on disk,
+    and only rows that were exported:
+
+    - A month partition is detached before it is read, so rows arriving
+      meanwhile go to the default partition rather than being dropped
+      unread. A table left detached by an interrupted run is picked up again.
+    - Other rows (SQLite, the default partition) are deleted by id, so rows
+      committed after the export stay for the next run.
+    """
+    columns = [field.attname for field in ActivityLog._meta.concrete_fields]
+    written = 0
+    table = detach_month(month)
+    if table is not None:
+        written += _write_archive(month, _lines(columns, _table_rows(table, columns)))
+        drop_table(table)
+
+    start, end = month_bounds(month)
+    rows = (
+        ActivityLog.objects.filter(created_at__gte=start, created_at__lt=end)
+        .order_by('created_at', 'id')
+        .values_list(*columns)
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    exported = []
+    written += _write_archive(month, _lines(columns, _recording_ids(rows, columns.index('id'), exported)))
+    with transaction.atomic():
+        for offset in range(0, len(exported), DELETE_CHUNK_SIZE):
+            ActivityLog.objects.filter(pk__in=exported[offset:offset + DELETE_CHUNK_SIZE]).delete()
+    if written:
+        invalidate_all()
+    return written
+
+
+def _lines(columns: list[str], rows):
+    for row in rows:
+        yield json.dumps(dict(zip(columns, row)), default=_encode, separators=(',', ':')) + '\n'
+
+
+def _recording_ids(rows, index: int, ids: list):
+    for row in rows:
+        ids.append(row[index])
+        yield row
+
+
+def _table_rows(table: str, columns: list[str]):
+    """A detached partition's rows in archive order, read through a server-side cursor."""
+    quote = connection.ops.quote_name
+    # The driver hands JSON columns back as text, as it does to JSONField.from_db_value.
+    json_columns = {
+        index for index, field in enumerate(ActivityLog._meta.concrete_fields) if isinstance(field, models.JSONField)
+    }
+    with connection.chunked_cursor() as cursor:
+        cursor.execute(
+            f'SELECT {", ".join(quote(column) for column in columns)} FROM {quote(table)} '
+            f'ORDER BY {quote("created_at")}, {quote("id")}'
+        )
+        while batch := cursor.fetchmany(EXPORT_CHUNK_SIZE):
+            for row in batch:
+                yield tuple(
+                    json.loads(value) if index in json_columns and isinstance(value, str) else value
+                    for index, value in enumerate(row)
+                )
+
+
+def _write_archive(month: date, lines) -> int:
+    """Merge ``lines``, in archive order, into ``month``'s archive; returns how many were given.
+
+    The new lines go to a temporary file first, and the archive is replaced
+    in one rename, so an interrupted run leaves the previous archive intact.
+    """
+    path = archive_path(month)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f'{path.name}.partial')
+    written = 0
+    with gzip.open(partial, 'wt', encoding='utf-8') as handle:
+        for line in lines:
+            handle.write(line)
+            written += 1
+    if not written:
+        partial.unlink()
+        return 0
+    if path.exists():
+        merged = path.with_name(f'{path.name}.merged')
+        with gzip.open(merged, 'wt', encoding='utf-8') as handle:
+            handle.writelines(_merged(path, partial))
+        partial.unlink()
+        partial = merged
+    os.replace(partial, path)
+    return written
+
+
+def _merged(*paths: Path):
+    """The lines of sorted archive files in (created_at, id) order, each row once.
+
+    A row exported twice, after a run that stopped before deleting it, has
+    the same key both times, so the copies come out next to each other.
+    """
+    previous = None
+    for key, line in heapq.merge(*(_keyed(path) for path in paths)):
+        if key != previous:
+            yield line
+        previous = key
+
+
+def _keyed(path: Path):
+    with gzip.open(path, 'rt', encoding='utf-8') as handle:
+        for line in handle:
+            row = json.loads(line)
+            yield (datetime.fromisoformat(row['created_at']), row['id']), line
+
+
+class ArchivedEntries:
+    """One archived month's entries, oldest first, read a page at a time.
+
+    It supports ``count()`` and slicing, which is all Django's paginator
+    needs. A slice streams the archive only as far as its end and parses
+    just the rows it returns, so a page costs its offset rather than the
+    whole month. The count takes one pass and is cached until the archive
+    changes. ``project_id`` is matched on the raw line before any row is
+    parsed.
+    """
+
+    def __init__(self, month: date, project_id: str | None = None):
+        self.path = archive_path(month)
+        self.project_id = project_id
+        self.marker = f'"project_id":{json.dumps(project_id)}' if project_id else None
+
+    def count(self) -> int:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return 0
+        key = f'activity-archive-count:{self.path.name}:{stat.st_size}:{stat.st_mtime_ns}:{self.project_id or ""}'
+        count = cache.get(key)
+        if count is None:
+            count = sum(1 for _ in self._matching())
+            cache.set(key, count, COUNT_CACHE_TIMEOUT)
+        return count
+
+    def __getitem__(self, window: slice) -> list[ActivityLog]:
+        matching = self._matching()
+        try:
+            lines = list(islice(matching, window.start or 0, window.stop))
+        finally:
+            matching.close()
+        fields = ActivityLog._meta.concrete_fields
+        return [
+            ActivityLog(**{field.attname: field.to_python(row[field.attname]) for field in fields})
+            for row in map(json.loads, lines)
+        ]
+
+    def _matching(self):
+        if not self.path.exists():
+            return
+        with gzip.open(self.path, 'rt', encoding='utf-8') as handle:
+            for line in handle:
+                if self.marker is None:
+                    yield line
+                # The marker could also occur inside metadata; confirm on a match.
+                elif self.marker in line and json.loads(line)['project_id'] == self.project_id:
+                    yield line
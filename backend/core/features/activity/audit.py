@@ -0,0 +1,115 @@
+import re
+from datetime import date, time
+from decimal import Decimal
+
+from django.conf import settings
+
+from core.features.common.signals import row_values
+from core.features.projects.models import Project
+
+from .models import ActivityLog
+from .recorder import build_entry, record_activity
+
+# Bumped on every save, so they would show up in every diff.
+IGNORED_FIELDS = {'created_at', 'updated_at'}
+
+
+def actor_name(request) -> str:
+    if request.user and request.user.is_authenticated:
+        return request.user.get_username()
+    return 'System'
+
+
+def entity_type_for(model) -> str:
+    """``BudgetItem`` -> ``'budget_item'``, matching the existing log entries."""
+    return re.sub(r'(?<!^)(?=[A-Z])', '_', model.__name__).lower()
+
+
+def _jsonable(value):
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return value
+
+
+def field_changes(model, previous: dict | None, current: dict | None) -> dict:
+    """Return ``{field: {'old': ..., 'new': ...}}`` for every column that differs.
+
+    Both sides are column values keyed by attname, as sent with
+    ``rows_bulk_changed``; None stands for a row that does not exist on that
+    side. Keys use the API field name (``project`` rather than ``project_id``).
+    """
+    changes = {}
+    for field in model._meta.concrete_fields:
+        if field.primary_key or field.name in IGNORED_FIELDS:
+            continue
+        old = previous.get(field.attname) if previous is not None else None
+        new = current.get(field.attname) if current is not None else None
+        if old != new:
+            changes[field.name] = {'old': _jsonable(old), 'new': _jsonable(new)}
+    return changes
+
+
+def audit_entries(model, changes: list[tuple[dict | None, dict | None]], actor: str) -> list[ActivityLog]:
+    """Build one activity entry per created, edited or deleted row.
+
+    Edits that leave every audited column as it was are skipped. Deleting a
+    project cascades to its log, so those deletes are not recorded.
+    """
+    entity_type = entity_type_for(model)
+    pk_name = model._meta.pk.attname
+    entries = []
+    for previous, current in changes:
+        if previous is None:
+            action = ActivityLog.Action.CREATE
+        elif current is None:
+            if model is Project:
+                continue
+            action = ActivityLog.Action.DELETE
+        else:
+            action = ActivityLog.Action.UPDATE
+        diff = field_changes(model, previous, current)
+        if not diff:
+            continue
+        row = current if current is not None else previous
+        project_id = row[pk_name] if model is Project else row['project_id']
+        entries.append(
+            build_entry(project_id, actor, action, entity_type, str(row[pk_name]), {'changes': diff})
+        )
+    return entries
+
+
+class AuditMixin:
+    """Records creates, edits and deletes made through the viewset in ``ActivityLog``.
+
+    Diffs are taken from the instance the view has already loaded, read
+    before and after the save, so auditing adds no queries to the request.
+    The entries go through ``record_activity`` and are written after the
+    response like every other activity row. Bulk writes report their rows
+    through ``bulk_changed``. Set AUDIT_LOG_ENABLED=false to turn it off.
+    """
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        self.audit([(None, row_values(serializer.instance))])
+
+    def perform_update(self, serializer):
+        previous = row_values(serializer.instance)
+        super().perform_update(serializer)
+        self.audit([(previous, row_values(serializer.instance))])
+
+    def perform_destroy(self, instance):
+        previous = row_values(instance)
+        super().perform_destroy(instance)
+        self.audit([(previous, None)])
+
+    def bulk_changed(self, changes: list[tuple[dict | None, dict | None]]) -> None:
+        super().bulk_changed(changes)
+        self.audit(changes)
+
+    def audit(self, changes: list[tuple[dict | None, dict | None]]) -> None:
+        if not settings.AUDIT_LOG_ENABLED:
+            return
+        model = self.get_queryset().model
+        record_activity(audit_entries(model, changes, actor_name(self.request)))
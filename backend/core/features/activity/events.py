@@ -0,0 +1,252 @@
+import asyncio
+import logging
+import weakref
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.db.models import Q
+from django.utils import timezone as django_timezone
+from rest_framework.renderers import JSONRenderer
+
+from core.features.approvals.models import Approval
+from core.features.approvals.serializers import ApprovalSerializer
+from core.features.common.fastpath import compile_row_encoder
+
+from .models import ActivityLog
+from .serializers import ActivityLogSerializer
+
+logger = logging.getLogger(__name__)
+
+# kind -> (model, serializer, timestamp the tail follows). Activity follows
+# created_at, which its indexes and partitions cover; approvals change in
+# place, so they follow updated_at.
+SOURCES = {
+    'activity': (ActivityLog, ActivityLogSerializer, 'created_at'),
+    'approval': (Approval, ApprovalSerializer, 'updated_at'),
+}
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_renderer = JSONRenderer()
+_broadcasters = weakref.WeakKeyDictionary()
+
+
+class Event:
+    __slots__ = ('moment', 'kind', 'pk', 'project_id', 'data')
+
+    def __init__(self, moment: datetime, kind: str, pk: str, project_id: str, data: bytes):
+        self.moment = moment
+        self.kind = kind
+        self.pk = pk
+        self.project_id = project_id
+        self.data = data
+
+    @property
+    def id(self) -> str:
+        # An approval is sent again each time it changes, so its id includes the time.
+        return f'{_micros(self.moment)}:{self.kind}:{self.pk}'
+
+    @property
+    def position(self) -> tuple:
+        return (self.moment, self.kind, self.pk)
+
+    def encode(self) -> str:
+        return f'id: {self.id}\nevent: {self.kind}\ndata: {self.data.decode()}\n\n'
+
+
+def _micros(moment: datetime) -> int:
+    return (moment - EPOCH) // timedelta(microseconds=1)
+
+
+def parse_event_id(value: str | None) -> tuple | None:
+    """The (moment, kind, pk) position a ``Last-Event-ID`` points at, or None."""
+    try:
+        micros, kind, pk = value.split(':', 2)
+        moment = EPOCH + timedelta(microseconds=int(micros))
+    except (AttributeError, ValueError, OverflowError):
+        return None
+    # An empty kind marks the start of a moment, as sent when a stream opens.
+    return (moment, kind, pk) if kind in SOURCES or not kind else None
+
+
+def grace() -> timedelta:
+    """How far behind its cursor the tail looks again for rows that were late.
+
+    Rows become visible when their transaction commits, and buffered
+    activity is written up to ACTIVITY_FLUSH_INTERVAL after it is stamped.
+    """
+    return timedelta(seconds=settings.EVENT_STREAM_GRACE + settings.ACTIVITY_FLUSH_INTERVAL)
+
+
+def _after(timestamp: str, kind: str, position: tuple):
+    """Rows of ``kind`` that sort after ``position``, a (moment, kind, pk) triple."""
+    moment, after_kind, pk = position
+    condition = Q(**{f'{timestamp}__gt': moment})
+    if kind > after_kind:
+        condition |= Q(**{timestamp: moment})
+    elif kind == after_kind:
+        condition |= Q(**{timestamp: moment, 'id__gt': pk})
+    return condition
+
+
+async def load_events(project_ids: list[str], after: tuple, limit: int) -> tuple[list[Event], bool]:
+    """Events of ``project_ids`` after the ``after`` position, oldest first.
+
+    Returns (events, more). Each kind loads at most ``limit`` rows. When one
+    kind is cut short, the merged list stops at that kind's last row, so
+    the caller can continue from the last event without skipping any.
+    """
+    events = []
+    cutoffs = []
+    for kind, (model, serializer_class, timestamp) in SOURCES.items():
+        columns, encode = compile_row_encoder(serializer_class())
+        extra = [name for name in ('id', 'project_id', timestamp) if name not in columns]
+        queryset = (
+            model.objects.filter(_after(timestamp, kind, after), project_id__in=project_ids)
+            .order_by(timestamp, 'id')
+            .values_list(*columns, *extra, named=True)
+        )
+        loaded = [
+            Event(getattr(row, timestamp), kind, row.id, row.project_id, _renderer.render(encode(row)))
+            async for row in queryset[:limit]
+        ]
+        if len(loaded) >= limit:
+            cutoffs.append(loaded[-1].position)
+        events.extend(loaded)
+    events.sort(key=lambda event: event.position)
+    if not cutoffs:
+        return events, False
+    cutoff = min(cutoffs)
+    return [event for event in events if event.position <= cutoff], True
+
+
+class Subscription:
+    def __init__(self, project_id: str):
+        self.project_id = project_id
+        self.queue = asyncio.Queue(maxsize=settings.EVENT_STREAM_QUEUE_SIZE)
+
+    def put(self, event: Event) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Too slow to keep up: end the stream; the client resumes from
+            # its Last-Event-ID and catches up from the database.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class EventBroadcaster:
+    """Tails the activity and approval tables once for every stream in this worker.
+
+    While anyone is subscribed, it polls every EVENT_STREAM_POLL_INTERVAL
+    seconds for rows of the subscribed projects and hands them to their
+    queues. The database cost is one query per kind per interval, however
+    many clients are connected. Every worker tails the database on its own,
+    so writes from other workers and processes show up as well. Each poll
+    also looks back over the grace window, and ids already sent are skipped.
+    """
+
+    def __init__(self):
+        self.subscriptions: dict[str, set[Subscription]] = {}
+        self.task = None
+        self.cursor = None
+        self.sent: dict[str, datetime] = {}
+
+    def subscribe(self, project_id: str) -> Subscription:
+        subscription = Subscription(project_id)
+        self.subscriptions.setdefault(project_id, set()).add(subscription)
+        if self.task is None or self.task.done():
+            self.cursor = django_timezone.now()
+            self.sent.clear()
+            self.task = asyncio.create_task(self._run())
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self.subscriptions.get(subscription.project_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self.subscriptions[subscription.project_id]
+
+    async def _run(self) -> None:
+        while self.subscriptions:
+            await asyncio.sleep(settings.EVENT_STREAM_POLL_INTERVAL)
+            try:
+                await self.poll()
+            except DatabaseError:
+                logger.exception('Polling for stream events failed; retrying.')
+
+    async def poll(self) -> None:
+        after = (self.cursor - grace(), '', '')
+        more = bool(self.subscriptions)
+        while more:
+            events, more = await load_events(list(self.subscriptions), after, settings.EVENT_STREAM_BATCH_SIZE)
+            for event in events:
+                if event.id in self.sent:
+                    continue
+                self.sent[event.id] = event.moment
+                self.cursor = max(self.cursor, event.moment)
+                for subscription in tuple(self.subscriptions.get(event.project_id, ())):
+                    subscription.put(event)
+            if events:
+                after = events[-1].position
+        horizon = self.cursor - grace()
+        self.sent = {event_id: moment for event_id, moment in self.sent.items() if moment > horizon}
+
+
+def broadcaster() -> EventBroadcaster:
+    """The broadcaster of the running event loop, one per ASGI worker."""
+    loop = asyncio.get_running_loop()
+    if loop not in _broadcasters:
+        _broadcasters[loop] = EventBroadcaster()
+    return _broadcasters[loop]
+
+
+async def event_stream(project_id: str, last_event_id: str | None = None, follow: bool = True):
+    """Yield ``project_id``'s events as SSE frames, replaying what followed ``last_event_id``.
+
+    A fresh stream starts with an id for the current moment, so a client
+    that reconnects before any event arrives still resumes from there.
+    The subscription starts before the replay query, so nothing committed
+    in between is lost. The stream keeps the position of the last id it
+    sent and skips tail events at or before it, which the tail's grace
+    window and a replay both deliver, so a client's Last-Event-ID only
+    moves forward. Comment frames every EVENT_STREAM_HEARTBEAT seconds
+    keep idle connections open through proxies. With ``follow`` off the
+    stream ends after the replay and the client's reconnect polls.
+    """
+    position = parse_event_id(last_event_id)
+    start = ''
+    if position is None:
+        position = (django_timezone.now(), '', '')
+        start = f'id: {_micros(position[0])}::\n'
+    hub = subscription = None
+    if follow:
+        hub = broadcaster()
+        subscription = hub.subscribe(project_id)
+    try:
+        yield f'retry: {settings.EVENT_STREAM_RETRY_MS}\n{start}\n'
+        more = True
+        while more:
+            events, more = await load_events([project_id], position, settings.EVENT_STREAM_BATCH_SIZE)
+            for event in events:
+                position = event.position
+                yield event.encode()
+            # Without follow, one batch per request; the reconnect picks up the rest.
+            more = more and follow
+        while follow:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), settings.EVENT_STREAM_HEARTBEAT)
+            except asyncio.TimeoutError:
+                yield ': keep-alive\n\n'
+                continue
+            if event is None:
+                return
+            if event.position > position:
+                position = event.position
+                yield event.encode()
+    finally:
+        if subscription is not None:
+            hub.unsubscribe(subscription)
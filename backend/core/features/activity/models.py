@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from core.features.common.models import TimeStampedModel
 from core.features.projects.models import Project
 
@@ -9,6 +10,8 @@ class ActivityLog(TimeStampedModel):
         APPROVE = 'approve', 'Approve'
         REJECT = 'reject', 'Reject'
         UPDATE = 'update', 'Update'
+        CREATE = 'create', 'Create'
+        DELETE = 'delete', 'Delete'
 
     id = models.CharField(max_length=32, primary_key=True)
     project = models.ForeignKey(Project, related_name='activity_logs', on_delete=models.CASCADE)
@@ -17,9 +20,15 @@ class ActivityLog(TimeStampedModel):
     entity_type = models.CharField(max_length=120)
     entity_id = models.CharField(max_length=60)
     metadata = models.JSONField(default=dict, blank=True)
+    # Stamped when the event is recorded, not when a buffered batch is written.
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='activity_created_idx'),
+            models.Index(fields=['project', '-created_at', '-id'], name='activity_project_created_idx'),
+        ]
 
     def __str__(self) -> str:
         return f'{self.project_id} · {self.entity_type} {self.entity_id}'
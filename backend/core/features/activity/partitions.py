@@ -0,0 +1,123 @@
+from datetime import date, datetime, timezone
+
+from django.db import connection, transaction
+
+from .models import ActivityLog
+
+DEFAULT_PARTITION_SUFFIX = 'default'
+
+
+def month_start(value: date | datetime) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_bounds(month: date) -> tuple[datetime, datetime]:
+    """The [start, end) UTC instants of ``month``, matching the partition bounds."""
+    start = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    end = add_months(month, 1)
+    return start, datetime(end.year, end.month, 1, tzinfo=timezone.utc)
+
+
+def partition_name(month: date) -> str:
+    return f'{ActivityLog._meta.db_table}_p{month:%Y_%m}'
+
+
+def default_partition_name() -> str:
+    return f'{ActivityLog._meta.db_table}_{DEFAULT_PARTITION_SUFFIX}'
+
+
+def is_partitioned() -> bool:
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid '
+            'WHERE c.relname = %s',
+            [ActivityLog._meta.db_table],
+        )
+        return cursor.fetchone() is not None
+
+
+def existing_partitions() -> list[str]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname FROM pg_inherits i '
+            'JOIN pg_class parent ON parent.oid = i.inhparent '
+            'JOIN pg_class child ON child.oid = i.inhrelid '
+            'WHERE parent.relname = %s ORDER BY child.relname',
+            [ActivityLog._meta.db_table],
+        )
+        return [name for (name,) in cursor.fetchall()]
+
+
+def _bound(value: datetime) -> str:
+    # Partition bounds can't be bind parameters; these come from month_bounds.
+    return f"'{value.isoformat()}'"
+
+
+def create_partition(month: date) -> bool:
+    """Create and attach the partition for ``month``; False if it already exists.
+
+    Rows that went to the default partition because their month had no
+    partition yet are moved across in the same transaction, otherwise the
+    attach would fail.
+    """
+    name = partition_name(month)
+    if name in existing_partitions():
+        return False
+    quote = connection.ops.quote_name
+    parent = quote(ActivityLog._meta.db_table)
+    start, end = month_bounds(month)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'CREATE TABLE {quote(name)} (LIKE {parent} INCLUDING DEFAULTS)')
+        cursor.execute(
+            f'WITH moved AS (DELETE FROM {quote(default_partition_name())} '
+            f'WHERE created_at >= %s AND created_at < %s RETURNING *) '
+            f'INSERT INTO {quote(name)} SELECT * FROM moved',
+            [start, end],
+        )
+        cursor.execute(
+            f'ALTER TABLE {parent} ATTACH PARTITION {quote(name)} '
+            f'FOR VALUES FROM ({_bound(start)}) TO ({_bound(end)})'
+        )
+    return True
+
+
+def ensure_partitions(first: date, last: date) -> list[str]:
+    """Create any missing monthly partitions from ``first`` to ``last`` inclusive."""
+    created = []
+    month = month_start(first)
+    while month <= last:
+        if create_partition(month):
+            created.append(partition_name(month))
+        month = add_months(month, 1)
+    return created
+
+
+def detach_month(month: date) -> str | None:
+    """Detach ``month``'s partition and return its table name, or None if it has none.
+
+    Once detached, rows arriving for the month land in the default
+    partition, and the table's rows can be read without racing new ones. A
+    table left detached by an interrupted run is returned as it is.
+    """
+    if not is_partitioned():
+        return None
+    name = partition_name(month)
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        if name in existing_partitions():
+            cursor.execute(f'ALTER TABLE {quote(ActivityLog._meta.db_table)} DETACH PARTITION {quote(name)}')
+            return name
+        cursor.execute("SELECT 1 FROM pg_class WHERE relname = %s AND relkind = 'r'", [name])
+        return name if cursor.fetchone() else None
+
+
+def drop_table(name: str) -> None:
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE {connection.ops.quote_name(name)}')
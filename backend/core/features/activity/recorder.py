@@ -0,0 +1,190 @@
+import atexit
+import json
+import logging
+import os
+import threading
+import uuid
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.signals import request_finished
+from django.db import DatabaseError, IntegrityError, close_old_connections, connection, transaction
+
+from core.features.common.cache import invalidate_rows
+from core.features.common.signals import row_values
+
+from .models import ActivityLog
+
+logger = logging.getLogger(__name__)
+
+
+def build_entry(project_id: str, actor: str, action: str, entity_type: str, entity_id: str, metadata=None):
+    return ActivityLog(
+        id=uuid.uuid4().hex,
+        project_id=project_id,
+        actor=actor,
+        action=action,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        metadata=metadata or {},
+    )
+
+
+class ActivityBufferFull(RuntimeError):
+    """Raised when activity writes keep failing and the buffer holds ACTIVITY_BUFFER_LIMIT entries."""
+
+
+class ActivityBuffer:
+    """Per-process buffer of activity entries, written with ``bulk_create``.
+
+    Entries are written once ACTIVITY_BUFFER_SIZE are waiting, every
+    ACTIVITY_FLUSH_INTERVAL seconds from a background thread (0 disables
+    it), after each response has been sent and at interpreter exit.
+
+    A batch the database rejects is split and retried in halves, so one
+    entry pointing at a deleted project is logged and dropped on its own
+    while the rest are written. Entries that fail for any other reason go
+    back for the next flush, however long the database is away; ids are
+    fixed up front so a retry never duplicates rows. Once
+    ACTIVITY_BUFFER_LIMIT entries are waiting, ``add`` logs the entries it
+    was given and raises ActivityBufferFull rather than grow further.
+    Entries are logged in full wherever they are given up, so they can be
+    replayed.
+    """
+
+    def __init__(self):
+        self.entries = []
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.thread = None
+        self.stop = threading.Event()
+        self.pid = None
+
+    def add(self, entries: list) -> None:
+        with self.lock:
+            overflow = len(self.entries) + len(entries) > settings.ACTIVITY_BUFFER_LIMIT
+            if not overflow:
+                self.entries.extend(entries)
+            full = len(self.entries) >= settings.ACTIVITY_BUFFER_SIZE
+        self._ensure_thread()
+        if overflow:
+            _log_lost(entries, 'the buffer is full')
+            raise ActivityBufferFull(
+                f'{settings.ACTIVITY_BUFFER_LIMIT} activity entries are waiting to be written; '
+                f'rejected {len(entries)} more.'
+            )
+        if full:
+            self.flush()
+
+    def pending(self) -> int:
+        with self.lock:
+            return len(self.entries)
+
+    def flush(self) -> int:
+        """Write everything buffered so far; returns the number of rows written."""
+        with self.flush_lock:
+            with self.lock:
+                batch, self.entries = self.entries, []
+            if not batch:
+                return 0
+            written, failed = self._write(batch)
+            if failed:
+                logger.error('Keeping %d activity entries for the next flush.', len(failed))
+                with self.lock:
+                    self.entries[:0] = failed
+            if written:
+                _invalidate(written)
+            return len(written)
+
+    def _write(self, batch: list) -> tuple[list, list]:
+        """Insert ``batch``; returns (entries written, entries to retry).
+
+        Integrity errors split the batch until the offending entries are
+        alone, and those are dropped: a row whose project is gone will
+        never insert. Other database errors fail the whole batch.
+        """
+        try:
+            with transaction.atomic():
+                ActivityLog.objects.bulk_create(batch, batch_size=1000, ignore_conflicts=True)
+        except IntegrityError:
+            if len(batch) == 1:
+                logger.exception('The database rejected an activity entry.')
+                _log_lost(batch, 'the database rejected it')
+                return [], []
+            middle = len(batch) // 2
+            written, failed = self._write(batch[:middle])
+            more_written, more_failed = self._write(batch[middle:])
+            return written + more_written, failed + more_failed
+        except DatabaseError:
+            logger.exception('Writing %d activity entries failed.', len(batch))
+            return [], batch
+        return batch, []
+
+    def _ensure_thread(self) -> None:
+        # SQLite allows one writer and fails a transaction that has to wait
+        # for it, so there the timer stays off and flushes run in the
+        # request threads.
+        if not settings.ACTIVITY_FLUSH_INTERVAL or connection.vendor == 'sqlite':
+            return
+        # Checked per add so a worker forked after the first write starts its own.
+        if self.pid == os.getpid() and self.thread is not None and self.thread.is_alive():
+            return
+        with self.lock:
+            if self.pid == os.getpid() and self.thread is not None and self.thread.is_alive():
+                return
+            self.pid = os.getpid()
+            self.stop.clear()
+            self.thread = threading.Thread(target=self._run, name='activity-flusher', daemon=True)
+            self.thread.start()
+
+    def _run(self) -> None:
+        while not self.stop.wait(settings.ACTIVITY_FLUSH_INTERVAL):
+            close_old_connections()
+            self.flush()
+
+    def shutdown(self) -> None:
+        self.stop.set()
+        self.flush()
+        with self.lock:
+            left, self.entries = self.entries, []
+        if left:
+            _log_lost(left, 'the process is exiting')
+
+
+def _invalidate(entries: list) -> None:
+    invalidate_rows(ActivityLog, [{'id': entry.id, 'project_id': entry.project_id} for entry in entries])
+
+
+def _log_lost(entries: list, reason: str) -> None:
+    """Log ``entries`` as JSON rows, one line each, so they can be loaded again."""
+    logger.critical('Dropping %d activity entries because %s.', len(entries), reason)
+    for entry in entries:
+        logger.critical('Dropped activity entry: %s', json.dumps(row_values(entry), cls=DjangoJSONEncoder))
+
+
+activity_buffer = ActivityBuffer()
+atexit.register(activity_buffer.shutdown)
+
+
+def record_activity(entries: list) -> None:
+    """Log ``entries`` once the surrounding transaction commits.
+
+    With ACTIVITY_LOG_MODE='sync' the rows are written immediately, inside
+    the caller's transaction, as before.
+    """
+    if not entries:
+        return
+    if settings.ACTIVITY_LOG_MODE == 'sync':
+        ActivityLog.objects.bulk_create(entries)
+        _invalidate(entries)
+        return
+    transaction.on_commit(lambda: activity_buffer.add(entries))
+
+
+def flush_after_response(sender, **kwargs) -> None:
+    if settings.ACTIVITY_FLUSH_AFTER_RESPONSE and activity_buffer.pending():
+        activity_buffer.flush()
+
+
+def connect_recorder_signals() -> None:
+    request_finished.connect(flush_after_response, dispatch_uid='activity-flush-after-response')
@@ -1,8 +1,10 @@
 from rest_framework import serializers
+
+from core.features.common.serializers import SparseFieldsMixin
 from .models import ActivityLog
 
 
-class ActivityLogSerializer(serializers.ModelSerializer):
+class ActivityLogSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ActivityLog
         fields = '__all__'
@@ -1,12 +1,46 @@
-from rest_framework import viewsets
+from datetime import date
 
+from django.core.handlers.wsgi import WSGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+
+from core.features.common import cache as api_cache
+from core.features.common.filters import ListFilters
+from core.features.common.pagination import ConfiguredPageNumberPagination, OptionalKeysetPagination
+from core.features.common.views import (
+    AsyncReadMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    FastListMixin,
+    SparseQuerysetMixin,
+)
+
+from core.features.projects.models import Project
+
+from .archive import ArchivedEntries, archived_months
+from .events import event_stream
 from .models import ActivityLog
 from .serializers import ActivityLogSerializer
 
 
-class ActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
+class ActivityLogViewSet(
+    CachedResponseMixin,
+    AsyncReadMixin,
+    ExportMixin,
+    SparseQuerysetMixin,
+    ConditionalGetMixin,
+    FastListMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     queryset = ActivityLog.objects.all()
     serializer_class = ActivityLogSerializer
+    pagination_class = OptionalKeysetPagination
+    cursor_ordering = ('-created_at', '-id')
+    list_filters = ListFilters(ActivityLog, ranges=['created_at'])
 
     def get_queryset(self):
         queryset = ActivityLog.objects.select_related('project').all()
@@ -14,3 +48,53 @@ class ActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
         if project_id:
             queryset = queryset.filter(project_id=project_id)
         return queryset
+
+    @action(detail=False, methods=['get'])
+    def archive(self, request):
+        """Months moved out by ``archive_activity``, or one month's entries, oldest first, with ``?month=YYYY-MM``.
+
+        Cached until the next archive run, which invalidates everything.
+        """
+        return self.cached_response(request, [api_cache.model_tag(ActivityLog)], self._archive)
+
+    def _archive(self, request):
+        month = request.query_params.get('month')
+        if not month:
+            return Response({'months': [f'{value:%Y-%m}' for value in archived_months()]})
+        try:
+            year, number = (int(part) for part in month.split('-'))
+            month = date(year, number, 1)
+        except ValueError:
+            return Response({'month': ['Use the YYYY-MM format.']}, status=status.HTTP_400_BAD_REQUEST)
+        if month not in archived_months():
+            raise NotFound(f'No archive for {month:%Y-%m}.')
+        entries = ArchivedEntries(month, request.query_params.get('project_id'))
+        paginator = ConfiguredPageNumberPagination()
+        page = paginator.paginate_queryset(entries, request, view=self)
+        return paginator.get_paginated_response(self.get_serializer(page, many=True).data)
+
+
+async def project_events(request, pk):
+    """Server-sent events for a project's new activity and approval changes.
+
+    Each event carries the row as the list endpoints render it; browsers
+    resume from the ``Last-Event-ID`` they send on reconnect. Streams stay
+    open under ASGI. Behind WSGI a held connection would pin a worker, so
+    each request sends what is new and ends, and the client's reconnect
+    polls.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=status.HTTP_403_FORBIDDEN)
+    if not await Project.objects.filter(pk=pk).aexists():
+        return JsonResponse({'detail': 'No Project matches the given query.'}, status=status.HTTP_404_NOT_FOUND)
+    last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    if isinstance(request, WSGIRequest):
+        frames = [frame async for frame in event_stream(pk, last_event_id, follow=False)]
+        response = HttpResponse(''.join(frames), content_type='text/event-stream')
+    else:
+        response = StreamingHttpResponse(event_stream(pk, last_event_id), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream.
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -22,6 +22,17 @@ class Approval(TimeStampedModel):
 
     class Meta:
         ordering = ['-requested_at']
+        indexes = [
+            models.Index(fields=['project', '-requested_at', '-id'], name='approval_project_req_idx'),
+            models.Index(fields=['status', 'project'], name='approval_status_project_idx'),
+            # The event stream tails changes per project.
+            models.Index(fields=['project', 'updated_at', 'id'], name='approval_project_updated_idx'),
+            models.Index(
+                fields=['project', '-requested_at'],
+                condition=models.Q(status='pending'),
+                name='approval_pending_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         return f'{self.project_id} · {self.entity_type} {self.entity_id}'
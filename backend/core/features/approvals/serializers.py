@@ -1,8 +1,10 @@
 from rest_framework import serializers
+
+from core.features.common.serializers import SparseFieldsMixin
 from .models import Approval
 
 
-class ApprovalSerializer(serializers.ModelSerializer):
+class ApprovalSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Approval
         fields = '__all__'
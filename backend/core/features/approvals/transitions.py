@@ -0,0 +1,161 @@
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.features.activity.models import ActivityLog
+from core.features.activity.recorder import build_entry, record_activity
+from core.features.common.signals import row_values, rows_bulk_changed
+
+from .models import Approval
+
+
+@dataclass(frozen=True)
+class Transition:
+    name: str
+    allowed_from: frozenset
+    target: str
+    action: str
+
+
+TRANSITIONS = {
+    'submit': Transition(
+        'submit',
+        frozenset({Approval.Status.APPROVED, Approval.Status.REJECTED}),
+        Approval.Status.PENDING,
+        ActivityLog.Action.SUBMIT,
+    ),
+    'approve': Transition(
+        'approve',
+        frozenset({Approval.Status.PENDING}),
+        Approval.Status.APPROVED,
+        ActivityLog.Action.APPROVE,
+    ),
+    'reject': Transition(
+        'reject',
+        frozenset({Approval.Status.PENDING}),
+        Approval.Status.REJECTED,
+        ActivityLog.Action.REJECT,
+    ),
+}
+
+
+@dataclass
+class TransitionResult:
+    id: str
+    approval: Approval | None = None
+    error: str | None = None
+    not_found: bool = False
+
+
+def _changes(transition: Transition, actor: str, note: str) -> dict:
+    now = timezone.now()
+    if transition.target == Approval.Status.PENDING:
+        return {
+            'status': transition.target,
+            'requested_by': actor,
+            'requested_at': now,
+            'reviewed_by': None,
+            'reviewed_at': None,
+            'decision_note': '',
+            'updated_at': now,
+        }
+    return {
+        'status': transition.target,
+        'reviewed_by': actor,
+        'reviewed_at': now,
+        'decision_note': note,
+        'updated_at': now,
+    }
+
+
+def _moved(approvals: dict, eligible: set, transition: Transition, changes: dict) -> set:
+    """The ``eligible`` rows the UPDATE moved, after it matched fewer than expected.
+
+    Those rows carry the transition's target status and its exact
+    ``updated_at`` stamp. The others are refreshed in ``approvals`` with
+    their current status, or removed if they were deleted meanwhile.
+    """
+    rows = Approval.objects.filter(pk__in=eligible).values_list('pk', 'status', 'updated_at')
+    current = {pk: (status, updated_at) for pk, status, updated_at in rows}
+    moved = set()
+    for pk in eligible:
+        if pk not in current:
+            del approvals[pk]
+        elif current[pk] == (transition.target, changes['updated_at']):
+            moved.add(pk)
+        else:
+            approvals[pk].status = current[pk][0]
+    return moved
+
+
+def apply_transition(
+    queryset,
+    ids: list[str],
+    transition: Transition,
+    actor: str,
+    note: str = '',
+) -> list[TransitionResult]:
+    """Move every eligible approval in ``ids`` to ``transition.target``.
+
+    The rows are locked and moved with a single conditional UPDATE in one
+    transaction. On backends without row locks another request can change a
+    row between the read and the UPDATE; the status guard then skips it, and
+    only the rows the UPDATE moved are logged and reported as moved. The
+    activity entries are handed to the activity recorder on commit. Results
+    come back in input order.
+    Ineligible or missing ids get an error and leave the others unaffected.
+    """
+    changes = _changes(transition, actor, note)
+    with transaction.atomic():
+        locked = queryset.select_related(None).select_for_update(of=('self',)).filter(pk__in=ids)
+        approvals = {approval.pk: approval for approval in locked}
+        eligible = {pk for pk, approval in approvals.items() if approval.status in transition.allowed_from}
+        if eligible:
+            updated = Approval.objects.filter(pk__in=eligible, status__in=transition.allowed_from).update(**changes)
+            if updated < len(eligible):
+                eligible = _moved(approvals, eligible, transition, changes)
+
+        moved = []
+        logs = []
+        for approval in approvals.values():
+            if approval.pk not in eligible:
+                continue
+            previous = approval.loaded_values() or row_values(approval)
+            for field, value in changes.items():
+                setattr(approval, field, value)
+            moved.append((previous, row_values(approval)))
+            approval.snapshot_loaded_values()
+            metadata = {'approval_id': approval.id, 'status': approval.status}
+            if note and transition.target != Approval.Status.PENDING:
+                metadata['note'] = note
+            logs.append(
+                build_entry(
+                    approval.project_id,
+                    actor,
+                    transition.action,
+                    approval.entity_type,
+                    approval.entity_id,
+                    metadata,
+                )
+            )
+        if logs:
+            record_activity(logs)
+            rows_bulk_changed.send(Approval, changes=moved)
+
+    results = []
+    for pk in ids:
+        approval = approvals.get(pk)
+        if approval is None:
+            results.append(TransitionResult(pk, error='Not found.', not_found=True))
+        elif pk not in eligible:
+            results.append(
+                TransitionResult(
+                    pk,
+                    approval,
+                    error=f'Cannot {transition.name} approval when status is {approval.status}.',
+                )
+            )
+        else:
+            results.append(TransitionResult(pk, approval))
+    return results
@@ -1,17 +1,45 @@
-import uuid
-from django.utils import timezone
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 
-from core.features.activity.models import ActivityLog
+from core.features.activity.audit import AuditMixin, actor_name
+from core.features.common.filters import ListFilters
+from core.features.common.pagination import OptionalKeysetPagination
+from core.features.common.views import (
+    AsyncReadMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    FastListMixin,
+    SparseQuerysetMixin,
+)
 from .models import Approval
 from .serializers import ApprovalSerializer
+from .transitions import TRANSITIONS, apply_transition
 
 
-class ApprovalViewSet(viewsets.ModelViewSet):
+class ApprovalViewSet(
+    AuditMixin,
+    CachedResponseMixin,
+    AsyncReadMixin,
+    ExportMixin,
+    SparseQuerysetMixin,
+    ConditionalGetMixin,
+    FastListMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Approval.objects.all()
     serializer_class = ApprovalSerializer
+    pagination_class = OptionalKeysetPagination
+    cursor_ordering = ('-requested_at', '-id')
+    list_filters = ListFilters(
+        Approval,
+        choices=['status'],
+        ranges=['requested_at'],
+        ordering=['requested_at'],
+    )
+    bulk_decide_max_ids = 1000
 
     def get_queryset(self):
         queryset = Approval.objects.select_related('project').all()
@@ -20,93 +48,59 @@ class ApprovalViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(project_id=project_id)
         return queryset
 
-    def _actor_name(self, request) -> str:
-        if request.user and request.user.is_authenticated:
-            return request.user.get_username()
-        return 'System'
-
-    def _log_activity(self, approval: Approval, action: str, note: str | None = None) -> None:
-        metadata = {
-            'approval_id': approval.id,
-            'status': approval.status,
-        }
-        if note:
-            metadata['note'] = note
-        ActivityLog.objects.create(
-            id=uuid.uuid4().hex,
-            project=approval.project,
-            actor=self._actor_name(self.request),
-            action=action,
-            entity_type=approval.entity_type,
-            entity_id=approval.entity_id,
-            metadata=metadata,
+    def _transition(self, request, pk, name: str) -> Response:
+        note = request.data.get('decision_note', '') if name != 'submit' else ''
+        [result] = apply_transition(
+            self.get_queryset(), [pk], TRANSITIONS[name], actor_name(request), note
         )
-
-    def _reject_transition(self, approval: Approval, allowed: set[str], action_name: str) -> Response | None:
-        if approval.status not in allowed:
-            return Response(
-                {'detail': f'Cannot {action_name} approval when status is {approval.status}.'},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        return None
+        if result.not_found:
+            raise NotFound()
+        if result.error:
+            return Response({'detail': result.error}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(self.get_serializer(result.approval).data)
 
     @action(detail=True, methods=['post'])
     def submit(self, request, pk=None):
-        approval = self.get_object()
-        invalid = self._reject_transition(
-            approval,
-            {Approval.Status.APPROVED, Approval.Status.REJECTED},
-            'submit',
-        )
-        if invalid:
-            return invalid
-        approval.status = Approval.Status.PENDING
-        if hasattr(approval, 'requested_by'):
-            approval.requested_by = self._actor_name(request)
-        if hasattr(approval, 'requested_at'):
-            approval.requested_at = timezone.now()
-        if hasattr(approval, 'reviewed_by'):
-            approval.reviewed_by = None
-        if hasattr(approval, 'reviewed_at'):
-            approval.reviewed_at = None
-        if hasattr(approval, 'decision_note'):
-            approval.decision_note = ''
-        approval.save()
-        self._log_activity(approval, ActivityLog.Action.SUBMIT)
-        return Response(self.get_serializer(approval).data)
+        return self._transition(request, pk, 'submit')
 
     @action(detail=True, methods=['post'])
     def approve(self, request, pk=None):
-        approval = self.get_object()
-        invalid = self._reject_transition(approval, {Approval.Status.PENDING}, 'approve')
-        if invalid:
-            return invalid
-        approval.status = Approval.Status.APPROVED
-        if hasattr(approval, 'reviewed_by'):
-            approval.reviewed_by = self._actor_name(request)
-        if hasattr(approval, 'reviewed_at'):
-            approval.reviewed_at = timezone.now()
-        decision_note = request.data.get('decision_note', '')
-        if hasattr(approval, 'decision_note'):
-            approval.decision_note = decision_note
-        approval.save()
-        self._log_activity(approval, ActivityLog.Action.APPROVE, decision_note or None)
-        return Response(self.get_serializer(approval).data)
+        return self._transition(request, pk, 'approve')
 
     @action(detail=True, methods=['post'])
     def reject(self, request, pk=None):
-        approval = self.get_object()
-        invalid = self._reject_transition(approval, {Approval.Status.PENDING}, 'reject')
-        if invalid:
-            return invalid
-        approval.status = Approval.Status.REJECTED
-        if hasattr(approval, 'reviewed_by'):
-            approval.reviewed_by = self._actor_name(request)
-        if hasattr(approval, 'reviewed_at'):
-            approval.reviewed_at = timezone.now()
-        decision_note = request.data.get('decision_note', '')
-        if hasattr(approval, 'decision_note'):
-            approval.decision_note = decision_note
-        approval.save()
-        self._log_activity(approval, ActivityLog.Action.REJECT, decision_note or None)
-        return Response(self.get_serializer(approval).data)
+        return self._transition(request, pk, 'reject')
+
+    @action(detail=False, methods=['post'], url_path='bulk-decide')
+    def bulk_decide(self, request):
+        decision = request.data.get('decision')
+        ids = request.data.get('ids')
+        if decision not in ('approve', 'reject'):
+            return Response(
+                {'decision': ['Must be "approve" or "reject".']},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not isinstance(ids, list) or not ids or not all(isinstance(pk, str) for pk in ids):
+            return Response({'ids': ['Provide a non-empty list of ids.']}, status=status.HTTP_400_BAD_REQUEST)
+        if len(ids) > self.bulk_decide_max_ids:
+            return Response(
+                {'ids': [f'Ensure this field has no more than {self.bulk_decide_max_ids} elements.']},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(set(ids)) < len(ids):
+            return Response({'ids': ['Duplicate id in this batch.']}, status=status.HTTP_400_BAD_REQUEST)
+
+        results = apply_transition(
+            self.get_queryset(),
+            ids,
+            TRANSITIONS[decision],
+            actor_name(request),
+            request.data.get('decision_note', ''),
+        )
+        payload = []
+        for result in results:
+            if result.error:
+                payload.append({'id': result.id, 'ok': False, 'detail': result.error})
+            else:
+                payload.append({'id': result.id, 'ok': True, 'status': result.approval.status})
+        return Response({'results': payload})
@@ -0,0 +1,168 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import groupby
+
+from django.db import transaction
+from django.db.models import Max
+
+from core.features.budgets.models import BudgetItem
+from core.features.common import cache as api_cache
+from core.features.projects.models import Project
+
+from .models import BudgetSnapshot
+
+MONEY_FIELDS = ('original_budget', 'approved_variations', 'forecast_cost', 'actual_spent')
+# Longest run of delta rows between two keyframes of a project.
+KEYFRAME_DAYS = 30
+CAPTURE_BATCH_SIZE = 500
+
+
+def _cents(value: Decimal) -> int:
+    return int(value * 100)
+
+
+def _apply(state: dict, keyframe: bool, items: dict) -> dict:
+    """``state`` advanced by one row's items; keyframes replace it."""
+    if keyframe:
+        return dict(items)
+    for item_id, values in items.items():
+        if values is None:
+            state.pop(item_id, None)
+        else:
+            state[item_id] = values
+    return state
+
+
+def _replay_rows(project_id: str, until: date, since: date | None = None):
+    """Rows to replay for ``project_id``'s line values on ``until`` (and from ``since``).
+
+    Starts at the last keyframe on or before ``since``, or ``until`` when
+    there is no ``since``; yields (day, keyframe, items) in day order.
+    """
+    rows = BudgetSnapshot.objects.filter(project_id=project_id)
+    start = (
+        rows.filter(keyframe=True, day__lte=since or until)
+        .order_by('-day')
+        .values_list('day', flat=True)
+        .first()
+    )
+    if start is None:
+        # Nothing on or before ``since``: the series starts later, at a keyframe.
+        start = since or until
+    return rows.filter(day__gte=start, day__lte=until).order_by('day').values_list('day', 'keyframe', 'items')
+
+
+def line_state(project_id: str, day: date) -> tuple[dict | None, date | None]:
+    """(line values on ``day`` keyed by id, day of the keyframe they replay from), or (None, None)."""
+    state = None
+    keyframe_day = None
+    for row_day, keyframe, items in _replay_rows(project_id, day):
+        if keyframe:
+            keyframe_day = row_day
+        state = _apply(state or {}, keyframe, items)
+    return state, keyframe_day
+
+
+@transaction.atomic
+def capture_snapshots(day: date) -> dict:
+    """Append ``day``'s snapshot for every project and the portfolio.
+
+    Projects that already have a row for ``day``, or a later one, are
+    skipped: rows are never rewritten and deltas only build forwards.
+    Returns counts of rows written, lines recorded and projects skipped.
+    """
+    existing = dict(
+        BudgetSnapshot.objects.filter(project__isnull=False)
+        .values('project_id')
+        .annotate(latest=Max('day'))
+        .values_list('project_id', 'latest')
+    )
+    lines = (
+        BudgetItem.objects.order_by('project_id', 'id')
+        .values_list('project_id', 'id', *MONEY_FIELDS)
+        .iterator(chunk_size=5000)
+    )
+    by_project = {project_id: list(rows) for project_id, rows in groupby(lines, key=lambda row: row[0])}
+
+    portfolio = {name: Decimal('0') for name in MONEY_FIELDS}
+    portfolio_lines = 0
+    snapshots = []
+    recorded = skipped = written = 0
+    for project_id in Project.objects.order_by('id').values_list('id', flat=True):
+        rows = by_project.get(project_id, [])
+        totals = {name: sum((row[2 + index] for row in rows), Decimal('0')) for index, name in enumerate(MONEY_FIELDS)}
+        for name in MONEY_FIELDS:
+            portfolio[name] += totals[name]
+        portfolio_lines += len(rows)
+        if project_id in existing and existing[project_id] >= day:
+            skipped += 1
+            continue
+
+        current = {row[1]: [_cents(row[4]), _cents(row[5])] for row in rows}
+        previous, keyframe_day = line_state(project_id, day - timedelta(days=1))
+        keyframe = previous is None or (day - keyframe_day).days >= KEYFRAME_DAYS
+        if keyframe:
+            items = current
+        else:
+            items = {item_id: values for item_id, values in current.items() if previous.get(item_id) != values}
+            items.update({item_id: None for item_id in previous.keys() - current.keys()})
+        snapshots.append(
+            BudgetSnapshot(project_id=project_id, day=day, lines=len(rows), keyframe=keyframe, items=items, **totals)
+        )
+        recorded += len(items)
+        if len(snapshots) >= CAPTURE_BATCH_SIZE:
+            written += len(BudgetSnapshot.objects.bulk_create(snapshots))
+            snapshots = []
+    if not BudgetSnapshot.objects.filter(project__isnull=True, day=day).exists():
+        snapshots.append(BudgetSnapshot(project=None, day=day, lines=portfolio_lines, **portfolio))
+    written += len(BudgetSnapshot.objects.bulk_create(snapshots))
+    api_cache.invalidate([api_cache.model_tag(BudgetSnapshot)])
+    return {'rows': written, 'lines': recorded, 'skipped': skipped}
+
+
+def downsample(samples: list[tuple], start: date, end: date, points: int) -> tuple[list[tuple], int]:
+    """At most ``points`` samples from day-ordered (day, ...) tuples, and the bucket width in days.
+
+    The range is cut into equal buckets of whole days and each keeps its
+    last sample, the value as of the bucket's end, so every returned
+    point is a real snapshot rather than an average.
+    """
+    width = max(1, -(-((end - start).days + 1) // points))
+    if width == 1:
+        return samples, 1
+    kept = {}
+    for sample in samples:
+        kept[(sample[0] - start).days // width] = sample
+    return list(kept.values()), width
+
+
+def totals_series(project_id: str | None, start: date, end: date) -> list[tuple]:
+    """(day, lines, *money) for a project, or the portfolio, between ``start`` and ``end``.
+
+    One range scan of the (project, day) unique index; the items column
+    is never read.
+    """
+    return list(
+        BudgetSnapshot.objects.filter(project_id=project_id, day__gte=start, day__lte=end)
+        .order_by('day')
+        .values_list('day', 'lines', *MONEY_FIELDS)
+    )
+
+
+def line_series(project_id: str, item_id: str, start: date, end: date) -> list[tuple]:
+    """(day, forecast, actual) of one budget line on each snapshot day between ``start`` and ``end``.
+
+    Replays from the last keyframe before ``start``. Days the line did not
+    exist have None values.
+    """
+    samples = []
+    value = None
+    for day, keyframe, items in _replay_rows(project_id, end, since=start):
+        if keyframe:
+            value = items.get(item_id)
+        elif item_id in items:
+            value = items[item_id]
+        if day >= start:
+            forecast, actual = value if value is not None else (None, None)
+            samples.append((day, forecast, actual))
+    return samples
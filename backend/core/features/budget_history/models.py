@@ -0,0 +1,55 @@
+from django.db import models
+
+from core.features.projects.models import Project
+
+
+class BudgetSnapshot(models.Model):
+    """Budget totals of one project, or of the portfolio, on one day.
+
+    Rows are only ever appended. ``items`` holds each line's forecast and
+    actual in cents as ``{id: [forecast, actual]}``, delta encoded: a
+    keyframe row lists every line, the rows after it only the lines that
+    changed, with null for a line that was removed. A keyframe is written
+    at least every ``history.KEYFRAME_DAYS`` days, so reading a line's
+    value never replays more than that many rows. Portfolio rows have no
+    project and no items.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    project = models.ForeignKey(
+        Project,
+        related_name='budget_snapshots',
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+    )
+    day = models.DateField()
+    lines = models.PositiveIntegerField(default=0)
+    original_budget = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    approved_variations = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    forecast_cost = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    actual_spent = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    keyframe = models.BooleanField(default=False)
+    items = models.JSONField(default=dict, blank=True)
+    captured_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['day']
+        constraints = [
+            models.UniqueConstraint(fields=['project', 'day'], name='budget_snapshot_unique'),
+            models.UniqueConstraint(
+                fields=['day'],
+                condition=models.Q(project__isnull=True),
+                name='budget_snapshot_portfolio_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['project', 'day'],
+                condition=models.Q(keyframe=True),
+                name='budget_snapshot_keyframe_idx',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.project_id or "portfolio"} · {self.day}'
@@ -27,6 +27,11 @@ class BudgetItem(TimeStampedModel):
 
     class Meta:
         ordering = ['category']
+        indexes = [
+            models.Index(fields=['project', 'category'], name='budget_project_category_idx'),
+            models.Index(fields=['project', 'forecast_cost'], name='budget_project_forecast_idx'),
+            models.Index(fields=['status', 'project'], name='budget_status_project_idx'),
+        ]
 
     def __str__(self) -> str:
         return f'{self.project_id} · {self.category}'
@@ -1,8 +1,11 @@
 from rest_framework import serializers
+
+from core.features.common.serializers import BulkListSerializer, BulkModelSerializer, SparseFieldsMixin
+
 from .models import BudgetItem
 
 
-class BudgetItemSerializer(serializers.ModelSerializer):
+class BudgetItemSerializer(SparseFieldsMixin, BulkModelSerializer):
     def validate(self, attrs):
         fields = ['original_budget', 'approved_variations', 'forecast_cost', 'actual_spent']
         for field in fields:
@@ -14,3 +17,4 @@ class BudgetItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = BudgetItem
         fields = '__all__'
+        list_serializer_class = BulkListSerializer
@@ -1,12 +1,83 @@
-from rest_framework import viewsets
+from datetime import date, timedelta
 
+from django.utils import timezone
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from core.features.activity.audit import AuditMixin
+from core.features.budget_history.history import MONEY_FIELDS, downsample, line_series, totals_series
+from core.features.budget_history.models import BudgetSnapshot
+from core.features.common import cache as api_cache
+from core.features.common.filters import ListFilters
+from core.features.common.views import (
+    AsyncReadMixin,
+    BulkWriteMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    FastListMixin,
+    SparseQuerysetMixin,
+)
+from core.features.projects.models import Project
+
+from .analytics import DIMENSIONS, budget_analytics
 from .models import BudgetItem
 from .serializers import BudgetItemSerializer
 
+HISTORY_DEFAULT_DAYS = 365
+HISTORY_DEFAULT_POINTS = 200
+HISTORY_MAX_POINTS = 2000
+
+
+def _history_window(params) -> tuple[tuple[date, date, int] | None, dict]:
+    """(start, end, points) from ``?start=&end=&points=``, or None and the errors."""
+    errors = {}
+    values = {}
+    for name in ('start', 'end'):
+        raw = params.get(name)
+        try:
+            values[name] = date.fromisoformat(raw) if raw else None
+        except ValueError:
+            errors[name] = ['Use the YYYY-MM-DD format.']
+    try:
+        points = int(params.get('points', HISTORY_DEFAULT_POINTS))
+        if not 1 <= points <= HISTORY_MAX_POINTS:
+            raise ValueError
+    except ValueError:
+        errors['points'] = [f'Must be a whole number from 1 to {HISTORY_MAX_POINTS}.']
+    if errors:
+        return None, errors
+    end = values['end'] or timezone.localdate()
+    start = values['start'] or end - timedelta(days=HISTORY_DEFAULT_DAYS - 1)
+    if start > end:
+        return None, {'start': ['Must not be after end.']}
+    return (start, end, points), {}
 
-class BudgetItemViewSet(viewsets.ModelViewSet):
+
+def _cents(value: int | None) -> float | None:
+    return None if value is None else value / 100
+
+
+class BudgetItemViewSet(
+    AuditMixin,
+    CachedResponseMixin,
+    AsyncReadMixin,
+    BulkWriteMixin,
+    ExportMixin,
+    SparseQuerysetMixin,
+    ConditionalGetMixin,
+    FastListMixin,
+    viewsets.ModelViewSet,
+):
     queryset = BudgetItem.objects.all()
     serializer_class = BudgetItemSerializer
+    list_filters = ListFilters(
+        BudgetItem,
+        choices=['status'],
+        ranges=['forecast_cost'],
+        ordering=['category', 'forecast_cost'],
+    )
 
     def get_queryset(self):
         queryset = BudgetItem.objects.select_related('project').all()
@@ -14,3 +85,86 @@ class BudgetItemViewSet(viewsets.ModelViewSet):
         if project_id:
             queryset = queryset.filter(project_id=project_id)
         return queryset
+
+    @action(detail=False, methods=['get'])
+    def analytics(self, request):
+        """Variance, burn rate and forecast at completion per project, category and cost code.
+
+        Honours ``?project_id=`` and the list filters; ``?group_by=`` picks
+        dimensions (default: all). Cached until a budget line of the scope,
+        or a project's schedule, changes.
+        """
+        dimensions = [value for value in request.query_params.get('group_by', '').split(',') if value]
+        unknown = sorted(set(dimensions) - set(DIMENSIONS))
+        if unknown:
+            return Response(
+                {'group_by': [f'Unknown dimension(s): {", ".join(unknown)}. Choose from: {", ".join(DIMENSIONS)}.']},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        project_id = request.query_params.get('project_id') or None
+        project = api_cache.row_tag(Project, project_id) if project_id else api_cache.model_tag(Project)
+        tags = [*self.list_cache_tags(request), project]
+        return self.cached_response(request, tags, self._analytics, dimensions or list(DIMENSIONS))
+
+    def _analytics(self, request, dimensions: list[str]):
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(budget_analytics(queryset, dimensions, timezone.localdate()))
+
+    @action(detail=False, methods=['get'])
+    def history(self, request):
+        """Daily budget totals of ``?project_id=``, or of the portfolio, from captured snapshots.
+
+        ``?start=`` and ``?end=`` bound the range (default: the last year)
+        and ``?points=`` caps the series; longer ranges keep the last
+        snapshot of each equal run of days. Cached until the next capture.
+        """
+        window, errors = _history_window(request.query_params)
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        return self.cached_response(request, [api_cache.model_tag(BudgetSnapshot)], self._history, *window)
+
+    def _history(self, request, start: date, end: date, points: int):
+        project_id = request.query_params.get('project_id') or None
+        samples, resolution = downsample(totals_series(project_id, start, end), start, end, points)
+        return Response(
+            {
+                'project_id': project_id,
+                'start': start,
+                'end': end,
+                'resolution_days': resolution,
+                'series': [
+                    {
+                        'day': day,
+                        'lines': lines,
+                        **{name: float(value) for name, value in zip(MONEY_FIELDS, money)},
+                    }
+                    for day, lines, *money in samples
+                ],
+            }
+        )
+
+    @action(detail=True, methods=['get'], url_path='history')
+    def line_history(self, request, pk=None):
+        """This line's forecast and actual on each snapshot day, downsampled like ``history``."""
+        window, errors = _history_window(request.query_params)
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        tags = [api_cache.model_tag(BudgetSnapshot), api_cache.row_tag(BudgetItem, pk)]
+        return self.cached_response(request, tags, self._line_history, *window)
+
+    def _line_history(self, request, start: date, end: date, points: int):
+        item = self.get_object()
+        samples, resolution = downsample(line_series(item.project_id, item.pk, start, end), start, end, points)
+        return Response(
+            {
+                'id': item.pk,
+                'project_id': item.project_id,
+                'start': start,
+                'end': end,
+                'resolution_days': resolution,
+                'series': [
+                    {'day': day, 'forecast_cost': _cents(forecast), 'actual_spent': _cents(actual)}
+                    for day, forecast, actual in samples
+                ],
+            }
+        )
@@ -0,0 +1,72 @@
+from functools import update_wrapper
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import SynchronousOnlyOperation
+from django.urls import URLPattern
+
+
+def async_read_view(view):
+    """Wrap a DRF view so GETs run its ``async_<action>`` handler when it has one.
+
+    DRF dispatches synchronously, which under ASGI means a thread per
+    request. The wrapper resolves the user through the async session API,
+    runs DRF's authentication, permission and negotiation steps (none of
+    which query with session auth once the user is loaded), then awaits
+    the handler. A handler returning None, or any other method, falls back
+    to the regular view in a worker thread. Off unless ASYNC_READ_VIEWS.
+    """
+    actions = getattr(view, 'actions', None)
+    action_name = actions.get('get') if actions else 'get'
+    if not settings.ASYNC_READ_VIEWS or not hasattr(view.cls, f'async_{action_name}'):
+        return view
+    sync_view = sync_to_async(view)
+
+    async def wrapped(request, *args, **kwargs):
+        if request.method == 'GET':
+            response = await _dispatch(view, request, args, kwargs)
+            if response is not None:
+                return response
+        return await sync_view(request, *args, **kwargs)
+
+    # Keeps csrf_exempt, cls, initkwargs and actions for the router and tooling.
+    update_wrapper(wrapped, view)
+    return wrapped
+
+
+async def _dispatch(view, request, args, kwargs):
+    request.user = await request.auser()
+    self = view.cls(**view.initkwargs)
+    actions = getattr(view, 'actions', None)
+    if actions:
+        self.action_map = actions
+        for method, action_name in actions.items():
+            setattr(self, method, getattr(self, action_name))
+    self.args = args
+    self.kwargs = kwargs
+    self.headers = self.default_response_headers
+    drf_request = self.initialize_request(request, *args, **kwargs)
+    self.request = drf_request
+    handler = getattr(self, f'async_{self.action if actions else "get"}')
+    try:
+        self.initial(drf_request, *args, **kwargs)
+        response = await handler(drf_request, *args, **kwargs)
+    except SynchronousOnlyOperation:
+        return None
+    except Exception as exc:
+        response = self.handle_exception(exc)
+    if response is None:
+        return None
+    return self.finalize_response(drf_request, response, *args, **kwargs)
+
+
+def async_read_urls(patterns: list) -> list:
+    """``async_read_view`` applied to every view in ``patterns`` (e.g. ``router.urls``)."""
+    if not settings.ASYNC_READ_VIEWS:
+        return patterns
+    wrapped = []
+    for pattern in patterns:
+        if isinstance(pattern, URLPattern):
+            pattern = URLPattern(pattern.pattern, async_read_view(pattern.callback), pattern.default_args, pattern.name)
+        wrapped.append(pattern)
+    return wrapped
@@ -0,0 +1,61 @@
+import statistics
+import time
+from datetime import date
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from core.features.projects.models import Project
+
+
+def benchmark_client() -> APIClient:
+    """An in-process API client authenticated as an unsaved benchmark user."""
+    host = next((host.lstrip('.') for host in settings.ALLOWED_HOSTS if host != '*'), 'localhost')
+    client = APIClient(SERVER_NAME=host)
+    client.force_authenticate(get_user_model()(username='benchmark'))
+    return client
+
+
+def ensure_project(project_id: str, **fields) -> Project:
+    defaults = {
+        'name': f'Benchmark {project_id}',
+        'location': 'Benchmark',
+        'status': Project.Status.ACTIVE,
+        'start_date': date(2025, 1, 1),
+        'end_date': date(2027, 1, 1),
+        'program_name': 'Benchmark',
+    }
+    defaults.update(fields)
+    project, _ = Project.objects.update_or_create(id=project_id, defaults=defaults)
+    return project
+
+
+def drop_projects(queryset) -> None:
+    """Delete benchmark projects and resync the program summary.
+
+    Seeding uses raw bulk_create, which bypasses the summary write hooks, so
+    the cascade delete would otherwise subtract rows that were never added.
+    """
+    from core.features.projects.summary import rebuild_summary
+
+    queryset.delete()
+    rebuild_summary()
+
+
+def timed(func, *args, **kwargs) -> tuple[float, object]:
+    """Run ``func`` once and return (elapsed milliseconds, result)."""
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return (time.perf_counter() - started) * 1000, result
+
+
+def percentiles(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    if not ordered:
+        return {'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+    return {
+        'p50': statistics.median(ordered),
+        'p95': ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))],
+        'max': ordered[-1],
+    }
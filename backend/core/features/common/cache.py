@@ -0,0 +1,176 @@
+import hashlib
+import threading
+import time
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save
+
+from .signals import in_bulk_write, row_values, rows_bulk_changed
+
+# Every cached response carries this tag, so bumping it drops them all.
+ALL_TAG = '*'
+TAG_PREFIX = 'api-tag:'
+ENTRY_PREFIX = 'api-response:'
+
+_lock = threading.Lock()
+_stats = {}
+_cached_models = set()
+
+
+def model_tag(model, project_id=None) -> str:
+    """Lists of ``model``, optionally narrowed to one project."""
+    name = model._meta.model_name
+    return name if project_id is None else f'{name}:{project_id}'
+
+
+def row_tag(model, pk) -> str:
+    return f'{model._meta.model_name}#{pk}'
+
+
+def project_tag(project_id) -> str:
+    """Anything that reads across one project's rows, like the workspace bundle."""
+    return f'project:{project_id}'
+
+
+def row_tags(model, row: dict) -> set[str]:
+    """Tags a change to ``row`` (column values keyed by attname) invalidates."""
+    pk = row[model._meta.pk.attname]
+    project_id = pk if model._meta.model_name == 'project' else row.get('project_id')
+    return {
+        model_tag(model),
+        model_tag(model, project_id),
+        row_tag(model, pk),
+        project_tag(project_id),
+    }
+
+
+def _tag_key(tag: str) -> str:
+    return f'{TAG_PREFIX}{tag}'
+
+
+def _new_version() -> int:
+    # Never reuse a number: an evicted tag must not revive old entries.
+    return time.time_ns()
+
+
+def tag_versions(tags: list[str]) -> dict:
+    """Current version of each tag, creating the ones the cache has lost."""
+    keys = {_tag_key(tag): tag for tag in tags}
+    found = cache.get_many(list(keys))
+    versions = {tag: found.get(key) for key, tag in keys.items()}
+    for tag, version in versions.items():
+        if version is None:
+            cache.add(_tag_key(tag), _new_version(), None)
+            versions[tag] = cache.get(_tag_key(tag))
+    return versions
+
+
+def bump_tags(tags) -> None:
+    for tag in tags:
+        try:
+            cache.incr(_tag_key(tag))
+        except ValueError:
+            cache.set(_tag_key(tag), _new_version(), None)
+
+
+def invalidate(tags) -> None:
+    """Bump ``tags`` once the surrounding transaction commits."""
+    tags = set(tags)
+    if tags:
+        transaction.on_commit(lambda: bump_tags(tags))
+
+
+def invalidate_rows(model, rows) -> None:
+    tags = set()
+    for row in rows:
+        tags |= row_tags(model, row)
+    invalidate(tags)
+
+
+def invalidate_all() -> None:
+    invalidate([ALL_TAG])
+
+
+def entry_key(request, scope: str) -> str:
+    params = urlencode(sorted(request.query_params.lists()), doseq=True)
+    raw = '|'.join([scope, request.path, params, request.accepted_renderer.format])
+    return ENTRY_PREFIX + hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+
+
+def lookup(key: str, tags: list[str]):
+    """Return (entry or None, current tag versions) in one cache round trip."""
+    tag_keys = [_tag_key(tag) for tag in tags]
+    found = cache.get_many([key, *tag_keys])
+    versions = {tag: found.get(tag_key) for tag, tag_key in zip(tags, tag_keys)}
+    if any(version is None for version in versions.values()):
+        return None, tag_versions(tags)
+    entry = found.get(key)
+    if entry is None or entry['versions'] != versions:
+        return None, versions
+    return entry, versions
+
+
+def record(namespace: str, event: str) -> None:
+    with _lock:
+        counters = _stats.setdefault(namespace, {'hits': 0, 'misses': 0, 'stores': 0})
+        counters[event] += 1
+
+
+def reset_stats() -> None:
+    with _lock:
+        _stats.clear()
+
+
+def stats_report() -> list[dict]:
+    """Hit rate per namespace for this worker process."""
+    with _lock:
+        snapshot = {namespace: dict(counters) for namespace, counters in _stats.items()}
+    report = []
+    for namespace, counters in sorted(snapshot.items()):
+        lookups = counters['hits'] + counters['misses']
+        report.append(
+            {
+                'namespace': namespace,
+                **counters,
+                'hit_rate': round(counters['hits'] / lookups, 4) if lookups else None,
+            }
+        )
+    return report
+
+
+def invalidate_deleted(model, rows) -> None:
+    # Deleting a project cascades into every other table.
+    if model._meta.model_name == 'project':
+        invalidate_all()
+    else:
+        invalidate_rows(model, rows)
+
+
+def _row_saved(sender, instance, **kwargs):
+    if in_bulk_write(sender):
+        return
+    rows = [row_values(instance)]
+    loaded = instance.loaded_values()
+    if loaded is not None:
+        # A row moved to another project leaves the old project's lists too.
+        rows.append(loaded)
+    invalidate_rows(sender, rows)
+
+
+def _rows_bulk_changed(sender, changes, **kwargs):
+    if sender in _cached_models:
+        invalidate_rows(sender, [row for pair in changes for row in pair if row is not None])
+
+
+def connect_cache_signals(models) -> None:
+    """Invalidate on saves and bulk writes of ``models``.
+
+    Deletes are invalidated by the viewset and admin hooks rather than a
+    ``post_delete`` receiver, which would turn cascades into per-row loads.
+    """
+    _cached_models.update(models)
+    for model in models:
+        post_save.connect(_row_saved, sender=model, dispatch_uid=f'api-cache-{model._meta.model_name}')
+    rows_bulk_changed.connect(_rows_bulk_changed, dispatch_uid='api-cache-bulk')
@@ -0,0 +1,75 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+ROWS_PER_WRITE = 500
+
+
+class _StreamRenderer(BaseRenderer):
+    """Negotiates an export format. Rows are streamed by the view, so only
+    error payloads ever pass through ``render``."""
+
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return json.dumps(data, cls=DjangoJSONEncoder).encode()
+
+
+class CSVRenderer(_StreamRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
+
+
+class NDJSONRenderer(_StreamRenderer):
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+_encoder = DjangoJSONEncoder()
+
+
+def _csv_cell(value):
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, cls=DjangoJSONEncoder)
+    return _encoder.default(value)
+
+
+def _batched(lines):
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= ROWS_PER_WRITE:
+            yield ''.join(buffer)
+            buffer = []
+    if buffer:
+        yield ''.join(buffer)
+
+
+def stream_csv(columns: list[str], rows):
+    """Yield CSV text for an iterable of value tuples, header first."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns)
+    yield from _batched(writer.writerow([_csv_cell(value) for value in row]) for row in rows)
+
+
+def stream_ndjson(columns: list[str], rows):
+    """Yield one JSON object per line for an iterable of value tuples."""
+    encoder = DjangoJSONEncoder(separators=(',', ':'))
+    yield from _batched(encoder.encode(dict(zip(columns, row))) + '\n' for row in rows)
+
+
+STREAMERS = {
+    CSVRenderer.format: (stream_csv, 'csv'),
+    NDJSONRenderer.format: (stream_ndjson, 'ndjson'),
+}
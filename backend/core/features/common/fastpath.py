@@ -0,0 +1,167 @@
+import decimal
+
+import numpy as np
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+# DRF field classes whose to_representation returns a DB value unchanged.
+IDENTITY_FIELDS = (
+    serializers.CharField,
+    serializers.URLField,
+    serializers.EmailField,
+    serializers.SlugField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+)
+
+_compiled = {}
+
+
+def _decimal_encoder(field):
+    if (
+        field.localize
+        or field.normalize_output
+        or not getattr(field, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING)
+    ):
+        return field.to_representation
+    if field.decimal_places is None:
+        return lambda value: f'{value:f}'
+    exponent = decimal.Decimal('.1') ** field.decimal_places
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+    rounding = field.rounding
+
+    def encode(value):
+        return f'{value.quantize(exponent, rounding=rounding, context=context):f}'
+
+    return encode
+
+
+def _datetime_encoder(field):
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+    field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+    if field_timezone is None:
+        return field.to_representation
+
+    def encode(value):
+        if timezone.is_naive(value):
+            return field.to_representation(value)
+        text = value.astimezone(field_timezone).isoformat()
+        return text[:-6] + 'Z' if text.endswith('+00:00') else text
+
+    return encode
+
+
+def _date_encoder(field):
+    output_format = getattr(field, 'format', api_settings.DATE_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+    return lambda value: value.isoformat()
+
+
+def _column_encoder(field, model):
+    """Return (attname, encoder) for a field backed by one column, else None.
+
+    ``encoder`` is None when the DB value is already the API value.
+    """
+    source = field.source
+    try:
+        model_field = model._meta.get_field(source)
+    except FieldDoesNotExist:
+        return None
+    if not model_field.concrete or getattr(field, 'child_relation', None) is not None:
+        return None
+
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        if field.pk_field is not None:
+            return None
+        return model_field.attname, None
+    if type(field) in IDENTITY_FIELDS:
+        return model_field.attname, None
+    if type(field) is serializers.JSONField:
+        return (model_field.attname, None) if not field.binary else None
+    if type(field) is serializers.DecimalField:
+        return model_field.attname, _decimal_encoder(field)
+    if type(field) is serializers.DateTimeField:
+        return model_field.attname, _datetime_encoder(field)
+    if type(field) is serializers.DateField:
+        return model_field.attname, _date_encoder(field)
+    return None
+
+
+def compile_row_encoder(serializer):
+    """Precompile a tuple -> dict encoder equivalent to ``serializer.to_representation``.
+
+    Returns ``(columns, encode)`` where ``columns`` are the attnames to pass to
+    ``values_list()``, or None if any field needs a model instance, in which
+    case callers fall back to the regular serializer. Output matches DRF value
+    for value, so the rendered JSON is byte-identical.
+    """
+    model = serializer.Meta.model
+    names = tuple(serializer.fields)
+    key = (type(serializer), names, timezone.get_current_timezone_name() if settings.USE_TZ else None)
+    if key in _compiled:
+        return _compiled[key]
+
+    columns = []
+    encoders = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        compiled = _column_encoder(field, model)
+        if compiled is None:
+            _compiled[key] = None
+            return None
+        columns.append(compiled[0])
+        encoders.append((name, compiled[1]))
+
+    plain = [(index, name) for index, (name, encoder) in enumerate(encoders) if encoder is None]
+    converted = [(index, name, encoder) for index, (name, encoder) in enumerate(encoders) if encoder]
+    field_names = [name for name, _ in encoders]
+
+    def encode(row):
+        data = dict.fromkeys(field_names)
+        for index, name in plain:
+            data[name] = row[index]
+        for index, name, encoder in converted:
+            value = row[index]
+            if value is not None:
+                data[name] = encoder(value)
+        return data
+
+    _compiled[key] = (columns, encode)
+    return _compiled[key]
+
+
+def fetch_columns(queryset) -> list[tuple]:
+    """The rows of a ``values_list`` queryset as column tuples.
+
+    Executes the compiled SQL directly: for numeric and text columns the
+    ORM's per-row converters would cost more than the NumPy work done on
+    them. Dates come back as the driver returns them, ISO strings on
+    SQLite, which ``datetime64`` arrays parse either way.
+    """
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(sql, params)
+        return list(zip(*cursor.fetchall()))
+
+
+def fetch_records(queryset, dtype: list[tuple[str, str]]):
+    """The rows of a ``values_list`` queryset as a NumPy structured array of ``dtype``.
+
+    Like ``fetch_columns``, but NumPy converts the row tuples straight into
+    fixed-width fields, skipping the transpose and the per-column copies.
+    """
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(sql, params)
+        return np.array(cursor.fetchall(), dtype=dtype)
@@ -0,0 +1,198 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connection, models
+from django.utils import timezone as django_timezone
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from .pagination import OptionalKeysetPagination
+
+ORDERING_PARAM = 'ordering'
+# How an index serves a field: on its own, or only within one project.
+GLOBAL = 'global'
+PER_PROJECT = 'project'
+# Seconds a table's row estimate is reused before it is read again.
+ESTIMATE_TTL = 300
+
+_estimates: dict[str, tuple[float, int]] = {}
+
+
+def index_coverage(model, name: str) -> str | None:
+    """GLOBAL if an index leads with ``name``, PER_PROJECT if one leads with (project, name), else None.
+
+    Partial indexes are ignored, since they only serve queries that repeat
+    their condition.
+    """
+    field = model._meta.get_field(name)
+    if field.primary_key or field.unique or field.db_index:
+        return GLOBAL
+    coverage = None
+    for index in model._meta.indexes:
+        if index.condition is not None or not index.fields:
+            continue
+        columns = [column.lstrip('-') for column in index.fields]
+        if columns[0] == name:
+            return GLOBAL
+        if columns[:2] == ['project', name]:
+            coverage = PER_PROJECT
+    return coverage
+
+
+def estimated_rows(model) -> int:
+    """Roughly how many rows ``model``'s table holds, cached for ESTIMATE_TTL seconds.
+
+    PostgreSQL answers from planner statistics, summed over partitions.
+    SQLite reads the largest rowid, an upper bound found in one b-tree
+    descent. Other databases count.
+    """
+    table = model._meta.db_table
+    now = time.monotonic()
+    cached = _estimates.get(table)
+    if cached is not None and now - cached[0] < ESTIMATE_TTL:
+        return cached[1]
+    quoted = connection.ops.quote_name(table)
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                'SELECT COALESCE(SUM(GREATEST(reltuples, 0)), 0)::bigint FROM pg_class '
+                'WHERE oid = %s::regclass OR oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = %s::regclass)',
+                [table, table],
+            )
+        elif connection.vendor == 'sqlite':
+            cursor.execute(f'SELECT COALESCE(MAX(rowid), 0) FROM {quoted}')
+        else:
+            cursor.execute(f'SELECT COUNT(*) FROM {quoted}')
+        rows = int(cursor.fetchone()[0])
+    _estimates[table] = (now, rows)
+    return rows
+
+
+class ListFilters:
+    """Declarative query-string filters and ordering for a list endpoint.
+
+    - ``choices``: sets of values, ``?status=open,mitigating``.
+    - ``ranges``: inclusive bounds, ``?due_date__gte=2026-01-01&due_date__lte=2026-03-31``.
+      A bare date bounds a datetime field by whole days.
+    - ``ordering``: ``?ordering=rating`` or ``?ordering=-rating``, ties broken by id.
+
+    Every field has to lead an index, or follow ``project`` in one, and
+    declaring any other raises ImproperlyConfigured on import. Fields only
+    indexed behind ``project`` need ``?project_id=`` once the table holds
+    more than LIST_FILTER_SCAN_ROWS rows; without it the database would
+    scan or sort the whole table, so the request is refused with a 400.
+    """
+
+    def __init__(self, model, *, choices=(), ranges=(), ordering=()):
+        self.model = model
+        self.choices = tuple(choices)
+        self.ranges = tuple(ranges)
+        self.ordering = tuple(ordering)
+        self.coverage = {}
+        for name in (*self.choices, *self.ranges, *self.ordering):
+            coverage = index_coverage(model, name)
+            if coverage is None:
+                raise ImproperlyConfigured(
+                    f'{model._meta.label}.{name} has no index to filter or sort on; '
+                    f'add one leading with {name!r} or with (project, {name!r}).'
+                )
+            self.coverage[name] = coverage
+
+    def apply(self, queryset, request, keyset: bool = False):
+        """``queryset`` narrowed and ordered by the request; raises ValidationError on bad input."""
+        params = request.query_params
+        conditions = {}
+        errors = {}
+        used = set()
+        for name in self.choices:
+            values = [value for value in params.get(name, '').split(',') if value]
+            if not values:
+                continue
+            allowed = {value for value, _ in self.model._meta.get_field(name).choices}
+            unknown = sorted(set(values) - allowed)
+            if unknown:
+                errors[name] = [f'Unknown value(s): {", ".join(unknown)}.']
+                continue
+            conditions[f'{name}__in'] = values
+            used.add(name)
+        for name in self.ranges:
+            field = self.model._meta.get_field(name)
+            for lookup in ('gte', 'lte'):
+                param = f'{name}__{lookup}'
+                raw = params.get(param, '').strip()
+                if not raw:
+                    continue
+                try:
+                    key, value = _bound(field, lookup, raw)
+                except DjangoValidationError as error:
+                    errors[param] = error.messages
+                    continue
+                conditions[f'{name}__{key}'] = value
+                used.add(name)
+
+        order = None
+        raw = params.get(ORDERING_PARAM, '').strip()
+        if raw:
+            name = raw.removeprefix('-')
+            if not self.ordering:
+                errors[ORDERING_PARAM] = ['Ordering is not supported on this endpoint.']
+            elif keyset:
+                errors[ORDERING_PARAM] = ['Cursor pagination has a fixed order; drop ordering or use page numbers.']
+            elif name not in self.ordering:
+                errors[ORDERING_PARAM] = [f'Choose one of: {", ".join(self.ordering)}, optionally prefixed with -.']
+            else:
+                order = (raw, '-pk' if raw.startswith('-') else 'pk')
+                used.add(name)
+        if errors:
+            raise ValidationError(errors)
+
+        scoped = sorted(name for name in used if self.coverage[name] == PER_PROJECT)
+        if scoped and not params.get('project_id') and estimated_rows(self.model) > settings.LIST_FILTER_SCAN_ROWS:
+            message = 'This table is too large to filter or sort by this field across projects; add project_id.'
+            raise ValidationError({name: [message] for name in scoped})
+        queryset = queryset.filter(**conditions)
+        return queryset.order_by(*order) if order else queryset
+
+
+def _bound(field, lookup: str, raw: str) -> tuple[str, object]:
+    """The (lookup, value) for one range bound, parsed by the model field."""
+    try:
+        key, value = _parsed_bound(field, lookup, raw)
+        if isinstance(value, datetime):
+            # Stored as UTC, which is out of range at the ends of the calendar in other zones.
+            value.astimezone(timezone.utc)
+    except OverflowError:
+        raise DjangoValidationError('Date is out of range.')
+    return key, value
+
+
+def _parsed_bound(field, lookup: str, raw: str) -> tuple[str, object]:
+    if isinstance(field, models.DateTimeField):
+        try:
+            day = parse_date(raw)
+        except ValueError:
+            day = None
+        if day is not None:
+            start = django_timezone.make_aware(datetime.combine(day, datetime.min.time()))
+            # The whole day is inside an upper bound.
+            return ('lt', start + timedelta(days=1)) if lookup == 'lte' else (lookup, start)
+    value = field.to_python(raw)
+    if isinstance(value, datetime) and django_timezone.is_naive(value):
+        value = django_timezone.make_aware(value)
+    return lookup, value
+
+
+class ListFilterBackend(BaseFilterBackend):
+    """Applies a view's ``list_filters`` to list and export queries, not to detail lookups."""
+
+    def filter_queryset(self, request, queryset, view):
+        filters = getattr(view, 'list_filters', None)
+        if filters is None or getattr(view, 'detail', False):
+            return queryset
+        paginator = getattr(view, 'paginator', None)
+        keyset = isinstance(paginator, OptionalKeysetPagination) and paginator.keyset_requested(request)
+        return filters.apply(queryset, request, keyset)
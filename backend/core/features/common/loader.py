@@ -0,0 +1,205 @@
+import csv
+import json
+import time
+from contextlib import contextmanager
+
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connection, models
+from django.utils import timezone
+
+from core.features.activity.models import ActivityLog
+from core.features.approvals.models import Approval
+from core.features.budgets.models import BudgetItem
+from core.features.documents.models import Document
+from core.features.media_items.models import MediaItem
+from core.features.milestones.models import Milestone
+from core.features.projects.models import Project
+from core.features.rfis.models import Rfi
+from core.features.risks.models import Risk
+
+# Insert order: a model's batch is written only after every model before it.
+LOAD_ORDER = [Project, BudgetItem, Milestone, Risk, Rfi, Document, MediaItem, Approval, ActivityLog]
+
+READ_SIZE = 1 << 16
+
+
+class LoadError(Exception):
+    pass
+
+
+def iter_json_array(stream):
+    """Yield the items of a top-level JSON array without reading it all at once."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    started = False
+    while True:
+        chunk = stream.read(READ_SIZE)
+        buffer += chunk
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+            if not started and position < len(buffer):
+                if buffer[position] != '[':
+                    raise LoadError('Expected a JSON array.')
+                started = True
+                position += 1
+                continue
+            if position < len(buffer) and buffer[position] == ']':
+                return
+            try:
+                item, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if not chunk:
+                    raise LoadError('Truncated or malformed JSON array.')
+                break
+            yield item
+        buffer = buffer[position:]
+        if not chunk:
+            raise LoadError('Truncated JSON array.')
+
+
+def model_from_label(label: str):
+    try:
+        model = apps.get_model(label)
+    except (LookupError, ValueError):
+        raise LoadError(f'Unknown model {label!r}.')
+    if model not in LOAD_ORDER:
+        raise LoadError(f'{model._meta.label_lower} cannot be loaded.')
+    return model
+
+
+def read_records(stream, fmt: str, default_model=None):
+    """Yield (model, pk, fields) from fixture JSON, NDJSON or CSV.
+
+    JSON and NDJSON accept Django fixture objects (``model``/``pk``/
+    ``fields``). NDJSON and CSV also accept flat rows, as written by the
+    ``/export/`` endpoints, for ``default_model``.
+    """
+    if fmt == 'csv':
+        if default_model is None:
+            raise LoadError('CSV input needs --model.')
+        for row in csv.DictReader(stream):
+            pk = row.pop('id', None) or row.pop('pk', None)
+            yield default_model, pk, row
+        return
+    records = iter_json_array(stream) if fmt == 'json' else (json.loads(line) for line in stream if line.strip())
+    for record in records:
+        if 'fields' in record:
+            yield model_from_label(record['model']), record.get('pk'), record['fields']
+        elif default_model is not None:
+            record = dict(record)
+            yield default_model, record.pop('id', None), record
+        else:
+            raise LoadError('Flat records need --model.')
+
+
+@contextmanager
+def preserved_timestamps(model_list):
+    """Keep ``created_at``/``updated_at`` from the input instead of stamping now.
+
+    Management-command only: this flips the fields' auto_now flags for the
+    duration of the load.
+    """
+    fields = [
+        field
+        for model in model_list
+        for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    flags = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in flags:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class PortfolioLoader:
+    """Buffers rows per model and writes them in dependency-ordered batches.
+
+    ``project`` references resolve against an in-memory set of project ids
+    (existing ones plus those loaded so far) instead of a query per row.
+    """
+
+    def __init__(self, batch_size: int = 5000, use_copy: bool = False, ignore_conflicts: bool = False):
+        if use_copy and connection.vendor != 'postgresql':
+            raise LoadError('COPY needs PostgreSQL.')
+        self.batch_size = batch_size
+        self.use_copy = use_copy
+        self.ignore_conflicts = ignore_conflicts
+        self.now = timezone.now()
+        self.project_ids = set(Project.objects.values_list('id', flat=True).iterator())
+        self.buffers = {model: [] for model in LOAD_ORDER}
+        self.counts = {model: 0 for model in LOAD_ORDER}
+        self.seconds = {model: 0.0 for model in LOAD_ORDER}
+
+    def add(self, model, pk, fields: dict) -> None:
+        instance = self._build(model, pk, fields)
+        if model is Project:
+            self.project_ids.add(instance.pk)
+        buffer = self.buffers[model]
+        buffer.append(instance)
+        if len(buffer) >= self.batch_size:
+            self.flush(model)
+
+    def flush(self, model=None) -> None:
+        """Write ``model``'s buffer (default: all), after every model it depends on."""
+        last = LOAD_ORDER.index(model) if model is not None else len(LOAD_ORDER) - 1
+        for current in LOAD_ORDER[:last + 1]:
+            batch = self.buffers[current]
+            if not batch:
+                continue
+            started = time.perf_counter()
+            if self.use_copy:
+                self._copy(current, batch)
+            else:
+                current.objects.bulk_create(batch, ignore_conflicts=self.ignore_conflicts)
+            self.seconds[current] += time.perf_counter() - started
+            self.counts[current] += len(batch)
+            self.buffers[current] = []
+
+    def _build(self, model, pk, fields: dict):
+        values = {}
+        if pk not in (None, ''):
+            values[model._meta.pk.attname] = pk
+        for name, raw in fields.items():
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                raise LoadError(f'{model._meta.label_lower} {pk}: unknown field {name!r}.')
+            if isinstance(field, models.ForeignKey):
+                if raw not in self.project_ids:
+                    raise LoadError(f'{model._meta.label_lower} {pk}: unknown project {raw!r}.')
+                values[field.attname] = raw
+                continue
+            values[field.attname] = self._convert(field, raw, model, pk)
+        for name in ('created_at', 'updated_at'):
+            if values.get(name) is None:
+                values[name] = self.now
+        return model(**values)
+
+    def _convert(self, field, raw, model, pk):
+        if isinstance(raw, str):
+            if raw == '' and field.null:
+                return None
+            if isinstance(field, models.JSONField):
+                raw = json.loads(raw) if raw else field.get_default()
+        try:
+            return field.to_python(raw)
+        except ValidationError as error:
+            raise LoadError(f'{model._meta.label_lower} {pk}: {field.name}: {"; ".join(error.messages)}')
+
+    def _copy(self, model, batch) -> None:
+        fields = model._meta.concrete_fields
+        columns = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+        table = connection.ops.quote_name(model._meta.db_table)
+        with connection.cursor() as cursor:
+            with cursor.cursor.copy(f'COPY {table} ({columns}) FROM STDIN') as copy:
+                for instance in batch:
+                    copy.write_row(
+                        [field.get_db_prep_save(getattr(instance, field.attname), connection) for field in fields]
+                    )
@@ -7,3 +7,21 @@ class TimeStampedModel(models.Model):
 
     class Meta:
         abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the column values as loaded so write hooks can diff against
+        # them without issuing another SELECT.
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def loaded_values(self) -> dict | None:
+        return getattr(self, '_loaded_values', None)
+
+    def snapshot_loaded_values(self) -> None:
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if field.attname not in self.get_deferred_fields()
+        }
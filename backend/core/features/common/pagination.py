@@ -0,0 +1,217 @@
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.core.paginator import InvalidPage
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _setting(name: str, default=None):
+    return settings.REST_FRAMEWORK.get(name, default)
+
+
+class ConfiguredPageNumberPagination(PageNumberPagination):
+    """PageNumberPagination that honours PAGE_SIZE_QUERY_PARAM and MAX_PAGE_SIZE."""
+
+    page_size_query_param = _setting('PAGE_SIZE_QUERY_PARAM')
+    max_page_size = _setting('MAX_PAGE_SIZE')
+    known_count = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """``paginate_queryset`` that takes the count from ``view.list_count`` when set.
+
+        ``ConditionalGetMixin`` counts the filtered rows for its ETag; reusing
+        that saves the COUNT query Django's paginator would run.
+        """
+        self.known_count = getattr(view, 'list_count', None)
+        return super().paginate_queryset(queryset, request, view)
+
+    def django_paginator_class(self, object_list, per_page):
+        paginator = DjangoPaginator(object_list, per_page)
+        if self.known_count is not None:
+            paginator.count = self.known_count
+        return paginator
+
+    async def apaginate_queryset(self, queryset, request, count: int | None = None):
+        """``paginate_queryset`` on the async ORM.
+
+        Pass ``count`` when the caller already knows the row count, to skip
+        the COUNT query. Only the page's own rows are fetched.
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        if count is None:
+            count = await queryset.acount()
+        # Paginate the row positions, then load the rows of the chosen page.
+        paginator = self.django_paginator_class(range(count), page_size)
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        positions = self.page.object_list
+        self.page.object_list = [row async for row in queryset[positions.start:positions.stop]]
+        return self.page.object_list
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination that seeks on (ordering field, id) instead of OFFSET.
+
+    The view declares ``cursor_ordering``, e.g. ``('-created_at', '-id')``. Both
+    keys must sort in the same direction and the last one must be unique. The
+    opaque cursor carries the key values of the page boundary, so every page
+    is one indexed range scan however deep the client has paged. The total
+    count is skipped unless ``?count=true`` is passed.
+    """
+
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    page_size = _setting('PAGE_SIZE')
+    page_size_query_param = _setting('PAGE_SIZE_QUERY_PARAM')
+    max_page_size = _setting('MAX_PAGE_SIZE')
+    invalid_cursor_message = 'Invalid cursor.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        ordering = list(view.cursor_ordering)
+        self.fields = [name.lstrip('-') for name in ordering]
+        self.descending = ordering[0].startswith('-')
+        self.attnames = [queryset.model._meta.get_field(field).attname for field in self.fields]
+        self.count = queryset.count() if self._wants_count(request) else None
+
+        position, reverse = self.decode_cursor(request, queryset.model)
+        queryset = queryset.order_by(*self._ordering(reverse))
+        if position is not None:
+            queryset = queryset.filter(self._seek(position, reverse))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        payload = {}
+        if self.count is not None:
+            payload['count'] = self.count
+        payload['next'] = self.get_next_link()
+        payload['previous'] = self.get_previous_link()
+        payload['results'] = data
+        return Response(payload)
+
+    def get_page_size(self, request):
+        try:
+            requested = int(request.query_params[self.page_size_query_param])
+        except (KeyError, TypeError, ValueError):
+            return self.page_size
+        if requested <= 0:
+            return self.page_size
+        return min(requested, self.max_page_size) if self.max_page_size else requested
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self._link(self.page[0], reverse=True)
+
+    def _wants_count(self, request) -> bool:
+        return request.query_params.get(self.count_query_param, '').lower() in ('1', 'true')
+
+    def _ordering(self, reverse: bool) -> list[str]:
+        descending = self.descending != reverse
+        return [f'-{field}' if descending else field for field in self.fields]
+
+    def _seek(self, position: list, reverse: bool) -> Q:
+        # (a, b) < (x, y) expanded so the leading column stays sargable:
+        # a <= x AND (a < x OR (a = x AND b < y)).
+        op = 'lt' if self.descending != reverse else 'gt'
+        leading, *rest = self.fields
+        condition = Q(**{f'{leading}__{op}e': position[0]})
+        tail = Q(**{f'{leading}__{op}': position[0]})
+        prefix = Q(**{leading: position[0]})
+        for field, value in zip(rest, position[1:]):
+            tail |= prefix & Q(**{f'{field}__{op}': value})
+            prefix &= Q(**{field: value})
+        return condition & tail
+
+    def _link(self, row, reverse: bool) -> str:
+        # Rows are model instances, or named tuples from the fast list path.
+        values = [self._cursor_value(getattr(row, attname)) for attname in self.attnames]
+        token = json.dumps({'p': values, 'r': reverse}, separators=(',', ':'))
+        encoded = base64.urlsafe_b64encode(token.encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _cursor_value(self, value) -> str:
+        return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+    def decode_cursor(self, request, model):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            token = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            values = token['p']
+            if len(values) != len(self.fields):
+                raise ValueError
+            position = [
+                model._meta.get_field(field).to_python(value)
+                for field, value in zip(self.fields, values)
+            ]
+        except (TypeError, ValueError, KeyError, binascii.Error, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+        return position, bool(token.get('r'))
+
+
+class OptionalKeysetPagination(BasePagination):
+    """Page numbers by default; keyset pagination when the client opts in.
+
+    Clients opt in with ``?pagination=cursor`` on the first request and then
+    follow the ``next``/``previous`` links, which carry a ``cursor`` parameter.
+    """
+
+    mode_query_param = 'pagination'
+
+    def __init__(self):
+        self.paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.keyset_requested(request):
+            self.paginator = KeysetPagination()
+        else:
+            self.paginator = ConfiguredPageNumberPagination()
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def keyset_requested(self, request) -> bool:
+        params = request.query_params
+        return (
+            params.get(self.mode_query_param) == 'cursor'
+            or KeysetPagination.cursor_query_param in params
+        )
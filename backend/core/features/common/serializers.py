@@ -0,0 +1,152 @@
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
+
+from .signals import row_values, rows_bulk_changed
+
+
+def requested_fields(request, available, fieldset: str | None = None) -> set[str] | None:
+    """Parse ``?fields=`` / ``?omit=`` into the set of field names to keep.
+
+    Returns None when the request does not ask for a sparse fieldset. Only
+    read requests are narrowed; writes always validate the full serializer.
+    Responses that embed several resources pass ``fieldset`` to read
+    ``?fields[<fieldset>]=`` / ``?omit[<fieldset>]=`` instead.
+    """
+    if request is None or request.method not in ('GET', 'HEAD'):
+        return None
+    suffix = f'[{fieldset}]' if fieldset else ''
+    fields = request.query_params.get(f'fields{suffix}')
+    omit = request.query_params.get(f'omit{suffix}')
+    if not fields and not omit:
+        return None
+    available = set(available)
+    keep = set(filter(None, fields.split(','))) if fields else set(available)
+    dropped = set(filter(None, omit.split(','))) if omit else set()
+    unknown = (keep | dropped) - available
+    if unknown:
+        raise serializers.ValidationError(
+            {f'fields{suffix}': [f'Unknown field(s): {", ".join(sorted(unknown))}.']}
+        )
+    return keep - dropped
+
+
+class SparseFieldsMixin:
+    """Drops serializer fields that the request excluded via ``?fields=``/``?omit=``."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        keep = requested_fields(self.context.get('request'), self.fields, self.context.get('fieldset'))
+        if keep is not None:
+            for name in set(self.fields) - keep:
+                self.fields.pop(name)
+
+
+class PreloadedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """Resolves from objects the parent BulkListSerializer fetched in one query."""
+
+    def to_internal_value(self, data):
+        preloaded = getattr(self.root, 'preloaded', {}).get(self.field_name)
+        if preloaded is not None and not isinstance(data, bool):
+            obj = preloaded.get(data)
+            if obj is not None:
+                return obj
+        return super().to_internal_value(data)
+
+
+class BulkModelSerializer(serializers.ModelSerializer):
+    serializer_related_field = PreloadedPrimaryKeyRelatedField
+
+
+class BulkListSerializer(serializers.ListSerializer):
+    """Validates a batch of rows together and writes it with bulk queries.
+
+    Related objects and primary-key uniqueness are resolved with one query per
+    field for the whole batch instead of one per row. For updates the
+    serializer is constructed with ``instance`` set to the rows being changed,
+    and every item must carry its primary key. Errors are reported per row,
+    aligned with the input list.
+    """
+
+    batch_size = 500
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            self._preload([row for row in data if isinstance(row, dict)])
+        return super().to_internal_value(data)
+
+    def _preload(self, rows: list[dict]) -> None:
+        model = self.child.Meta.model
+        pk_name = model._meta.pk.name
+        self.preloaded = {}
+        for name, field in self.child.fields.items():
+            if isinstance(field, serializers.PrimaryKeyRelatedField) and not field.read_only:
+                keys = {row[name] for row in rows if isinstance(row.get(name), (str, int))}
+                self.preloaded[name] = field.get_queryset().in_bulk(keys)
+
+        pk_field = self.child.fields.get(pk_name)
+        if pk_field is not None:
+            unique = [v for v in pk_field.validators if isinstance(v, UniqueValidator)]
+            self.unique_message = unique[0].message if unique else None
+            pk_field.validators = [v for v in pk_field.validators if not isinstance(v, UniqueValidator)]
+
+        keys = {row[pk_name] for row in rows if isinstance(row.get(pk_name), (str, int))}
+        if self.instance is not None:
+            self.targets_by_pk = {obj.pk: obj for obj in self.instance}
+        else:
+            self.existing_pks = set(model.objects.filter(pk__in=keys).values_list('pk', flat=True))
+        self.seen_pks = set()
+        self.targets = []
+
+    def run_child_validation(self, data):
+        pk_name = self.child.Meta.model._meta.pk.name
+        pk = data.get(pk_name) if isinstance(data, dict) else None
+        if pk is not None and not isinstance(pk, (str, int)):
+            raise serializers.ValidationError({pk_name: ['Must be a string.']})
+        if pk is not None and pk in self.seen_pks:
+            raise serializers.ValidationError({pk_name: ['Duplicate id in this batch.']})
+        self.seen_pks.add(pk)
+
+        if self.instance is not None:
+            target = self.targets_by_pk.get(pk)
+            if target is None:
+                raise serializers.ValidationError({pk_name: ['Not found.']})
+            self.child.instance = target
+            self.child.initial_data = data
+            validated = super().run_child_validation(data)
+            self.targets.append(target)
+            return validated
+
+        if pk is not None and pk in self.existing_pks and self.unique_message:
+            raise serializers.ValidationError({pk_name: [self.unique_message]})
+        return super().run_child_validation(data)
+
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        objs = [model(**attrs) for attrs in validated_data]
+        objs = model.objects.bulk_create(objs, batch_size=self.batch_size)
+        self.changes = [(None, row_values(obj)) for obj in objs]
+        rows_bulk_changed.send(model, changes=self.changes)
+        return objs
+
+    def update(self, instance, validated_data):
+        model = self.child.Meta.model
+        pk_name = model._meta.pk.name
+        now = timezone.now()
+        fields = {'updated_at'}
+        changes = []
+        for target, attrs in zip(self.targets, validated_data):
+            previous = target.loaded_values() or row_values(target)
+            for name, value in attrs.items():
+                if name == pk_name:
+                    continue
+                setattr(target, name, value)
+                fields.add(name)
+            target.updated_at = now
+            changes.append((previous, row_values(target)))
+        model.objects.bulk_update(self.targets, sorted(fields), batch_size=self.batch_size)
+        for target in self.targets:
+            target.snapshot_loaded_values()
+        self.changes = changes
+        rows_bulk_changed.send(model, changes=changes)
+        return self.targets
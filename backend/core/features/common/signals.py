@@ -0,0 +1,30 @@
+import threading
+from contextlib import contextmanager
+
+from django.dispatch import Signal
+
+# Sent once per bulk write with sender=<model> and
+# changes=[(previous, current), ...] where each side is a dict of column
+# values keyed by attname, or None for a created/deleted row.
+rows_bulk_changed = Signal()
+
+_state = threading.local()
+
+
+@contextmanager
+def bulk_write(model):
+    """Mark ``model`` as being written in bulk so per-row hooks stand down."""
+    active = getattr(_state, 'models', set())
+    _state.models = active | {model}
+    try:
+        yield
+    finally:
+        _state.models = active
+
+
+def in_bulk_write(model) -> bool:
+    return model in getattr(_state, 'models', ())
+
+
+def row_values(instance) -> dict:
+    return {field.attname: getattr(instance, field.attname) for field in instance._meta.concrete_fields}
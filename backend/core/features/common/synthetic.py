@@ -0,0 +1,247 @@
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from django.db import transaction
+
+from core.features.activity.models import ActivityLog
+from core.features.approvals.models import Approval
+from core.features.budgets.models import BudgetItem
+from core.features.common.signals import bulk_write
+from core.features.documents.models import Document
+from core.features.media_items.models import MediaItem
+from core.features.milestones.models import Milestone
+from core.features.projects.models import Project
+from core.features.rfis.models import Rfi
+from core.features.risks.models import Risk
+
+SYNTHETIC_PREFIX = 'syn-'
+PROGRAMS = ['Health Infrastructure', 'Education Capital', 'Transport Upgrades', 'Justice Facilities']
+PHASES = ['Planning', 'Design', 'Procurement', 'Construction', 'Handover']
+LOCATIONS = ['Brisbane', 'Sydney', 'Melbourne', 'Perth', 'Adelaide', 'Hobart', 'Darwin', 'Canberra']
+BUDGET_CATEGORIES = ['Civil Works', 'Structure', 'Services', 'Fit-out', 'Landscaping', 'Consultants']
+RISK_CATEGORIES = ['Delivery', 'Safety', 'Cost', 'Design', 'Stakeholder']
+ACTORS = ['Alex Chen', 'Priya Nair', 'Sam Taylor', 'Jordan Lee', 'Morgan Smith']
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+START = date(2024, 1, 1)
+
+
+def _money(rng: random.Random, low: int, high: int) -> Decimal:
+    return Decimal(rng.randrange(low * 100, high * 100)) / 100
+
+
+def _projects(rng, count):
+    statuses = list(Project.Status.values)
+    for index in range(count):
+        start = START + timedelta(days=rng.randrange(0, 540))
+        yield Project(
+            id=f'{SYNTHETIC_PREFIX}p-{index:05d}',
+            name=f'Synthetic project {index:05d}',
+            location=rng.choice(LOCATIONS),
+            status=rng.choice(statuses),
+            start_date=start,
+            end_date=start + timedelta(days=rng.randrange(365, 1460)),
+            description='Generated by generate_synthetic_portfolio.',
+            program_name=rng.choice(PROGRAMS),
+            phase=rng.choice(PHASES),
+        )
+
+
+def _budgets(rng, count, project_ids):
+    statuses = list(BudgetItem.Status.values)
+    for index in range(count):
+        original = _money(rng, 10_000, 5_000_000)
+        variations = _money(rng, 0, 250_000)
+        yield BudgetItem(
+            id=f'{SYNTHETIC_PREFIX}b-{index:09d}',
+            project_id=project_ids[index % len(project_ids)],
+            category=rng.choice(BUDGET_CATEGORIES),
+            description=f'Budget line {index}',
+            original_budget=original,
+            approved_variations=variations,
+            forecast_cost=original + variations + _money(rng, 0, 100_000),
+            actual_spent=original * Decimal(rng.randrange(0, 100)) / 100,
+            cost_code=f'CC-{index % 9999:04d}',
+            status=rng.choice(statuses),
+        )
+
+
+def _milestones(rng, count, project_ids):
+    statuses = list(Milestone.Status.values)
+    for index in range(count):
+        status = rng.choice(statuses)
+        planned = START + timedelta(days=rng.randrange(0, 1460))
+        done = status == Milestone.Status.DONE
+        yield Milestone(
+            id=f'{SYNTHETIC_PREFIX}m-{index:09d}',
+            project_id=project_ids[index % len(project_ids)],
+            name=f'Milestone {index}',
+            planned_date=planned,
+            actual_date=planned + timedelta(days=rng.randrange(-10, 60)) if done else None,
+            status=status,
+            percent_complete=100 if done else rng.randrange(0, 100),
+        )
+
+
+def _risks(rng, count, project_ids):
+    statuses = list(Risk.Status.values)
+    for index in range(count):
+        likelihood = rng.randrange(1, 6)
+        impact = rng.randrange(1, 6)
+        yield Risk(
+            id=f'{SYNTHETIC_PREFIX}r-{index:09d}',
+            project_id=project_ids[index % len(project_ids)],
+            title=f'Risk {index}',
+            category=rng.choice(RISK_CATEGORIES),
+            likelihood=likelihood,
+            impact=impact,
+            rating=likelihood * impact,
+            status=rng.choice(statuses),
+            owner=rng.choice(ACTORS),
+            due_date=START + timedelta(days=rng.randrange(0, 1460)),
+        )
+
+
+def _rfis(rng, count, project_ids):
+    statuses = list(Rfi.Status.values)
+    for index in range(count):
+        raised = EPOCH + timedelta(minutes=rng.randrange(0, 1_000_000))
+        yield Rfi(
+            id=f'{SYNTHETIC_PREFIX}q-{index:09d}',
+            project_id=project_ids[index % len(project_ids)],
+            rfi_number=f'RFI-{index:06d}',
+            title=f'RFI {index}',
+            question='Please confirm the detail shown on the drawing.',
+            status=rng.choice(statuses),
+            raised_by=rng.choice(ACTORS),
+            raised_at=raised,
+            due_date=raised.date() + timedelta(days=14),
+        )
+
+
+def _documents(rng, count, project_ids):
+    doc_types = list(Document.DocType.values)
+    statuses = list(Document.Status.values)
+    for index in range(count):
+        yield Document(
+            id=f'{SYNTHETIC_PREFIX}d-{index:09d}',
+            project_id=project_ids[index % len(project_ids)],
+            doc_type=rng.choice(doc_types),
+            title=f'Document {index}',
+            file_url=f'https://files.example.com/{index}.pdf',
+            version=f'v{rng.randrange(1, 10)}',
+            status=rng.choice(statuses),
+            uploaded_by=rng.choice(ACTORS),
+            uploaded_at=EPOCH + timedelta(minutes=rng.randrange(0, 1_000_000)),
+        )
+
+
+def _media_items(rng, count, project_ids):
+    media_types = list(MediaItem.MediaType.values)
+    for index in range(count):
+        yield MediaItem(
+            id=f'{SYNTHETIC_PREFIX}i-{index:09d}',
+            project_id=project_ids[index % len(project_ids)],
+            title=f'Media {index}',
+            media_type=rng.choice(media_types),
+            media_url=f'https://media.example.com/{index}.jpg',
+            captured_at=EPOCH + timedelta(minutes=rng.randrange(0, 1_000_000)),
+            uploaded_by=rng.choice(ACTORS),
+        )
+
+
+def _approvals(rng, count, project_ids):
+    statuses = list(Approval.Status.values)
+    for index in range(count):
+        status = rng.choice(statuses)
+        requested = EPOCH + timedelta(minutes=rng.randrange(0, 1_000_000))
+        reviewed = status != Approval.Status.PENDING
+        yield Approval(
+            id=f'{SYNTHETIC_PREFIX}a-{index:09d}',
+            project_id=project_ids[index % len(project_ids)],
+            entity_type='document',
+            entity_id=f'{SYNTHETIC_PREFIX}d-{index:09d}',
+            status=status,
+            requested_by=rng.choice(ACTORS),
+            requested_at=requested,
+            reviewed_by=rng.choice(ACTORS) if reviewed else None,
+            reviewed_at=requested + timedelta(hours=rng.randrange(1, 200)) if reviewed else None,
+        )
+
+
+def _activity(rng, count, project_ids):
+    actions = list(ActivityLog.Action.values)
+    for index in range(count):
+        yield ActivityLog(
+            id=uuid.UUID(int=rng.getrandbits(128)).hex,
+            project_id=project_ids[index % len(project_ids)],
+            actor=rng.choice(ACTORS),
+            action=rng.choice(actions),
+            entity_type='budget_item',
+            entity_id=f'{SYNTHETIC_PREFIX}b-{index:09d}',
+            metadata={'source': 'synthetic'},
+        )
+
+
+# Insert order follows the foreign keys: projects first.
+GENERATORS = [
+    (BudgetItem, 'budgets', _budgets),
+    (Milestone, 'milestones', _milestones),
+    (Risk, 'risks', _risks),
+    (Rfi, 'rfis', _rfis),
+    (Document, 'documents', _documents),
+    (MediaItem, 'media_items', _media_items),
+    (Approval, 'approvals', _approvals),
+    (ActivityLog, 'activity', _activity),
+]
+
+
+def insert_batches(model, objects, batch_size: int) -> int:
+    """``bulk_create`` an iterable in fixed-size batches, one transaction each."""
+    inserted = 0
+    batch = []
+    for obj in objects:
+        batch.append(obj)
+        if len(batch) >= batch_size:
+            with transaction.atomic():
+                model.objects.bulk_create(batch)
+            inserted += len(batch)
+            batch = []
+    if batch:
+        with transaction.atomic():
+            model.objects.bulk_create(batch)
+        inserted += len(batch)
+    return inserted
+
+
+def generate_portfolio(counts: dict, seed: int = 42, batch_size: int = 5000, report=None) -> None:
+    """Insert a reproducible synthetic portfolio.
+
+    ``counts`` maps 'projects' and each GENERATORS key to a row count. Each
+    model draws from its own seeded generator, so the same seed and count
+    always give the same rows, whatever the other counts are. ``report`` is
+    called with (key, rows, rows per second) after each model. Rows go in
+    with raw ``bulk_create``, so callers rebuild the program summary
+    afterwards.
+    """
+    project_ids = [f'{SYNTHETIC_PREFIX}p-{index:05d}' for index in range(counts['projects'])]
+    steps = [(Project, 'projects', lambda rng, count, _: _projects(rng, count))] + GENERATORS
+    for model, key, generator in steps:
+        if not counts.get(key):
+            continue
+        rng = random.Random(f'{seed}-{key}')
+        started = time.perf_counter()
+        inserted = insert_batches(model, generator(rng, counts[key], project_ids), batch_size)
+        if report is not None:
+            report(key, inserted, inserted / max(time.perf_counter() - started, 1e-9))
+
+
+def clear_portfolio() -> None:
+    """Delete every synthetic project and its rows, children first."""
+    projects = Project.objects.filter(id__startswith=SYNTHETIC_PREFIX)
+    for model, _, _ in reversed(GENERATORS):
+        with bulk_write(model):
+            model.objects.filter(project__in=projects).delete()
+    projects.delete()
@@ -0,0 +1,400 @@
+import hashlib
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from . import cache as api_cache
+from .export import STREAMERS, CSVRenderer, NDJSONRenderer
+from .fastpath import compile_row_encoder
+from .pagination import ConfiguredPageNumberPagination, OptionalKeysetPagination
+from .signals import bulk_write, row_values, rows_bulk_changed
+
+# Validators kept with a cached response so hits still answer conditional GETs.
+CACHED_HEADERS = ('ETag', 'Last-Modified', 'Cache-Control')
+
+
+class CachedResponseMixin:
+    """Serves JSON ``list`` and ``retrieve`` responses from the shared cache.
+
+    Entries are keyed by path, query string, format and user, and tagged by
+    model and project: a list filtered with ``?project_id=`` depends on that
+    project's rows only, a detail response on its own row. Saves and bulk
+    writes bump the tags through signals, deletes through ``perform_destroy``
+    here and in the admin. Entries remember the tag versions they were built
+    from, so a bumped tag turns them into misses without any key scans.
+    Responses carry ``X-Cache: HIT`` or ``MISS``.
+    """
+
+    def perform_destroy(self, instance):
+        row = row_values(instance)
+        super().perform_destroy(instance)
+        api_cache.invalidate_deleted(type(instance), [row])
+
+    def bulk_changed(self, changes: list[tuple[dict | None, dict | None]]) -> None:
+        super().bulk_changed(changes)
+        # bulk_destroy bypasses perform_destroy; saves are covered by signals.
+        deleted = [previous for previous, current in changes if current is None]
+        if deleted:
+            api_cache.invalidate_deleted(self.get_queryset().model, deleted)
+
+    def cache_lookup(self, request, tags: list[str]) -> tuple | None:
+        """Return (namespace, key, entry or None, tag versions), or None if not cacheable."""
+        if not settings.API_CACHE_ENABLED or request.accepted_renderer.format != 'json':
+            return None
+        namespace = f'{self.basename}-{self.action}'
+        user = request.user
+        key = api_cache.entry_key(request, f'user:{user.pk}' if user.is_authenticated else 'anonymous')
+        entry, versions = api_cache.lookup(key, [*tags, api_cache.ALL_TAG])
+        api_cache.record(namespace, 'hits' if entry is not None else 'misses')
+        return namespace, key, entry, versions
+
+    def cache_hit_response(self, request, entry: dict):
+        response = HttpResponse(entry['content'], content_type=entry['content_type'])
+        for header, value in entry['headers']:
+            response[header] = value
+        response['X-Cache'] = 'HIT'
+        return get_conditional_response(request._request, etag=response.get('ETag'), response=response)
+
+    def cache_on_render(self, response, lookup: tuple):
+        """Mark ``response`` as a miss and store it once it has been rendered."""
+        namespace, key, _, versions = lookup
+        response['X-Cache'] = 'MISS'
+        if response.status_code == status.HTTP_200_OK:
+            response.add_post_render_callback(lambda rendered: self._store(namespace, key, versions, rendered))
+        return response
+
+    def cached_response(self, request, tags: list[str], view, *args, **kwargs):
+        lookup = self.cache_lookup(request, tags)
+        if lookup is None:
+            return view(request, *args, **kwargs)
+        if lookup[2] is not None:
+            return self.cache_hit_response(request, lookup[2])
+        return self.cache_on_render(view(request, *args, **kwargs), lookup)
+
+    def list_cache_tags(self, request) -> list[str]:
+        project_id = request.query_params.get('project_id') or None
+        return [api_cache.model_tag(self.get_queryset().model, project_id)]
+
+    def retrieve_cache_tags(self, kwargs: dict) -> list[str]:
+        pk = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        return [api_cache.row_tag(self.get_queryset().model, pk)]
+
+    def _store(self, namespace: str, key: str, versions: dict, response) -> None:
+        entry = {
+            'versions': versions,
+            'content': response.content,
+            'content_type': response['Content-Type'],
+            'headers': [(header, response[header]) for header in CACHED_HEADERS if header in response],
+        }
+        api_cache.cache.set(key, entry, settings.API_CACHE_TIMEOUT)
+        api_cache.record(namespace, 'stores')
+
+    # Defined last: inside the class body ``list`` shadows the builtin.
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, self.list_cache_tags(request), super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, self.retrieve_cache_tags(kwargs), super().retrieve, *args, **kwargs)
+
+
+class SparseQuerysetMixin:
+    """Narrows the SELECT to the columns a sparse fieldset actually renders.
+
+    Pairs with the serializer-side ``SparseFieldsMixin``. Serializers render
+    foreign keys from the local ``*_id`` column, so the join is dropped too.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        params = self.request.query_params
+        if self.request.method not in ('GET', 'HEAD') or not ('fields' in params or 'omit' in params):
+            return queryset
+        needed = set(self.get_serializer().fields)
+        # Keyset pagination reads its ordering columns to build cursors.
+        needed.update(name.lstrip('-') for name in getattr(self, 'cursor_ordering', ()))
+        model = queryset.model
+        columns = [field.name for field in model._meta.concrete_fields if field.name in needed]
+        return queryset.select_related(None).only(model._meta.pk.name, *columns)
+
+
+class ConditionalGetMixin:
+    """Answers unchanged ``list`` and ``retrieve`` requests with 304 Not Modified.
+
+    A page-numbered list's ETag is built from ``MAX(updated_at)`` and the
+    row count of the filtered queryset, read with one aggregate query before
+    anything is serialized; the paginator reuses that count instead of
+    running its own. Every write path bumps ``updated_at``, and a delete
+    always lowers the count, so both edits and deletes change the tag.
+    Keyset pages skip the aggregate, which would scan everything they were
+    meant to avoid, and tag the page's own content instead. Detail
+    responses use the row's own ``updated_at``.
+
+    Last-Modified is sent on details and page-numbered lists. Lists ignore
+    If-Modified-Since, though, because a delete can leave
+    ``MAX(updated_at)`` where it was.
+    """
+
+    def list(self, request, *args, **kwargs):
+        paginator = self.paginator
+        if isinstance(paginator, OptionalKeysetPagination) and paginator.keyset_requested(request):
+            response = super().list(request, *args, **kwargs)
+            content = json.dumps(response.data, cls=JSONEncoder, sort_keys=True)
+            etag = self._etag(request, hashlib.md5(content.encode(), usedforsecurity=False).hexdigest())
+            not_modified = get_conditional_response(request._request, etag=etag)
+            return self._add_validators(not_modified or response, etag, None)
+
+        queryset = self.filter_queryset(self.get_queryset()).select_related(None).order_by()
+        state = queryset.aggregate(**self.list_state_aggregates())
+        last_modified = state['last_modified']
+        etag = self._etag(request, last_modified, state['count'])
+        not_modified = get_conditional_response(request._request, etag=etag)
+        if not_modified is not None:
+            return self._add_validators(not_modified, etag, last_modified)
+        self.list_count = state['count']
+        return self._add_validators(super().list(request, *args, **kwargs), etag, last_modified)
+
+    def list_state_aggregates(self) -> dict:
+        return {'last_modified': Max('updated_at'), 'count': Count('pk')}
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.detail_response(request, self.get_object())
+
+    def detail_response(self, request, instance):
+        etag = self._etag(request, instance.pk, instance.updated_at)
+        last_modified = instance.updated_at
+        not_modified = get_conditional_response(
+            request._request,
+            etag=etag,
+            last_modified=int(last_modified.timestamp()),
+        )
+        if not_modified is not None:
+            return self._add_validators(not_modified, etag, last_modified)
+        serializer = self.get_serializer(instance)
+        return self._add_validators(Response(serializer.data), etag, last_modified)
+
+    def _etag(self, request, *state) -> str:
+        # The path and query string cover filters, pages and sparse fieldsets.
+        key = '|'.join(
+            [request.get_full_path(), request.accepted_renderer.format]
+            + [value.isoformat() if hasattr(value, 'isoformat') else str(value) for value in state]
+        )
+        return f'"{hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()}"'
+
+    def _add_validators(self, response, etag: str, last_modified):
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        # Let browsers store the response but revalidate it on every use.
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class FastListMixin:
+    """Serves ``list`` from ``values_list()`` tuples through precompiled encoders.
+
+    The output is identical to the serializer's, so clients cannot tell the
+    difference. Serializers with fields that need a model instance fall back
+    to the regular path, as does everything when FAST_LIST_SERIALIZATION is
+    off.
+    """
+
+    def list(self, request, *args, **kwargs):
+        compiled = None
+        if settings.FAST_LIST_SERIALIZATION:
+            compiled = compile_row_encoder(self.get_serializer())
+        if compiled is None:
+            return super().list(request, *args, **kwargs)
+
+        columns, encode = compiled
+        extra = [
+            name.lstrip('-') for name in getattr(self, 'cursor_ordering', ())
+            if name.lstrip('-') not in columns
+        ]
+        queryset = self.filter_queryset(self.get_queryset()).select_related(None)
+        rows = queryset.values_list(*columns, *extra, named=True)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response([encode(row) for row in page])
+        return Response([encode(row) for row in rows])
+
+
+class AsyncReadMixin:
+    """Async ``list`` and ``retrieve`` for ASGI workers, see ``async_views``.
+
+    They answer exactly like the sync chain of ``CachedResponseMixin``,
+    ``ConditionalGetMixin`` and ``FastListMixin`` but await the ORM, so a
+    worker keeps serving other requests while queries run. The ETag
+    aggregate's row count doubles as the paginator's count, saving one
+    query per page. Anything off the fast path (other formats, keyset
+    pages, serializers the row encoder can't compile) returns None, and
+    the request goes through the sync view instead.
+    """
+
+    async def async_list(self, request, *args, **kwargs):
+        compiled = self._async_encoder(request)
+        paginator = self._async_paginator(request)
+        if compiled is None or paginator is None:
+            return None
+        lookup = await sync_to_async(self.cache_lookup)(request, self.list_cache_tags(request))
+        if lookup is not None and lookup[2] is not None:
+            return self.cache_hit_response(request, lookup[2])
+
+        queryset = self.filter_queryset(self.get_queryset()).select_related(None)
+        state = await queryset.order_by().aaggregate(**self.list_state_aggregates())
+        last_modified = state['last_modified']
+        etag = self._etag(request, last_modified, state['count'])
+        response = get_conditional_response(request._request, etag=etag)
+        if response is None:
+            columns, encode = compiled
+            rows = queryset.values_list(*columns, named=True)
+            page = await paginator.apaginate_queryset(rows, request, count=state['count'])
+            response = paginator.get_paginated_response([encode(row) for row in page])
+        response = self._add_validators(response, etag, last_modified)
+        return response if lookup is None else self.cache_on_render(response, lookup)
+
+    async def async_retrieve(self, request, *args, **kwargs):
+        if self._async_encoder(request) is None:
+            return None
+        lookup = await sync_to_async(self.cache_lookup)(request, self.retrieve_cache_tags(kwargs))
+        if lookup is not None and lookup[2] is not None:
+            return self.cache_hit_response(request, lookup[2])
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        instance = await queryset.filter(**{self.lookup_field: kwargs[lookup_url_kwarg]}).afirst()
+        if instance is None:
+            raise Http404(f'No {queryset.model._meta.object_name} matches the given query.')
+        self.check_object_permissions(request, instance)
+        response = self.detail_response(request, instance)
+        return response if lookup is None else self.cache_on_render(response, lookup)
+
+    def _async_encoder(self, request):
+        if not settings.FAST_LIST_SERIALIZATION or request.accepted_renderer.format != 'json':
+            return None
+        # Serializers that compile read plain columns only, so rendering an
+        # instance never needs a query the async context would refuse.
+        return compile_row_encoder(self.get_serializer())
+
+    def _async_paginator(self, request):
+        paginator = self.paginator
+        if isinstance(paginator, OptionalKeysetPagination):
+            if paginator.keyset_requested(request):
+                return None
+            paginator.paginator = ConfiguredPageNumberPagination()
+            return paginator.paginator
+        return paginator if isinstance(paginator, ConfiguredPageNumberPagination) else None
+
+
+class ExportMixin:
+    """Adds ``/export/``, streaming the filtered list as CSV or NDJSON.
+
+    Rows are read as value tuples through a chunked iterator, so memory use
+    stays flat however many rows match. Choose the format with ``?format=``
+    or the Accept header. CSV is the default.
+    """
+
+    export_chunk_size = 2000
+
+    @action(detail=False, methods=['get'], renderer_classes=[CSVRenderer, NDJSONRenderer])
+    def export(self, request):
+        queryset = self.filter_queryset(self.get_queryset()).select_related(None)
+        columns = [field.name for field in queryset.model._meta.concrete_fields]
+        rows = queryset.values_list(*columns).iterator(chunk_size=self.export_chunk_size)
+        stream, extension = STREAMERS[request.accepted_renderer.format]
+        response = StreamingHttpResponse(
+            stream(columns, rows),
+            content_type=request.accepted_renderer.media_type,
+        )
+        response['Content-Disposition'] = f'attachment; filename="{self.basename}.{extension}"'
+        return response
+
+
+class BulkWriteMixin:
+    """Adds ``/bulk/``: POST creates, PATCH updates and DELETE removes many rows.
+
+    Each call validates the whole batch first and writes it in one
+    transaction. If any row fails, nothing is written and the response lists
+    the errors per row, aligned with the request body. The written rows are
+    passed to ``bulk_changed`` inside the transaction.
+    """
+
+    bulk_max_rows = 5000
+
+    @action(detail=False, methods=['post', 'patch', 'delete'], url_path='bulk')
+    def bulk(self, request):
+        if request.method == 'POST':
+            return self.bulk_create(request)
+        if request.method == 'PATCH':
+            return self.bulk_update(request)
+        return self.bulk_destroy(request)
+
+    def bulk_create(self, request):
+        serializer = self.get_serializer(data=request.data, many=True, max_length=self.bulk_max_rows)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        with transaction.atomic():
+            serializer.save()
+            self.bulk_changed(serializer.changes)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def bulk_update(self, request):
+        rows = request.data if isinstance(request.data, list) else []
+        ids = [row.get('id') for row in rows if isinstance(row, dict) and isinstance(row.get('id'), (str, int))]
+        with transaction.atomic():
+            instances = list(self.get_queryset().select_for_update(of=('self',)).filter(pk__in=ids))
+            serializer = self.get_serializer(
+                instances,
+                data=request.data,
+                many=True,
+                partial=True,
+                max_length=self.bulk_max_rows,
+            )
+            if not serializer.is_valid():
+                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+            serializer.save()
+            self.bulk_changed(serializer.changes)
+        return Response(serializer.data)
+
+    def bulk_destroy(self, request):
+        ids = request.data.get('ids') if isinstance(request.data, dict) else None
+        if not isinstance(ids, list) or not ids:
+            return Response({'ids': ['Provide a non-empty list of ids.']}, status=status.HTTP_400_BAD_REQUEST)
+        if len(ids) > self.bulk_max_rows:
+            return Response(
+                {'ids': [f'Ensure this field has no more than {self.bulk_max_rows} elements.']},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not all(isinstance(pk, (str, int)) for pk in ids):
+            return Response(
+                [{} if isinstance(pk, (str, int)) else {'id': ['Must be a string.']} for pk in ids],
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        model = self.get_queryset().model
+        with transaction.atomic():
+            queryset = self.get_queryset().filter(pk__in=ids)
+            rows = {row['id']: row for row in queryset.values()}
+            missing = [pk for pk in ids if pk not in rows]
+            if missing:
+                return Response(
+                    [{} if pk in rows else {'id': ['Not found.']} for pk in ids],
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            with bulk_write(model):
+                queryset.delete()
+            changes = [(row, None) for row in rows.values()]
+            rows_bulk_changed.send(model, changes=changes)
+            self.bulk_changed(changes)
+        return Response({'deleted': len(rows)})
+
+    def bulk_changed(self, changes: list[tuple[dict | None, dict | None]]) -> None:
+        """Hook called with the (previous, current) column values of every written row."""
@@ -28,6 +28,9 @@ class Document(TimeStampedModel):
 
     class Meta:
         ordering = ['-uploaded_at']
+        indexes = [
+            models.Index(fields=['project', '-uploaded_at'], name='document_project_uploaded_idx'),
+        ]
 
     def __str__(self) -> str:
         return f'{self.project_id} · {self.title}'
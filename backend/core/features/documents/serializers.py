@@ -1,8 +1,10 @@
 from rest_framework import serializers
+
+from core.features.common.serializers import SparseFieldsMixin
 from .models import Document
 
 
-class DocumentSerializer(serializers.ModelSerializer):
+class DocumentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Document
         fields = '__all__'
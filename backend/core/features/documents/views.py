@@ -1,12 +1,37 @@
 from rest_framework import viewsets
 
+from core.features.activity.audit import AuditMixin
+from core.features.common.filters import ListFilters
+from core.features.common.views import (
+    AsyncReadMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    FastListMixin,
+    SparseQuerysetMixin,
+)
+
 from .models import Document
 from .serializers import DocumentSerializer
 
 
-class DocumentViewSet(viewsets.ModelViewSet):
+class DocumentViewSet(
+    AuditMixin,
+    CachedResponseMixin,
+    AsyncReadMixin,
+    ExportMixin,
+    SparseQuerysetMixin,
+    ConditionalGetMixin,
+    FastListMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Document.objects.all()
     serializer_class = DocumentSerializer
+    list_filters = ListFilters(
+        Document,
+        ranges=['uploaded_at'],
+        ordering=['uploaded_at'],
+    )
 
     def get_queryset(self):
         queryset = Document.objects.select_related('project').all()
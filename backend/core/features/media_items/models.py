@@ -20,6 +20,9 @@ class MediaItem(TimeStampedModel):
 
     class Meta:
         ordering = ['-captured_at']
+        indexes = [
+            models.Index(fields=['project', '-captured_at'], name='media_project_captured_idx'),
+        ]
 
     def __str__(self) -> str:
         return f'{self.project_id} · {self.title}'
@@ -1,8 +1,10 @@
 from rest_framework import serializers
+
+from core.features.common.serializers import SparseFieldsMixin
 from .models import MediaItem
 
 
-class MediaItemSerializer(serializers.ModelSerializer):
+class MediaItemSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = MediaItem
         fields = '__all__'
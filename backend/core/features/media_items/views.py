@@ -1,12 +1,37 @@
 from rest_framework import viewsets
 
+from core.features.activity.audit import AuditMixin
+from core.features.common.filters import ListFilters
+from core.features.common.views import (
+    AsyncReadMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    FastListMixin,
+    SparseQuerysetMixin,
+)
+
 from .models import MediaItem
 from .serializers import MediaItemSerializer
 
 
-class MediaItemViewSet(viewsets.ModelViewSet):
+class MediaItemViewSet(
+    AuditMixin,
+    CachedResponseMixin,
+    AsyncReadMixin,
+    ExportMixin,
+    SparseQuerysetMixin,
+    ConditionalGetMixin,
+    FastListMixin,
+    viewsets.ModelViewSet,
+):
     queryset = MediaItem.objects.all()
     serializer_class = MediaItemSerializer
+    list_filters = ListFilters(
+        MediaItem,
+        ranges=['captured_at'],
+        ordering=['captured_at'],
+    )
 
     def get_queryset(self):
         queryset = MediaItem.objects.select_related('project').all()
@@ -0,0 +1,71 @@
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection
+
+from .recorder import QueryCounter
+
+# Per-action query budgets; viewsets override entries with ``query_budgets``.
+DEFAULT_QUERY_BUDGETS = {
+    'list': 3,
+    'retrieve': 1,
+}
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@contextmanager
+def assert_max_queries(limit: int, label: str = 'block'):
+    """Fail with the executed SQL if the block runs more than ``limit`` queries.
+
+    Counts through an execute wrapper rather than ``connection.queries``,
+    which each test-client request clears.
+    """
+    counter = QueryCounter(keep_sql=True)
+    with connection.execute_wrapper(counter):
+        yield counter
+    if counter.queries > limit:
+        statements = '\n'.join(f'  {sql}' for sql in counter.statements)
+        raise QueryBudgetExceeded(f'{label} ran {counter.queries} queries (budget {limit}):\n{statements}')
+
+
+def _budget(viewset, action: str) -> int:
+    return {**DEFAULT_QUERY_BUDGETS, **getattr(viewset, 'query_budgets', {})}[action]
+
+
+def check_viewset_budgets(client, registry) -> list[tuple[str, int, int]]:
+    """Run every list and detail endpoint in a router registry against its budget.
+
+    Lists are fetched with a one-row page and a full page. The query count
+    must not grow with the page, which is what an N+1 looks like, so both
+    runs must fit the same budget. Every request must answer 200, since an
+    error response fits a budget without doing the work. Returns ``(label, queries, budget)`` rows
+    and raises QueryBudgetExceeded on the first overrun.
+    """
+    results = []
+    largest = settings.REST_FRAMEWORK['MAX_PAGE_SIZE']
+    for prefix, viewset, _ in registry:
+        budget = _budget(viewset, 'list')
+        urls = [f'/api/{prefix}/?page_size=1', f'/api/{prefix}/?page_size={largest}']
+        if getattr(viewset, 'cursor_ordering', None):
+            urls.append(f'/api/{prefix}/?pagination=cursor&page_size={largest}')
+        for url in urls:
+            with assert_max_queries(budget, f'GET {url}') as captured:
+                response = client.get(url)
+            if response.status_code != 200:
+                raise QueryBudgetExceeded(f'GET {url} returned {response.status_code}.')
+            results.append((f'GET {url}', captured.queries, budget))
+
+        pk = viewset.queryset.model._default_manager.values_list('pk', flat=True).first()
+        if pk is None or not hasattr(viewset, 'retrieve'):
+            continue
+        url = f'/api/{prefix}/{pk}/'
+        budget = _budget(viewset, 'retrieve')
+        with assert_max_queries(budget, f'GET {url}') as captured:
+            response = client.get(url)
+        if response.status_code != 200:
+            raise QueryBudgetExceeded(f'GET {url} returned {response.status_code}.')
+        results.append((f'GET {url}', captured.queries, budget))
+    return results
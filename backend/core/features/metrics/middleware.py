@@ -0,0 +1,115 @@
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+from .recorder import QueryCounter, record
+
+
+class RequestMetricsMiddleware:
+    """Records query count, DB time, serializer time and bytes per request.
+
+    Timings are split at the DRF view boundary. ``serialize`` is time inside
+    the view that was not spent in SQL, which for list and detail endpoints
+    is the serializer pass. ``render`` is the renderer turning data into
+    bytes. They are sent back as a ``Server-Timing`` header and kept per
+    route for ``/api/_metrics/``.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not settings.REQUEST_METRICS_ENABLED:
+            return self.get_response(request)
+
+        counter, started = self._start(request)
+        with ExitStack() as stack:
+            self._count_queries(stack, counter)
+            response = self.get_response(request)
+        return self._finish(request, response, counter, started)
+
+    async def __acall__(self, request):
+        if not settings.REQUEST_METRICS_ENABLED:
+            return await self.get_response(request)
+
+        counter, started = self._start(request)
+        # Async ORM calls run on this request's sync thread, whose connections
+        # are not the event loop's, so the counters are installed there.
+        stack = ExitStack()
+        await sync_to_async(self._count_queries)(stack, counter)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self._finish(request, response, counter, started)
+
+    def _start(self, request):
+        counter = QueryCounter()
+        request._metrics = {'counter': counter}
+        return counter, time.perf_counter()
+
+    def _count_queries(self, stack, counter) -> None:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(counter))
+
+    def _finish(self, request, response, counter, started):
+        finished = time.perf_counter()
+        marks = request._metrics
+        total_ms = (finished - started) * 1000
+        db_ms = counter.seconds * 1000
+        serialize_ms = render_ms = 0.0
+        if 'view_end' in marks:
+            view_ms = (marks['view_end'] - marks['view_start']) * 1000
+            view_db_ms = (marks['view_end_db'] - marks['view_start_db']) * 1000
+            serialize_ms = max(view_ms - view_db_ms, 0.0)
+            render_ms = (finished - marks['view_end']) * 1000
+        size = 0 if response.streaming else len(response.content)
+
+        response['Server-Timing'] = ', '.join(
+            [
+                f'db;dur={db_ms:.1f};desc="{counter.queries} queries"',
+                f'serialize;dur={serialize_ms:.1f}',
+                f'render;dur={render_ms:.1f}',
+                f'total;dur={total_ms:.1f}',
+            ]
+        )
+        match = request.resolver_match
+        if match is not None:
+            record(
+                match.route,
+                request.method,
+                {
+                    'queries': counter.queries,
+                    'db_ms': db_ms,
+                    'serialize_ms': serialize_ms,
+                    'render_ms': render_ms,
+                    'total_ms': total_ms,
+                    'bytes': size,
+                },
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        marks = getattr(request, '_metrics', None)
+        if marks is not None:
+            marks['view_start'] = time.perf_counter()
+            marks['view_start_db'] = marks['counter'].seconds
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered after this hook, so it marks the point
+        # where the view has built its data and the renderer takes over.
+        marks = getattr(request, '_metrics', None)
+        if marks is not None and 'view_start' in marks:
+            marks['view_end'] = time.perf_counter()
+            marks['view_end_db'] = marks['counter'].seconds
+        return response
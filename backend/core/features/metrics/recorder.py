@@ -0,0 +1,80 @@
+import os
+import re
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+
+# Per-sample fields reported with percentiles, in output order.
+MEASURES = ('queries', 'db_ms', 'serialize_ms', 'render_ms', 'total_ms', 'bytes')
+
+_GROUP = re.compile(r'\(\?P<(\w+)>[^)]*\)')
+
+_lock = threading.Lock()
+_samples = {}
+
+
+class QueryCounter:
+    """``execute_wrapper`` that counts queries and the time spent running them."""
+
+    def __init__(self, keep_sql: bool = False):
+        self.queries = 0
+        self.seconds = 0.0
+        self.statements = [] if keep_sql else None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.seconds += time.perf_counter() - started
+            if self.statements is not None:
+                self.statements.append(sql)
+
+
+def route_label(route: str) -> str:
+    """``^budgets/(?P<pk>[^/.]+)/$`` -> ``/budgets/<pk>/``."""
+    return '/' + _GROUP.sub(r'<\1>', route).replace('^', '').replace('$', '')
+
+
+def record(route: str, method: str, sample: dict) -> None:
+    """Keep the latest REQUEST_METRICS_SAMPLES samples for ``method route``."""
+    key = (route_label(route), method)
+    with _lock:
+        samples = _samples.get(key)
+        if samples is None:
+            samples = _samples[key] = deque(maxlen=settings.REQUEST_METRICS_SAMPLES)
+        samples.append(sample)
+
+
+def reset() -> None:
+    with _lock:
+        _samples.clear()
+
+
+def _percentile(ordered: list, fraction: float):
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+
+def report() -> dict:
+    """Percentiles per route over the samples this worker process has kept.
+
+    Each worker records its own requests, so the report carries the pid.
+    """
+    with _lock:
+        snapshot = {key: list(samples) for key, samples in _samples.items()}
+    routes = []
+    for (route, method), samples in sorted(snapshot.items()):
+        entry = {'route': route, 'method': method, 'requests': len(samples)}
+        for measure in MEASURES:
+            ordered = sorted(sample[measure] for sample in samples)
+            entry[measure] = {
+                'p50': round(_percentile(ordered, 0.5), 2),
+                'p95': round(_percentile(ordered, 0.95), 2),
+                'p99': round(_percentile(ordered, 0.99), 2),
+                'max': round(ordered[-1], 2),
+            }
+        routes.append(entry)
+    return {'pid': os.getpid(), 'routes': routes}
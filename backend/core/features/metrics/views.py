@@ -0,0 +1,21 @@
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.features.common.cache import reset_stats, stats_report
+
+from .recorder import report, reset
+
+
+class MetricsView(APIView):
+    """Per-route request percentiles and cache hit rates for this worker. DELETE clears them."""
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response({**report(), 'cache': stats_report()})
+
+    def delete(self, request):
+        reset()
+        reset_stats()
+        return Response(status=status.HTTP_204_NO_CONTENT)
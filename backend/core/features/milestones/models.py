@@ -20,6 +20,10 @@ class Milestone(TimeStampedModel):
 
     class Meta:
         ordering = ['planned_date']
+        indexes = [
+            models.Index(fields=['project', 'planned_date'], name='milestone_project_planned_idx'),
+            models.Index(fields=['status', 'project'], name='milestone_status_project_idx'),
+        ]
 
     def __str__(self) -> str:
         return f'{self.project_id} · {self.name}'
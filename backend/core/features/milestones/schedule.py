@@ -0,0 +1,211 @@
+from datetime import date
+
+import numpy as np
+from django.db.models import CharField, Value
+from django.db.models.functions import Cast, Coalesce
+
+from core.features.common.fastpath import fetch_records
+from core.features.projects.models import Project
+
+from .models import Milestone
+
+# Dates are read as ISO text, which NumPy parses in C; date objects would
+# cost a Python conversion each, on the way in and again into datetime64.
+COLUMNS = (
+    'project_id',
+    'id',
+    Cast('planned_date', CharField()),
+    Coalesce(Cast('actual_date', CharField()), Value('')),
+    'status',
+    'percent_complete',
+)
+RECORD = [
+    ('project_id', 'U32'),
+    ('id', 'U32'),
+    ('planned_date', 'U10'),
+    ('actual_date', 'U10'),
+    ('status', 'U20'),
+    ('percent_complete', 'f8'),
+]
+# datetime64's not-a-time, as the int64 day number it compares as.
+NAT = np.datetime64('NaT', 'D').astype(np.int64)
+
+
+def schedule_health(queryset, today: date) -> dict:
+    """Slippage, overdue counts and an earned-schedule forecast per project for ``queryset``'s milestones.
+
+    One query reads the milestones into a record array and one sort by (project,
+    planned date) lays every project's baseline out in order; all metrics
+    are then group reductions over that order, so Python never loops over
+    milestones.
+
+    - Slippage is how far a milestone finished, or is still open, past its
+      planned date; the critical milestone is the one slipping most.
+    - Earned schedule counts done milestones as one and open ones by
+      ``percent_complete``, then finds the date at which the baseline had
+      planned that much. Its ratio to the time elapsed since the project
+      started is the schedule performance index, and the remaining planned
+      duration divided by that index forecasts completion.
+    """
+    records = fetch_records(queryset.select_related(None).order_by().values_list(*COLUMNS), RECORD)
+    payload = {'as_of': today.isoformat()}
+    if not len(records):
+        payload.update(totals=None, projects=[])
+        return payload
+
+    projects, groups = np.unique(records['project_id'], return_inverse=True)
+    planned = _days(records['planned_date'])
+    order = np.lexsort((planned, groups))
+    records, groups, planned = records[order], groups[order], planned[order]
+    milestone_ids = records['id']
+    actual = _days(records['actual_date'])
+    status = records['status']
+    percent = records['percent_complete']
+
+    now = np.datetime64(today, 'D').astype(np.int64)
+    done = status == Milestone.Status.DONE
+    finished = actual != NAT
+    # Done without a recorded date counts as on time; open ones slip while today is past plan.
+    finish = np.where(finished, actual, np.where(done, planned, np.maximum(now, planned)))
+    slip = np.maximum(finish - planned, 0)
+    values = {
+        'milestones': np.ones(len(planned)),
+        'done': done,
+        'at_risk': status == Milestone.Status.AT_RISK,
+        'overdue': ~done & (planned < now),
+        'done_late': done & finished & (actual > planned),
+        'slippage_days': slip,
+        'earned': np.where(done, 1.0, np.clip(percent, 0, 100) / 100),
+    }
+
+    counts = np.bincount(groups, minlength=len(projects))
+    starts = np.cumsum(counts) - counts
+    sums = {name: np.add.reduceat(column.astype(float), starts) for name, column in values.items()}
+    max_slip = np.maximum.reduceat(slip, starts)
+    # First milestone, in planned order, of each project's largest slip.
+    positions = np.arange(len(slip))
+    critical = np.minimum.reduceat(np.where(slip == max_slip[groups], positions, len(slip)), starts)
+
+    schedule = dict(Project.objects.filter(pk__in=projects.tolist()).values_list('pk', 'start_date'))
+    project_start = np.minimum(
+        _days(np.array([schedule[pk].isoformat() for pk in projects.tolist()])), planned[starts]
+    )
+    rows = _earned_schedule(planned, starts, counts, sums['earned'], project_start, now)
+    rows['forecast_completion'] = np.where(
+        sums['earned'] >= counts, np.maximum.reduceat(finish, starts), rows['forecast_completion']
+    )
+
+    metrics = {
+        'milestones': counts,
+        'done': sums['done'],
+        'at_risk': sums['at_risk'],
+        'overdue': sums['overdue'],
+        'done_late': sums['done_late'],
+        'slippage_days': sums['slippage_days'],
+        'max_slippage_days': max_slip,
+    }
+    payload['totals'] = _totals(metrics, rows, str(milestone_ids[critical[np.argmax(max_slip)]]))
+    counted = {name: column.astype(np.int64).tolist() for name, column in metrics.items()}
+    rendered = _rendered(rows, counts)
+    critical_ids = np.where(max_slip > 0, milestone_ids[critical], '').tolist()
+    payload['projects'] = [
+        {
+            'project_id': project_id,
+            **{name: column[index] for name, column in counted.items()},
+            'critical_milestone': critical_ids[index] or None,
+            **{name: column[index] for name, column in rendered.items()},
+        }
+        for index, project_id in enumerate(projects.tolist())
+    ]
+    return payload
+
+
+def _days(values: np.ndarray) -> np.ndarray:
+    """ISO date strings as int64 days since the epoch, NAT for empty ones."""
+    return values.astype('datetime64[D]').astype(np.int64)
+
+
+def _earned_schedule(
+    planned: np.ndarray,
+    starts: np.ndarray,
+    counts: np.ndarray,
+    earned: np.ndarray,
+    project_start: np.ndarray,
+    now: int,
+) -> dict:
+    """Per-project earned schedule, performance index and forecast completion, in days.
+
+    The baseline reaches k of n milestones on the k-th planned date, linearly
+    between dates, starting from the project start at zero; earned schedule
+    is the point on it where the earned milestones fall.
+    """
+    reached = np.clip(np.floor(earned).astype(np.int64), 0, counts)
+    fraction = earned - reached
+    previous = np.where(reached > 0, planned[starts + np.maximum(reached - 1, 0)], project_start)
+    following = planned[starts + np.minimum(reached, counts - 1)]
+    following = np.where(reached < counts, following, previous)
+    earned_date = previous + fraction * (following - previous)
+
+    planned_completion = planned[starts + counts - 1]
+    planned_duration = planned_completion - project_start
+    earned_schedule = earned_date - project_start
+    actual_time = (now - project_start).astype(float)
+    index = np.full(len(counts), np.nan)
+    np.divide(earned_schedule, actual_time, out=index, where=actual_time > 0)
+    forecast = np.full(len(counts), np.nan)
+    progressing = index > 0
+    forecast[progressing] = now + (planned_duration - earned_schedule)[progressing] / index[progressing]
+    # Not started yet: the baseline is the forecast.
+    forecast = np.where(actual_time <= 0, planned_completion, forecast)
+    return {
+        'planned_completion': planned_completion.astype(float),
+        'forecast_completion': forecast,
+        'earned_schedule_days': earned_schedule,
+        'actual_time_days': np.maximum(actual_time, 0),
+        'schedule_performance_index': index,
+        'percent_complete': earned,
+    }
+
+
+def _rendered(rows: dict, counts: np.ndarray) -> dict:
+    """The earned-schedule columns as JSON-ready lists: ISO dates, rounded floats, None where undefined."""
+    forecast = np.round(rows['forecast_completion'])
+    return {
+        'percent_complete': _rounded(rows['percent_complete'] / counts * 100),
+        'planned_completion': _iso(rows['planned_completion']),
+        'forecast_completion': _iso(forecast),
+        'forecast_slip_days': _rounded(forecast - rows['planned_completion'], 0),
+        'earned_schedule_days': _rounded(rows['earned_schedule_days'], 1),
+        'actual_time_days': _rounded(rows['actual_time_days'], 0),
+        'schedule_performance_index': _rounded(rows['schedule_performance_index'], 3),
+    }
+
+
+def _totals(metrics: dict, rows: dict, critical_milestone: str) -> dict:
+    """Portfolio figures: sums of counts, the worst slip, and time-weighted schedule performance."""
+    started = rows['actual_time_days'] > 0
+    elapsed = rows['actual_time_days'][started].sum()
+    forecast = rows['forecast_completion']
+    return {
+        **{name: int(column.sum()) for name, column in metrics.items() if name != 'max_slippage_days'},
+        'max_slippage_days': int(metrics['max_slippage_days'].max()),
+        'critical_milestone': critical_milestone if metrics['max_slippage_days'].max() > 0 else None,
+        'percent_complete': _rounded(np.array([rows['percent_complete'].sum() / metrics['milestones'].sum() * 100]))[0],
+        'planned_completion': _iso(np.array([rows['planned_completion'].max()]))[0],
+        # Unknown if any project's forecast is.
+        'forecast_completion': _iso(np.array([np.round(forecast.max())]))[0],
+        'schedule_performance_index': (
+            _rounded(np.array([rows['earned_schedule_days'][started].sum() / elapsed]), 3)[0] if elapsed else None
+        ),
+    }
+
+
+def _iso(days: np.ndarray) -> list[str | None]:
+    dates = np.where(np.isnan(days), NAT, np.nan_to_num(days)).astype(np.int64).astype('datetime64[D]')
+    return [None if value == 'NaT' else value for value in dates.astype(str).tolist()]
+
+
+def _rounded(column: np.ndarray, decimals: int = 1) -> list[float | int | None]:
+    """Rounded values for JSON, whole numbers at zero decimals, None where undefined."""
+    cast = int if decimals == 0 else float
+    return [None if value != value else cast(value) for value in np.round(column, decimals).tolist()]
@@ -1,8 +1,11 @@
 from rest_framework import serializers
+
+from core.features.common.serializers import BulkListSerializer, BulkModelSerializer, SparseFieldsMixin
+
 from .models import Milestone
 
 
-class MilestoneSerializer(serializers.ModelSerializer):
+class MilestoneSerializer(SparseFieldsMixin, BulkModelSerializer):
     def validate_percent_complete(self, value):
         if value < 0 or value > 100:
             raise serializers.ValidationError('percent_complete must be between 0 and 100.')
@@ -11,3 +14,4 @@ class MilestoneSerializer(serializers.ModelSerializer):
     class Meta:
         model = Milestone
         fields = '__all__'
+        list_serializer_class = BulkListSerializer
@@ -1,12 +1,46 @@
+from django.utils import timezone
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from core.features.activity.audit import AuditMixin
+from core.features.common import cache as api_cache
+from core.features.common.filters import ListFilters
+from core.features.common.views import (
+    AsyncReadMixin,
+    BulkWriteMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    FastListMixin,
+    SparseQuerysetMixin,
+)
+from core.features.projects.models import Project
 
 from .models import Milestone
+from .schedule import schedule_health
 from .serializers import MilestoneSerializer
 
 
-class MilestoneViewSet(viewsets.ModelViewSet):
+class MilestoneViewSet(
+    AuditMixin,
+    CachedResponseMixin,
+    AsyncReadMixin,
+    BulkWriteMixin,
+    ExportMixin,
+    SparseQuerysetMixin,
+    ConditionalGetMixin,
+    FastListMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Milestone.objects.all()
     serializer_class = MilestoneSerializer
+    list_filters = ListFilters(
+        Milestone,
+        choices=['status'],
+        ranges=['planned_date'],
+        ordering=['planned_date'],
+    )
 
     def get_queryset(self):
         queryset = Milestone.objects.select_related('project').all()
@@ -14,3 +48,19 @@ class MilestoneViewSet(viewsets.ModelViewSet):
         if project_id:
             queryset = queryset.filter(project_id=project_id)
         return queryset
+
+    @action(detail=False, methods=['get'], url_path='schedule-health')
+    def schedule_health(self, request):
+        """Slippage, overdue counts and earned-schedule forecasts per project, with portfolio totals.
+
+        Honours ``?project_id=`` but not the list filters: the forecast needs
+        every milestone of a project. Cached until a milestone of the scope,
+        or a project's start date, changes.
+        """
+        project_id = request.query_params.get('project_id') or None
+        project = api_cache.row_tag(Project, project_id) if project_id else api_cache.model_tag(Project)
+        tags = [*self.list_cache_tags(request), project]
+        return self.cached_response(request, tags, self._schedule_health)
+
+    def _schedule_health(self, request):
+        return Response(schedule_health(self.get_queryset(), timezone.localdate()))
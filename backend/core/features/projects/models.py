@@ -21,6 +21,29 @@ class Project(TimeStampedModel):
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['status'], name='project_status_idx'),
+        ]
 
     def __str__(self) -> str:
         return self.name
+
+
+class ProgramSummary(TimeStampedModel):
+    """Materialized portfolio totals, kept current by write hooks."""
+
+    SINGLETON_ID = 1
+
+    id = models.PositiveSmallIntegerField(primary_key=True, default=SINGLETON_ID)
+    total_original_budget = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    total_variations = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    total_forecast_cost = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    total_actual_spend = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    milestones_total = models.IntegerField(default=0)
+    milestones_completed = models.IntegerField(default=0)
+    open_risks = models.IntegerField(default=0)
+    pending_approvals = models.IntegerField(default=0)
+    version = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f'Program summary v{self.version}'
@@ -0,0 +1,90 @@
+import json
+
+from django.db.models import Count, Q, Sum
+
+from core.features.approvals.models import Approval
+from core.features.budgets.models import BudgetItem
+from core.features.milestones.models import Milestone
+from core.features.risks.models import Risk
+
+from .models import Project
+from .summary import MONEY_FIELDS, totals_payload
+
+# group_by value -> (Project column, column reached from a child row)
+GROUPINGS = {
+    'project': ('id', 'project_id'),
+    'program_name': ('program_name', 'project__program_name'),
+    'phase': ('phase', 'project__phase'),
+}
+
+CHUNK_SIZE = 2000
+GROUPS_PER_WRITE = 100
+
+
+def _child_rollups(group_key: str):
+    """One grouped aggregate per model, each ordered by the group key."""
+    return [
+        BudgetItem.objects.values(group_key).annotate(
+            **{total: Sum(field) for total, field in MONEY_FIELDS.items()}
+        ),
+        Milestone.objects.values(group_key).annotate(
+            milestones_total=Count('id'),
+            milestones_completed=Count('id', filter=Q(status=Milestone.Status.DONE)),
+        ),
+        Risk.objects.values(group_key).annotate(
+            open_risks=Count('id', filter=~Q(status=Risk.Status.CLOSED)),
+        ),
+        Approval.objects.values(group_key).annotate(
+            pending_approvals=Count('id', filter=Q(status=Approval.Status.PENDING)),
+        ),
+    ]
+
+
+def _driver(group_by: str):
+    project_key, _ = GROUPINGS[group_by]
+    if group_by == 'project':
+        return Project.objects.values('id', 'name', 'program_name', 'phase').order_by('id')
+    return Project.objects.values(project_key).annotate(project_count=Count('id')).order_by(project_key)
+
+
+def iter_rollups(group_by: str):
+    """Yield one payload per group by merge-joining the ordered aggregates.
+
+    Every group key originates from a project row, so the project query drives
+    the merge and each child aggregate cursor is advanced in lockstep. Memory
+    stays flat however many groups there are.
+    """
+    project_key, child_key = GROUPINGS[group_by]
+    cursors = []
+    for queryset in _child_rollups(child_key):
+        rows = iter(queryset.order_by(child_key).iterator(chunk_size=CHUNK_SIZE))
+        cursors.append([rows, next(rows, None)])
+
+    for group in _driver(group_by).iterator(chunk_size=CHUNK_SIZE):
+        key = group[project_key]
+        totals = {}
+        for cursor in cursors:
+            row = cursor[1]
+            if row is not None and row[child_key] == key:
+                totals.update({name: value for name, value in row.items() if name != child_key})
+                cursor[1] = next(cursor[0], None)
+        payload = {'key': key}
+        payload.update({name: value for name, value in group.items() if name != project_key})
+        payload.update(totals_payload(totals))
+        yield payload
+
+
+def stream_rollups(group_by: str):
+    """Yield the JSON document for a grouped summary in bounded chunks."""
+    yield f'{{"group_by": {json.dumps(group_by)}, "groups": ['
+    buffer = []
+    first = True
+    for payload in iter_rollups(group_by):
+        buffer.append(('' if first else ',') + json.dumps(payload))
+        first = False
+        if len(buffer) >= GROUPS_PER_WRITE:
+            yield ''.join(buffer)
+            buffer = []
+    if buffer:
+        yield ''.join(buffer)
+    yield ']}'
@@ -1,8 +1,10 @@
 from rest_framework import serializers
+
+from core.features.common.serializers import SparseFieldsMixin
 from .models import Project
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Project
         fields = '__all__'
@@ -0,0 +1,62 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from core.features.common.signals import in_bulk_write, rows_bulk_changed
+
+from .summary import CONTRIBUTIONS, record_changes, schedule_rebuild
+
+
+def _values(instance, fields: list[str]) -> dict:
+    return {field: getattr(instance, field) for field in fields}
+
+
+def _previous_values(instance, fields: list[str]) -> dict | None:
+    loaded = instance.loaded_values()
+    if loaded is not None and all(field in loaded for field in fields):
+        return {field: loaded[field] for field in fields}
+    return type(instance).objects.filter(pk=instance.pk).values(*fields).first()
+
+
+def capture_previous(sender, instance, raw=False, **kwargs):
+    if raw or in_bulk_write(sender):
+        return
+    _, fields = CONTRIBUTIONS[sender]
+    if instance._state.adding:
+        instance._summary_previous = None
+    else:
+        instance._summary_previous = _previous_values(instance, fields)
+
+
+def summarize_save(sender, instance, created, raw=False, **kwargs):
+    if in_bulk_write(sender):
+        return
+    if raw:
+        schedule_rebuild()
+        return
+    _, fields = CONTRIBUTIONS[sender]
+    previous = None if created else getattr(instance, '_summary_previous', None)
+    if not created and previous is None:
+        schedule_rebuild()
+    else:
+        record_changes(sender, [(previous, _values(instance, fields))])
+    instance.snapshot_loaded_values()
+
+
+def summarize_delete(sender, instance, **kwargs):
+    if in_bulk_write(sender):
+        return
+    _, fields = CONTRIBUTIONS[sender]
+    record_changes(sender, [(_values(instance, fields), None)])
+
+
+def summarize_bulk(sender, changes, **kwargs):
+    if sender in CONTRIBUTIONS:
+        record_changes(sender, changes)
+
+
+def connect_summary_signals() -> None:
+    for model in CONTRIBUTIONS:
+        uid = f'program-summary-{model._meta.model_name}'
+        pre_save.connect(capture_previous, sender=model, dispatch_uid=uid)
+        post_save.connect(summarize_save, sender=model, dispatch_uid=uid)
+        post_delete.connect(summarize_delete, sender=model, dispatch_uid=uid)
+    rows_bulk_changed.connect(summarize_bulk, dispatch_uid='program-summary-bulk')
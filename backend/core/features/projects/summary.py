@@ -0,0 +1,207 @@
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from core.features.approvals.models import Approval
+from core.features.common.cache import invalidate_all, record
+from core.features.budgets.models import BudgetItem
+from core.features.milestones.models import Milestone
+from core.features.risks.models import Risk
+
+from .models import ProgramSummary
+
+SUMMARY_CACHE_KEY = 'program-summary'
+CENTS = Decimal('0.01')
+
+MONEY_FIELDS = {
+    'total_original_budget': 'original_budget',
+    'total_variations': 'approved_variations',
+    'total_forecast_cost': 'forecast_cost',
+    'total_actual_spend': 'actual_spent',
+}
+
+
+def _money(value) -> Decimal:
+    if value is None:
+        return Decimal('0')
+    # SQLite sums decimals as floats, so round back to cents.
+    return (value if isinstance(value, Decimal) else Decimal(str(value))).quantize(CENTS)
+
+
+def _budget_contribution(values: dict) -> dict:
+    return {total: _money(values.get(field)) for total, field in MONEY_FIELDS.items()}
+
+
+def _milestone_contribution(values: dict) -> dict:
+    return {
+        'milestones_total': 1,
+        'milestones_completed': int(values.get('status') == Milestone.Status.DONE),
+    }
+
+
+def _risk_contribution(values: dict) -> dict:
+    return {'open_risks': int(values.get('status') != Risk.Status.CLOSED)}
+
+
+def _approval_contribution(values: dict) -> dict:
+    return {'pending_approvals': int(values.get('status') == Approval.Status.PENDING)}
+
+
+CONTRIBUTIONS = {
+    BudgetItem: (_budget_contribution, list(MONEY_FIELDS.values())),
+    Milestone: (_milestone_contribution, ['status']),
+    Risk: (_risk_contribution, ['status']),
+    Approval: (_approval_contribution, ['status']),
+}
+
+
+LIVE_FIELDS = [
+    *MONEY_FIELDS,
+    'milestones_total',
+    'milestones_completed',
+    'open_risks',
+    'pending_approvals',
+]
+
+
+def compute_live_totals() -> dict:
+    budget_totals = BudgetItem.objects.aggregate(
+        **{total: Sum(field) for total, field in MONEY_FIELDS.items()}
+    )
+    totals = {total: _money(value) for total, value in budget_totals.items()}
+    totals['milestones_total'] = Milestone.objects.count()
+    totals['milestones_completed'] = Milestone.objects.filter(status=Milestone.Status.DONE).count()
+    totals['open_risks'] = Risk.objects.exclude(status=Risk.Status.CLOSED).count()
+    totals['pending_approvals'] = Approval.objects.filter(status=Approval.Status.PENDING).count()
+    return totals
+
+
+def rebuild_summary() -> ProgramSummary:
+    with transaction.atomic():
+        summary, _ = ProgramSummary.objects.select_for_update().get_or_create(
+            id=ProgramSummary.SINGLETON_ID
+        )
+        for field, value in compute_live_totals().items():
+            setattr(summary, field, value)
+        summary.version += 1
+        summary.save()
+    transaction.on_commit(invalidate_summary_cache)
+    # Rebuilds follow writes that skipped the row hooks, which also keep the
+    # API cache in step.
+    invalidate_all()
+    return summary
+
+
+def check_consistency() -> dict:
+    """Return {field: (stored, live)} for every field that has drifted."""
+    summary = ProgramSummary.objects.filter(id=ProgramSummary.SINGLETON_ID).first()
+    live = compute_live_totals()
+    if summary is None:
+        return {field: (None, value) for field, value in live.items()}
+    return {
+        field: (getattr(summary, field), value)
+        for field, value in live.items()
+        if getattr(summary, field) != value
+    }
+
+
+def totals_payload(totals: dict) -> dict:
+    """Shape a totals mapping (missing keys count as zero) for the API."""
+    return {
+        'total_original_budget': float(totals.get('total_original_budget') or 0),
+        'total_variations': float(totals.get('total_variations') or 0),
+        'total_forecast_cost': float(totals.get('total_forecast_cost') or 0),
+        'total_actual_spend': float(totals.get('total_actual_spend') or 0),
+        'milestones_completed': {
+            'completed': totals.get('milestones_completed', 0),
+            'total': totals.get('milestones_total', 0),
+        },
+        'open_risks': totals.get('open_risks', 0),
+        'pending_approvals': totals.get('pending_approvals', 0),
+    }
+
+
+def summary_payload(summary: ProgramSummary) -> dict:
+    return totals_payload({field: getattr(summary, field) for field in LIVE_FIELDS})
+
+
+def get_summary() -> tuple[int, dict]:
+    """Return (version, payload), served from cache when possible."""
+    cached = cache.get(SUMMARY_CACHE_KEY)
+    if cached is not None:
+        record(SUMMARY_CACHE_KEY, 'hits')
+        return cached
+    record(SUMMARY_CACHE_KEY, 'misses')
+    summary = ProgramSummary.objects.filter(id=ProgramSummary.SINGLETON_ID).first()
+    if summary is None:
+        summary = rebuild_summary()
+    cached = (summary.version, summary_payload(summary))
+    cache.set(SUMMARY_CACHE_KEY, cached, settings.PROGRAM_SUMMARY_CACHE_TIMEOUT)
+    record(SUMMARY_CACHE_KEY, 'stores')
+    return cached
+
+
+async def aget_summary() -> tuple[int, dict]:
+    """``get_summary`` for async views."""
+    cached = await cache.aget(SUMMARY_CACHE_KEY)
+    if cached is not None:
+        record(SUMMARY_CACHE_KEY, 'hits')
+        return cached
+    record(SUMMARY_CACHE_KEY, 'misses')
+    summary = await ProgramSummary.objects.filter(id=ProgramSummary.SINGLETON_ID).afirst()
+    if summary is None:
+        summary = await sync_to_async(rebuild_summary)()
+    cached = (summary.version, summary_payload(summary))
+    await cache.aset(SUMMARY_CACHE_KEY, cached, settings.PROGRAM_SUMMARY_CACHE_TIMEOUT)
+    record(SUMMARY_CACHE_KEY, 'stores')
+    return cached
+
+
+def invalidate_summary_cache() -> None:
+    cache.delete(SUMMARY_CACHE_KEY)
+
+
+def apply_delta(delta: dict) -> None:
+    delta = {field: value for field, value in delta.items() if value}
+    if not delta:
+        return
+    updated = ProgramSummary.objects.filter(id=ProgramSummary.SINGLETON_ID).update(
+        version=F('version') + 1,
+        updated_at=timezone.now(),
+        **{field: F(field) + value for field, value in delta.items()},
+    )
+    if not updated:
+        # No materialized row yet; build it from the live tables once the
+        # surrounding write has committed.
+        schedule_rebuild()
+        return
+    transaction.on_commit(invalidate_summary_cache)
+
+
+def record_changes(model, changes: list[tuple[dict | None, dict | None]]) -> None:
+    """Fold rows' (previous, current) column values into the summary in one UPDATE."""
+    contribution, _ = CONTRIBUTIONS[model]
+    delta = {}
+    for previous, current in changes:
+        for field, value in (contribution(current) if current is not None else {}).items():
+            delta[field] = delta.get(field, 0) + value
+        for field, value in (contribution(previous) if previous is not None else {}).items():
+            delta[field] = delta.get(field, 0) - value
+    apply_delta(delta)
+
+
+def _rebuild_on_commit() -> None:
+    rebuild_summary()
+
+
+def schedule_rebuild() -> None:
+    """For writes that bypass row hooks (queryset.update, bulk paths, loaddata)."""
+    pending = transaction.get_connection().run_on_commit
+    if any(entry[1] is _rebuild_on_commit for entry in pending):
+        return
+    transaction.on_commit(_rebuild_on_commit)
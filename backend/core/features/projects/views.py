@@ -1,48 +1,91 @@
-from django.db.models import Sum
-from rest_framework import viewsets
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from core.features.approvals.models import Approval
-from core.features.budgets.models import BudgetItem
-from core.features.milestones.models import Milestone
-from core.features.risks.models import Risk
+from core.features.activity.audit import AuditMixin
+from core.features.common.cache import project_tag
+from core.features.common.filters import ListFilters
+from core.features.common.views import (
+    AsyncReadMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    FastListMixin,
+    SparseQuerysetMixin,
+)
 
 from .models import Project
+from .rollups import GROUPINGS, stream_rollups
 from .serializers import ProjectSerializer
+from .summary import aget_summary, get_summary
+from .workspace import annotate_counts, build_sections, requested_sections
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(
+    AuditMixin,
+    CachedResponseMixin,
+    AsyncReadMixin,
+    ExportMixin,
+    SparseQuerysetMixin,
+    ConditionalGetMixin,
+    FastListMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
+    list_filters = ListFilters(Project, choices=['status'])
+
+    @action(detail=True, methods=['get'])
+    def workspace(self, request, pk=None):
+        """Everything the project workspace page shows, in one response.
+
+        One query loads the project with a row count per section, then one
+        query per section loads its first rows. ``?sections=`` picks sections,
+        ``?limit=`` / ``?limit[<section>]=`` cap rows and ``?fields[<section>]=``
+        / ``?omit[<section>]=`` (``project`` included) narrow each section.
+        """
+        return self.cached_response(request, [project_tag(pk)], self._workspace, pk=pk)
+
+    def _workspace(self, request, pk=None):
+        sections = requested_sections(request)
+        project = get_object_or_404(annotate_counts(self.get_queryset(), sections), pk=pk)
+        self.check_object_permissions(request, project)
+        serializer = ProjectSerializer(project, context={'request': request, 'fieldset': 'project'})
+        return Response(
+            {
+                'project': serializer.data,
+                'sections': build_sections(project, request, sections),
+            }
+        )
 
 
 class ProgramSummaryView(APIView):
     def get(self, request):
-        budget_totals = BudgetItem.objects.aggregate(
-            total_original=Sum('original_budget'),
-            total_variations=Sum('approved_variations'),
-            total_forecast=Sum('forecast_cost'),
-            total_actual=Sum('actual_spent'),
-        )
-        milestones_total = Milestone.objects.count()
-        milestones_done = Milestone.objects.filter(status=Milestone.Status.DONE).count()
-        open_risks = Risk.objects.exclude(status=Risk.Status.CLOSED).count()
-        pending_approvals = Approval.objects.filter(status=Approval.Status.PENDING).count()
-
-        def safe_total(value):
-            return float(value or 0)
-
-        payload = {
-            'total_original_budget': safe_total(budget_totals['total_original']),
-            'total_variations': safe_total(budget_totals['total_variations']),
-            'total_forecast_cost': safe_total(budget_totals['total_forecast']),
-            'total_actual_spend': safe_total(budget_totals['total_actual']),
-            'milestones_completed': {
-                'completed': milestones_done,
-                'total': milestones_total,
-            },
-            'open_risks': open_risks,
-            'pending_approvals': pending_approvals,
-        }
-        return Response(payload)
+        group_by = request.query_params.get('group_by')
+        if group_by:
+            if group_by not in GROUPINGS:
+                return Response(
+                    {'detail': f'group_by must be one of: {", ".join(GROUPINGS)}.'},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            return StreamingHttpResponse(stream_rollups(group_by), content_type='application/json')
+
+        return self.summary_response(request, *get_summary())
+
+    async def async_get(self, request):
+        """The ungrouped summary through the async ORM and cache; rollups stream from the sync view."""
+        if request.query_params.get('group_by'):
+            return None
+        return self.summary_response(request, *await aget_summary())
+
+    def summary_response(self, request, version: int, payload: dict):
+        etag = f'"program-summary-{version}"'
+        if etag in request.headers.get('If-None-Match', ''):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(payload)
+        response['ETag'] = etag
+        return response
@@ -0,0 +1,90 @@
+from django.conf import settings
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from rest_framework import serializers
+
+from core.features.activity.serializers import ActivityLogSerializer
+from core.features.approvals.serializers import ApprovalSerializer
+from core.features.budgets.serializers import BudgetItemSerializer
+from core.features.common.fastpath import compile_row_encoder
+from core.features.documents.serializers import DocumentSerializer
+from core.features.media_items.serializers import MediaItemSerializer
+from core.features.milestones.serializers import MilestoneSerializer
+from core.features.rfis.serializers import RfiSerializer
+from core.features.risks.serializers import RiskSerializer
+
+# Section name -> serializer. Rows come back in each model's default ordering.
+SECTIONS = {
+    'budgets': BudgetItemSerializer,
+    'milestones': MilestoneSerializer,
+    'risks': RiskSerializer,
+    'rfis': RfiSerializer,
+    'documents': DocumentSerializer,
+    'media_items': MediaItemSerializer,
+    'approvals': ApprovalSerializer,
+    'activity': ActivityLogSerializer,
+}
+
+
+def requested_sections(request) -> list[str]:
+    """Parse ``?sections=`` (default: all) into an ordered list of section names."""
+    raw = request.query_params.get('sections')
+    if not raw:
+        return list(SECTIONS)
+    names = [name for name in raw.split(',') if name]
+    unknown = sorted(set(names) - set(SECTIONS))
+    if unknown:
+        raise serializers.ValidationError({'sections': [f'Unknown section(s): {", ".join(unknown)}.']})
+    return [name for name in SECTIONS if name in names]
+
+
+def section_limit(request, name: str) -> int:
+    """Rows to return for a section: ``?limit[<name>]=``, then ``?limit=``, then PAGE_SIZE."""
+    param = f'limit[{name}]' if f'limit[{name}]' in request.query_params else 'limit'
+    raw = request.query_params.get(param)
+    if raw is None:
+        return settings.REST_FRAMEWORK['PAGE_SIZE']
+    try:
+        limit = int(raw)
+    except ValueError:
+        limit = -1
+    if limit < 0:
+        raise serializers.ValidationError({param: ['Enter a whole number of zero or more.']})
+    return min(limit, settings.REST_FRAMEWORK['MAX_PAGE_SIZE'])
+
+
+def annotate_counts(queryset, sections: list[str]):
+    """Add ``<section>_count`` to each project as a correlated subquery."""
+    counts = {}
+    for name in sections:
+        model = SECTIONS[name].Meta.model
+        rows = (
+            model.objects.filter(project=OuterRef('pk'))
+            .order_by()
+            .values('project')
+            .annotate(total=Count('pk'))
+            .values('total')
+        )
+        counts[f'{name}_count'] = Coalesce(Subquery(rows, output_field=IntegerField()), Value(0))
+    return queryset.annotate(**counts)
+
+
+def build_sections(project, request, sections: list[str]) -> dict:
+    """Serialize the first rows of each section with one query per section."""
+    payload = {}
+    for name in sections:
+        serializer_class = SECTIONS[name]
+        context = {'request': request, 'fieldset': name}
+        limit = section_limit(request, name)
+        queryset = serializer_class.Meta.model.objects.filter(project_id=project.pk)
+        serializer = serializer_class(context=context)
+        compiled = compile_row_encoder(serializer) if settings.FAST_LIST_SERIALIZATION else None
+        if limit == 0:
+            results = []
+        elif compiled is not None:
+            columns, encode = compiled
+            results = [encode(row) for row in queryset.values_list(*columns)[:limit]]
+        else:
+            results = serializer_class(queryset[:limit], many=True, context=context).data
+        payload[name] = {'count': getattr(project, f'{name}_count'), 'results': results}
+    return payload
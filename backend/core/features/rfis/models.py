@@ -27,6 +27,11 @@ class Rfi(TimeStampedModel):
 
     class Meta:
         ordering = ['-raised_at']
+        indexes = [
+            models.Index(fields=['project', '-raised_at', '-id'], name='rfi_project_raised_idx'),
+            models.Index(fields=['project', 'due_date'], name='rfi_project_due_idx'),
+            models.Index(fields=['status', 'project'], name='rfi_status_project_idx'),
+        ]
 
     def __str__(self) -> str:
         return f'{self.project_id} · {self.rfi_number}'
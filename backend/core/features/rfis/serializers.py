@@ -1,8 +1,10 @@
 from rest_framework import serializers
+
+from core.features.common.serializers import SparseFieldsMixin
 from .models import Rfi
 
 
-class RfiSerializer(serializers.ModelSerializer):
+class RfiSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Rfi
         fields = '__all__'
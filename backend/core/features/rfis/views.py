@@ -1,12 +1,41 @@
 from rest_framework import viewsets
 
+from core.features.activity.audit import AuditMixin
+from core.features.common.filters import ListFilters
+from core.features.common.pagination import OptionalKeysetPagination
+from core.features.common.views import (
+    AsyncReadMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    FastListMixin,
+    SparseQuerysetMixin,
+)
+
 from .models import Rfi
 from .serializers import RfiSerializer
 
 
-class RfiViewSet(viewsets.ModelViewSet):
+class RfiViewSet(
+    AuditMixin,
+    CachedResponseMixin,
+    AsyncReadMixin,
+    ExportMixin,
+    SparseQuerysetMixin,
+    ConditionalGetMixin,
+    FastListMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Rfi.objects.all()
     serializer_class = RfiSerializer
+    pagination_class = OptionalKeysetPagination
+    cursor_ordering = ('-raised_at', '-id')
+    list_filters = ListFilters(
+        Rfi,
+        choices=['status'],
+        ranges=['raised_at', 'due_date'],
+        ordering=['raised_at', 'due_date'],
+    )
 
     def get_queryset(self):
         queryset = Rfi.objects.select_related('project').all()
@@ -28,6 +28,16 @@ class Risk(TimeStampedModel):
 
     class Meta:
         ordering = ['-rating', 'title']
+        indexes = [
+            models.Index(fields=['project', '-rating', 'title'], name='risk_project_rating_idx'),
+            models.Index(fields=['status', 'project'], name='risk_status_project_idx'),
+            models.Index(fields=['project', 'due_date'], name='risk_project_due_idx'),
+            models.Index(
+                fields=['project'],
+                condition=~models.Q(status='closed'),
+                name='risk_open_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         return f'{self.project_id} · {self.title}'
@@ -1,8 +1,11 @@
 from rest_framework import serializers
+
+from core.features.common.serializers import BulkListSerializer, BulkModelSerializer, SparseFieldsMixin
+
 from .models import Risk
 
 
-class RiskSerializer(serializers.ModelSerializer):
+class RiskSerializer(SparseFieldsMixin, BulkModelSerializer):
     def validate(self, attrs):
         likelihood = attrs.get('likelihood', getattr(self.instance, 'likelihood', None))
         impact = attrs.get('impact', getattr(self.instance, 'impact', None))
@@ -24,3 +27,4 @@ class RiskSerializer(serializers.ModelSerializer):
     class Meta:
         model = Risk
         fields = '__all__'
+        list_serializer_class = BulkListSerializer
@@ -1,12 +1,40 @@
 from rest_framework import viewsets
 
+from core.features.activity.audit import AuditMixin
+from core.features.common.filters import ListFilters
+from core.features.common.views import (
+    AsyncReadMixin,
+    BulkWriteMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    FastListMixin,
+    SparseQuerysetMixin,
+)
+
 from .models import Risk
 from .serializers import RiskSerializer
 
 
-class RiskViewSet(viewsets.ModelViewSet):
+class RiskViewSet(
+    AuditMixin,
+    CachedResponseMixin,
+    AsyncReadMixin,
+    BulkWriteMixin,
+    ExportMixin,
+    SparseQuerysetMixin,
+    ConditionalGetMixin,
+    FastListMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Risk.objects.all()
     serializer_class = RiskSerializer
+    list_filters = ListFilters(
+        Risk,
+        choices=['status'],
+        ranges=['rating', 'due_date'],
+        ordering=['rating', 'due_date'],
+    )
 
     def get_queryset(self):
         queryset = Risk.objects.select_related('project').all()
@@ -0,0 +1,117 @@
+from django.db import connection, transaction
+from django.db.models.signals import post_save
+
+from core.features.common.signals import in_bulk_write, row_values, rows_bulk_changed
+from core.features.documents.models import Document
+from core.features.projects.models import Project
+from core.features.rfis.models import Rfi
+from core.features.risks.models import Risk
+
+from .models import SearchEntry
+
+# entity type -> (model, title column, body columns). Titles rank above bodies.
+SOURCES = {
+    SearchEntry.EntityType.PROJECT: (Project, 'name', ('description',)),
+    SearchEntry.EntityType.RISK: (Risk, 'title', ('mitigation_plan',)),
+    SearchEntry.EntityType.RFI: (Rfi, 'title', ('question', 'response_summary')),
+    SearchEntry.EntityType.DOCUMENT: (Document, 'title', ('description',)),
+}
+ENTITY_TYPES = {model: entity_type for entity_type, (model, _, _) in SOURCES.items()}
+REBUILD_BATCH_SIZE = 5000
+
+# The FTS5 table the SQLite triggers keep in step with core_searchentry.
+FTS_TABLE = f'{SearchEntry._meta.db_table}_fts'
+# Text search configuration of the PostgreSQL column; changing it needs a migration.
+TEXT_SEARCH_CONFIG = 'english'
+
+
+def indexed_columns(model) -> list[str]:
+    _, title, body = SOURCES[ENTITY_TYPES[model]]
+    columns = [title, *body]
+    if model is not Project:
+        columns.append('project_id')
+    return columns
+
+
+def build_entry(model, row: dict) -> SearchEntry:
+    """The entry for a source row, given its column values keyed by attname."""
+    entity_type = ENTITY_TYPES[model]
+    _, title, body = SOURCES[entity_type]
+    pk = row[model._meta.pk.attname]
+    entry = SearchEntry(
+        entity_type=entity_type,
+        entity_id=pk,
+        project_id=pk if model is Project else row['project_id'],
+        title=row[title],
+        body='\n\n'.join(row[column] for column in body if row[column]),
+    )
+    if model is not Project:
+        setattr(entry, f'{model._meta.model_name}_id', pk)
+    return entry
+
+
+def index_rows(model, rows) -> None:
+    """Insert or refresh the entries of ``rows`` in one statement."""
+    entries = [build_entry(model, row) for row in rows]
+    if entries:
+        SearchEntry.objects.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=['entity_type', 'entity_id'],
+            update_fields=['project', 'title', 'body', 'updated_at'],
+        )
+
+
+def rebuild_index(report=None) -> int:
+    """Re-index every source row, for writes that bypass the hooks (loaders, raw SQL)."""
+    total = 0
+    with transaction.atomic():
+        SearchEntry.objects.all().delete()
+        for model in ENTITY_TYPES:
+            columns = [model._meta.pk.attname, *indexed_columns(model)]
+            rows = model.objects.values(*columns).iterator(chunk_size=REBUILD_BATCH_SIZE)
+            batch = []
+            for row in rows:
+                batch.append(build_entry(model, row))
+                if len(batch) >= REBUILD_BATCH_SIZE:
+                    SearchEntry.objects.bulk_create(batch)
+                    total += len(batch)
+                    batch = []
+            SearchEntry.objects.bulk_create(batch)
+            total += len(batch)
+            if report is not None:
+                report(model, total)
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+    return total
+
+
+def _changed(model, previous: dict | None, current: dict) -> bool:
+    if previous is None:
+        return True
+    return any(previous.get(column) != current[column] for column in indexed_columns(model))
+
+
+def _row_saved(sender, instance, **kwargs):
+    if in_bulk_write(sender):
+        return
+    current = row_values(instance)
+    # Most edits touch other fields; only re-index when the text moved.
+    if _changed(sender, instance.loaded_values(), current):
+        index_rows(sender, [current])
+
+
+def _rows_bulk_changed(sender, changes, **kwargs):
+    if sender in ENTITY_TYPES:
+        index_rows(
+            sender,
+            [current for previous, current in changes if current is not None and _changed(sender, previous, current)],
+        )
+
+
+def connect_search_signals() -> None:
+    """Keep entries current on saves and bulk writes; deletes cascade through the foreign keys."""
+    for model in ENTITY_TYPES:
+        post_save.connect(_row_saved, sender=model, dispatch_uid=f'search-{model._meta.model_name}')
+    rows_bulk_changed.connect(_rows_bulk_changed, dispatch_uid='search-bulk')
@@ -0,0 +1,44 @@
+from django.db import models
+
+from core.features.documents.models import Document
+from core.features.projects.models import Project
+from core.features.rfis.models import Rfi
+from core.features.risks.models import Risk
+
+
+class SearchEntry(models.Model):
+    """The searchable text of one project, risk, RFI or document.
+
+    The full-text index sits outside the ORM (see ``index``): a generated
+    ``tsvector`` column with a GIN index on PostgreSQL, an FTS5 table kept
+    in step by triggers on SQLite. Entries go away with their source row
+    through the foreign keys.
+    """
+
+    class EntityType(models.TextChoices):
+        PROJECT = 'project', 'Project'
+        RISK = 'risk', 'Risk'
+        RFI = 'rfi', 'RFI'
+        DOCUMENT = 'document', 'Document'
+
+    id = models.BigAutoField(primary_key=True)
+    entity_type = models.CharField(max_length=20, choices=EntityType.choices)
+    entity_id = models.CharField(max_length=32)
+    project = models.ForeignKey(Project, related_name='+', on_delete=models.CASCADE)
+    risk = models.ForeignKey(Risk, related_name='+', null=True, blank=True, on_delete=models.CASCADE)
+    rfi = models.ForeignKey(Rfi, related_name='+', null=True, blank=True, on_delete=models.CASCADE)
+    document = models.ForeignKey(Document, related_name='+', null=True, blank=True, on_delete=models.CASCADE)
+    title = models.CharField(max_length=200)
+    body = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['entity_type', 'entity_id'], name='search_entry_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['project', 'entity_type'], name='search_project_type_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.entity_type} {self.entity_id}'
@@ -0,0 +1,105 @@
+import re
+from functools import reduce
+from operator import and_
+
+from django.db import connection
+from django.db.models import Q
+
+from .index import FTS_TABLE, TEXT_SEARCH_CONFIG
+from .models import SearchEntry
+
+WORD = re.compile(r'\w+')
+
+
+class SearchResults:
+    """Entries matching ``text``, best first, computed a page at a time.
+
+    The paginator's ``count()`` is one COUNT over the text match, and each
+    page it slices is one ranked query with LIMIT and OFFSET, whose ids are
+    then loaded in bulk with their rank attached. The match is
+    ``websearch_to_tsquery`` with ``ts_rank_cd`` over the GIN-indexed
+    vector on PostgreSQL, and ``MATCH`` with ``bm25`` on SQLite's FTS5
+    table. Other databases fall back to ``icontains`` without ranking.
+    """
+
+    def __init__(self, text: str, entity_types: list[str] | None = None, project_id: str | None = None):
+        self.text = text
+        self.entity_types = entity_types
+        self.project_id = project_id
+        self.words = WORD.findall(text.lower())
+
+    def count(self) -> int:
+        if not self.words:
+            return 0
+        if connection.vendor not in ('postgresql', 'sqlite'):
+            return self._fallback().count()
+        match, params = self._match()
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) {match}', params)
+            return cursor.fetchone()[0]
+
+    def __getitem__(self, window: slice) -> list[SearchEntry]:
+        if not self.words:
+            return []
+        offset = window.start or 0
+        limit = window.stop - offset
+        if connection.vendor not in ('postgresql', 'sqlite'):
+            entries = list(self._fallback().order_by('entity_type', 'title', 'id')[offset:window.stop])
+            for entry in entries:
+                entry.rank = None
+            return entries
+
+        match, params = self._match()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT entry.id, {self._rank()} AS rank {match} ORDER BY rank DESC, entry.id LIMIT %s OFFSET %s',
+                [*params, limit, offset],
+            )
+            ranked = cursor.fetchall()
+        entries = SearchEntry.objects.in_bulk([pk for pk, _ in ranked])
+        results = []
+        for pk, rank in ranked:
+            entry = entries.get(pk)
+            if entry is not None:
+                entry.rank = rank
+                results.append(entry)
+        return results
+
+    def _match(self) -> tuple[str, list]:
+        """The FROM and WHERE clauses shared by the count and the page."""
+        quote = connection.ops.quote_name
+        entries = quote(SearchEntry._meta.db_table)
+        if connection.vendor == 'postgresql':
+            sql = (
+                f'FROM {entries} entry, websearch_to_tsquery(%s::regconfig, %s) query '
+                f'WHERE entry.search_vector @@ query'
+            )
+            params = [TEXT_SEARCH_CONFIG, self.text]
+        else:
+            fts = quote(FTS_TABLE)
+            sql = f'FROM {fts} JOIN {entries} entry ON entry.id = {fts}.rowid WHERE {fts} MATCH %s'
+            # Quoted terms, implicitly ANDed: user input never reaches the FTS5 query syntax.
+            params = [' '.join(f'"{word}"' for word in self.words)]
+        if self.entity_types:
+            sql += f' AND entry.entity_type IN ({", ".join(["%s"] * len(self.entity_types))})'
+            params.extend(self.entity_types)
+        if self.project_id:
+            sql += ' AND entry.project_id = %s'
+            params.append(self.project_id)
+        return sql, params
+
+    def _rank(self) -> str:
+        if connection.vendor == 'postgresql':
+            return 'ts_rank_cd(entry.search_vector, query)'
+        # bm25 is lower-is-better; weight title matches ten times body matches.
+        return f'-bm25({connection.ops.quote_name(FTS_TABLE)}, 10.0, 1.0)'
+
+    def _fallback(self):
+        queryset = SearchEntry.objects.filter(
+            reduce(and_, [Q(title__icontains=word) | Q(body__icontains=word) for word in self.words])
+        )
+        if self.entity_types:
+            queryset = queryset.filter(entity_type__in=self.entity_types)
+        if self.project_id:
+            queryset = queryset.filter(project_id=self.project_id)
+        return queryset
@@ -0,0 +1,23 @@
+from rest_framework import serializers
+
+from .models import SearchEntry
+
+EXCERPT_LENGTH = 200
+
+
+class SearchResultSerializer(serializers.ModelSerializer):
+    type = serializers.CharField(source='entity_type')
+    id = serializers.CharField(source='entity_id')
+    excerpt = serializers.SerializerMethodField()
+    rank = serializers.SerializerMethodField()
+
+    class Meta:
+        model = SearchEntry
+        fields = ['type', 'id', 'project_id', 'title', 'excerpt', 'rank']
+
+    def get_excerpt(self, entry: SearchEntry) -> str:
+        body = ' '.join(entry.body.split())
+        return body if len(body) <= EXCERPT_LENGTH else f'{body[:EXCERPT_LENGTH].rsplit(" ", 1)[0]}…'
+
+    def get_rank(self, entry: SearchEntry) -> float | None:
+        return None if entry.rank is None else round(entry.rank, 6)
@@ -0,0 +1,34 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.features.common.pagination import ConfiguredPageNumberPagination
+
+from .models import SearchEntry
+from .query import SearchResults
+from .serializers import SearchResultSerializer
+
+
+class SearchView(APIView):
+    """Ranked full-text search over projects, risks, RFIs and documents.
+
+    ``?q=`` takes web-search style text. ``?type=risk,rfi`` and
+    ``?project_id=`` narrow the results, and the usual ``?page=`` and
+    ``?page_size=`` page through them.
+    """
+
+    def get(self, request):
+        text = request.query_params.get('q', '').strip()
+        if not text:
+            return Response({'q': ['This parameter is required.']}, status=status.HTTP_400_BAD_REQUEST)
+        entity_types = [value for value in request.query_params.get('type', '').split(',') if value]
+        unknown = set(entity_types) - set(SearchEntry.EntityType.values)
+        if unknown:
+            return Response(
+                {'type': [f'Unknown type(s): {", ".join(sorted(unknown))}.']},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        results = SearchResults(text, entity_types or None, request.query_params.get('project_id') or None)
+        paginator = ConfiguredPageNumberPagination()
+        page = paginator.paginate_queryset(results, request, view=self)
+        return paginator.get_paginated_response(SearchResultSerializer(page, many=True).data)
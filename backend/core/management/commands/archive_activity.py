@@ -0,0 +1,46 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Min
+from django.utils import timezone
+
+from core.features.activity.archive import archive_month, archive_path
+from core.features.activity.models import ActivityLog
+from core.features.activity.partitions import add_months, month_bounds, month_start
+
+
+class Command(BaseCommand):
+    help = 'Move activity log months older than the retention period into gzipped NDJSON archives.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-months',
+            type=int,
+            default=settings.ACTIVITY_RETENTION_MONTHS,
+            help='Keep this many whole months (plus the current one) in the database.',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='List the months without archiving.')
+
+    def handle(self, *args, **options):
+        current = month_start(timezone.now())
+        cutoff = add_months(current, -options['older_than_months'])
+        oldest = ActivityLog.objects.aggregate(oldest=Min('created_at'))['oldest']
+        if oldest is None or month_start(oldest) >= cutoff:
+            self.stdout.write(f'No activity older than {cutoff:%Y-%m}.')
+            return
+
+        month = month_start(oldest)
+        total = 0
+        while month < cutoff:
+            if options['dry_run']:
+                start, end = month_bounds(month)
+                count = ActivityLog.objects.filter(created_at__gte=start, created_at__lt=end).count()
+                if count:
+                    self.stdout.write(f'Would archive {count} rows from {month:%Y-%m} to {archive_path(month)}')
+            else:
+                count = archive_month(month)
+                total += count
+                if count:
+                    self.stdout.write(f'Archived {count} rows from {month:%Y-%m} to {archive_path(month)}')
+            month = add_months(month, 1)
+        if not options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f'Archived {total} activity rows.'))
@@ -0,0 +1,82 @@
+import uuid
+from datetime import datetime, timezone
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from core.features.activity.recorder import activity_buffer
+from core.features.approvals.models import Approval
+from core.features.common.benchmark import (
+    benchmark_client,
+    drop_projects,
+    ensure_project,
+    percentiles,
+    timed,
+)
+from core.features.projects.models import Project
+
+PROJECT_ID = 'bench-activity'
+
+
+class Command(BaseCommand):
+    help = 'Compare approval endpoint latency with synchronous and buffered activity logging.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--approvals', type=int, default=200)
+        parser.add_argument('--bulk-size', type=int, default=100)
+
+    def handle(self, *args, **options):
+        ensure_project(PROJECT_ID)
+        try:
+            ids = self._seed(options['approvals'])
+            client = benchmark_client()
+            for mode in ('sync', 'buffered'):
+                # Flushing after the response would run inside the test
+                # client's timing, so leave it to the explicit flush below.
+                with override_settings(ACTIVITY_LOG_MODE=mode, ACTIVITY_FLUSH_AFTER_RESPONSE=False):
+                    single = self._single(client, ids)
+                    bulk = self._bulk(client, ids[:options['bulk_size']])
+                    flush_ms, written = timed(activity_buffer.flush)
+                self.stdout.write(
+                    f'{mode}: approve/submit p50 {single["p50"]:.2f}ms p95 {single["p95"]:.2f}ms | '
+                    f'bulk-decide x{options["bulk_size"]} p50 {bulk["p50"]:.1f}ms | '
+                    f'deferred flush {written} rows in {flush_ms:.1f}ms'
+                )
+        finally:
+            activity_buffer.flush()
+            drop_projects(Project.objects.filter(id=PROJECT_ID))
+
+    def _single(self, client, ids: list[str]) -> dict:
+        samples = []
+        for approval_id in ids:
+            for step in ('approve', 'submit'):
+                elapsed, _ = timed(client.post, f'/api/approvals/{approval_id}/{step}/', {}, format='json')
+                samples.append(elapsed)
+        return percentiles(samples)
+
+    def _bulk(self, client, ids: list[str]) -> dict:
+        samples = []
+        for _ in range(10):
+            elapsed, _ = timed(
+                client.post, '/api/approvals/bulk-decide/', {'ids': ids, 'decision': 'approve'}, format='json'
+            )
+            samples.append(elapsed)
+            # Reset outside the timing; drop_projects resyncs the summary.
+            Approval.objects.filter(pk__in=ids).update(status=Approval.Status.PENDING)
+        return percentiles(samples)
+
+    def _seed(self, count: int) -> list[str]:
+        approvals = [
+            Approval(
+                id=uuid.uuid4().hex,
+                project_id=PROJECT_ID,
+                entity_type='document',
+                entity_id=str(index),
+                status=Approval.Status.PENDING,
+                requested_by='Benchmark',
+                requested_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            )
+            for index in range(count)
+        ]
+        Approval.objects.bulk_create(approvals)
+        return [approval.id for approval in approvals]
@@ -0,0 +1,176 @@
+import http.client
+import os
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY, get_user_model
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.management.base import BaseCommand, CommandError
+
+from core.features.budgets.models import BudgetItem
+from core.features.common.benchmark import percentiles
+
+SERVERS = {
+    'wsgi': ('config.wsgi:application', 'sync', 'false'),
+    'asgi': ('config.asgi:application', 'uvicorn_worker.UvicornWorker', 'true'),
+}
+USERNAME = 'benchmark-asgi'
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _rss_mb(pid: int) -> float:
+    """Resident memory of ``pid`` and its child processes, in MB."""
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            for line in Path(f'/proc/{current}/status').read_text().splitlines():
+                if line.startswith('VmRSS:'):
+                    total += int(line.split()[1])
+            pending.extend(
+                int(child) for child in Path(f'/proc/{current}/task/{current}/children').read_text().split()
+            )
+        except (FileNotFoundError, ProcessLookupError):
+            continue
+    return total / 1024
+
+
+class Command(BaseCommand):
+    help = 'Serve the API with gunicorn under WSGI and ASGI and compare throughput, latency and memory.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=2)
+        parser.add_argument('--concurrency', type=int, default=32)
+        parser.add_argument('--requests', type=int, default=2000, help='Requests per mode.')
+        parser.add_argument('--path', action='append', dest='paths', help='URL to request (repeatable).')
+        parser.add_argument(
+            '--cache',
+            action='store_true',
+            help='Leave the API response cache on, so most requests are cache hits.',
+        )
+
+    def handle(self, *args, **options):
+        if not Path('/proc/self/status').exists():
+            raise CommandError('Memory is read from /proc; run this on Linux.')
+        paths = options['paths'] or self._default_paths()
+        user, created = get_user_model().objects.get_or_create(username=USERNAME)
+        session = SessionStore()
+        session[SESSION_KEY] = str(user.pk)
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.create()
+        cookie = f'{settings.SESSION_COOKIE_NAME}={session.session_key}'
+        try:
+            for mode in SERVERS:
+                stats = self._run(mode, paths, cookie, options)
+                self.stdout.write(
+                    f'{mode}: {stats["rps"]:.0f} req/s | p50 {stats["p50"]:.1f}ms '
+                    f'p95 {stats["p95"]:.1f}ms | {stats["errors"]} errors | '
+                    f'RSS {stats["rss_mb"]:.0f}MB across {options["workers"]} workers'
+                )
+        finally:
+            session.delete()
+            if created:
+                user.delete()
+
+    def _default_paths(self) -> list[str]:
+        item = BudgetItem.objects.values('id', 'project_id').first()
+        if item is None:
+            raise CommandError('No budget items found; run generate_synthetic_portfolio first.')
+        return [
+            '/api/budgets/?page_size=50',
+            f'/api/budgets/?project_id={item["project_id"]}',
+            f'/api/budgets/{item["id"]}/',
+            '/api/summary/',
+        ]
+
+    def _run(self, mode: str, paths: list[str], cookie: str, options) -> dict:
+        application, worker_class, async_views = SERVERS[mode]
+        port = _free_port()
+        env = {
+            **os.environ,
+            'ASYNC_READ_VIEWS': async_views,
+            'API_CACHE_ENABLED': 'true' if options['cache'] else 'false',
+        }
+        server = subprocess.Popen(
+            [
+                sys.executable, '-m', 'gunicorn', application,
+                '--bind', f'127.0.0.1:{port}',
+                '--workers', str(options['workers']),
+                '--worker-class', worker_class,
+                '--log-level', 'critical',
+            ],
+            cwd=settings.BASE_DIR,
+            env=env,
+        )
+        host = next((host.lstrip('.') for host in settings.ALLOWED_HOSTS if host != '*'), 'localhost')
+        headers = {'Host': host, 'Cookie': cookie, 'Accept': 'application/json'}
+        try:
+            self._wait_until_up(server, port, headers)
+            # Warm every worker's imports and connections before timing.
+            self._load(port, headers, paths, options['concurrency'], options['concurrency'] * len(paths))
+            started = time.perf_counter()
+            samples, errors = self._load(port, headers, paths, options['concurrency'], options['requests'])
+            elapsed = time.perf_counter() - started
+            rss_mb = _rss_mb(server.pid)
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+        return {'rps': len(samples) / elapsed, 'errors': errors, 'rss_mb': rss_mb, **percentiles(samples)}
+
+    def _wait_until_up(self, server, port: int, headers: dict) -> None:
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise CommandError(f'gunicorn exited with status {server.returncode}.')
+            try:
+                connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+                connection.request('GET', '/api/summary/', headers=headers)
+                connection.getresponse().read()
+                connection.close()
+                return
+            except OSError:
+                time.sleep(0.2)
+        raise CommandError('gunicorn did not start within 30 seconds.')
+
+    def _load(self, port: int, headers: dict, paths: list[str], concurrency: int, total: int):
+        """Send ``total`` GETs over ``concurrency`` keep-alive connections."""
+
+        def client(index: int):
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+            samples, errors = [], 0
+            for number in range(index, total, concurrency):
+                started = time.perf_counter()
+                try:
+                    connection.request('GET', paths[number % len(paths)], headers=headers)
+                    response = connection.getresponse()
+                    response.read()
+                    ok = response.status == 200
+                except (OSError, http.client.HTTPException):
+                    connection.close()
+                    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+                    ok = False
+                if ok:
+                    samples.append((time.perf_counter() - started) * 1000)
+                else:
+                    errors += 1
+            connection.close()
+            return samples, errors
+
+        samples, errors = [], 0
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for client_samples, client_errors in pool.map(client, range(concurrency)):
+                samples.extend(client_samples)
+                errors += client_errors
+        return samples, errors
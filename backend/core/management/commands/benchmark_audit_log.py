@@ -0,0 +1,102 @@
+import uuid
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from core.features.activity.models import ActivityLog
+from core.features.activity.recorder import activity_buffer
+from core.features.budgets.models import BudgetItem
+from core.features.common.benchmark import (
+    benchmark_client,
+    drop_projects,
+    ensure_project,
+    percentiles,
+    timed,
+)
+from core.features.projects.models import Project
+
+PROJECT_ID = 'bench-audit'
+
+
+class Command(BaseCommand):
+    help = 'Compare budget write latency with audit logging on and off.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=200)
+        parser.add_argument('--bulk-size', type=int, default=200)
+        parser.add_argument('--rounds', type=int, default=3)
+
+    def handle(self, *args, **options):
+        ensure_project(PROJECT_ID)
+        try:
+            ids = self._seed(options['items'])
+            client = benchmark_client()
+            # One untimed pass so the first timed mode doesn't pay for warm-up.
+            self._single(client, ids, -1)
+            results = {}
+            # Interleave the modes so drift in the database affects both alike.
+            for round_number in range(options['rounds']):
+                for enabled in (False, True):
+                    with override_settings(AUDIT_LOG_ENABLED=enabled, ACTIVITY_FLUSH_AFTER_RESPONSE=False):
+                        single = self._single(client, ids, round_number)
+                        bulk = self._bulk(client, ids[:options['bulk_size']], round_number)
+                    activity_buffer.flush()
+                    samples = results.setdefault(enabled, {'single': [], 'bulk': []})
+                    samples['single'].extend(single)
+                    samples['bulk'].extend(bulk)
+
+            for enabled in (False, True):
+                single = percentiles(results[enabled]['single'])
+                bulk = percentiles(results[enabled]['bulk'])
+                self.stdout.write(
+                    f'audit {"on" if enabled else "off"}: PATCH p50 {single["p50"]:.2f}ms '
+                    f'p95 {single["p95"]:.2f}ms | bulk PATCH x{options["bulk_size"]} '
+                    f'p50 {bulk["p50"]:.1f}ms'
+                )
+            for kind in ('single', 'bulk'):
+                off = percentiles(results[False][kind])['p50']
+                on = percentiles(results[True][kind])['p50']
+                self.stdout.write(f'{kind} overhead at p50: {(on - off) / off * 100:+.1f}%')
+            logged = ActivityLog.objects.filter(project_id=PROJECT_ID).count()
+            self.stdout.write(f'{logged} audit entries written')
+        finally:
+            activity_buffer.flush()
+            drop_projects(Project.objects.filter(id=PROJECT_ID))
+
+    def _single(self, client, ids: list[str], round_number: int) -> list[float]:
+        samples = []
+        for index, item_id in enumerate(ids):
+            payload = {
+                'forecast_cost': f'{1000 + round_number * 10 + index % 7}.00',
+                'description': f'round {round_number}',
+            }
+            elapsed, _ = timed(client.patch, f'/api/budgets/{item_id}/', payload, format='json')
+            samples.append(elapsed)
+        return samples
+
+    def _bulk(self, client, ids: list[str], round_number: int) -> list[float]:
+        samples = []
+        for step in range(5):
+            payload = [{'id': item_id, 'actual_spent': f'{round_number * 100 + step}.00'} for item_id in ids]
+            elapsed, _ = timed(client.patch, '/api/budgets/bulk/', payload, format='json')
+            samples.append(elapsed)
+        return samples
+
+    def _seed(self, count: int) -> list[str]:
+        items = [
+            BudgetItem(
+                id=uuid.uuid4().hex,
+                project_id=PROJECT_ID,
+                cost_code=f'BA-{index:04d}',
+                category='Benchmark',
+                original_budget=Decimal('1000.00'),
+                approved_variations=Decimal('0.00'),
+                forecast_cost=Decimal('1000.00'),
+                actual_spent=Decimal('0.00'),
+                status=BudgetItem.Status.values[0],
+            )
+            for index in range(count)
+        ]
+        BudgetItem.objects.bulk_create(items)
+        return [item.id for item in items]
@@ -0,0 +1,75 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.features.budgets.models import BudgetItem
+from core.features.common.benchmark import benchmark_client, ensure_project, timed
+from core.features.projects.models import Project
+
+PROJECT_ID = 'bench-bulk'
+
+
+class Command(BaseCommand):
+    help = 'Compare single-row and bulk budget item writes through the API.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        client = benchmark_client()
+        ensure_project(PROJECT_ID)
+        try:
+            payload = [self._row(index) for index in range(rows)]
+
+            single_ms, _ = timed(
+                self._each, lambda row: client.post('/api/budgets/', row, format='json'), payload
+            )
+            ids = list(BudgetItem.objects.filter(project_id=PROJECT_ID).values_list('id', flat=True))
+            update_payload = [{'id': pk, 'forecast_cost': '125.00'} for pk in ids]
+            single_update_ms, _ = timed(
+                self._each,
+                lambda row: client.patch(f"/api/budgets/{row['id']}/", row, format='json'),
+                update_payload,
+            )
+            BudgetItem.objects.filter(project_id=PROJECT_ID).delete()
+
+            bulk_ms, response = timed(client.post, '/api/budgets/bulk/', payload, format='json')
+            self._check(response, 201)
+            ids = [row['id'] for row in response.json()]
+            update_payload = [{'id': pk, 'forecast_cost': '125.00'} for pk in ids]
+            bulk_update_ms, response = timed(client.patch, '/api/budgets/bulk/', update_payload, format='json')
+            self._check(response, 200)
+            bulk_delete_ms, response = timed(client.delete, '/api/budgets/bulk/', {'ids': ids}, format='json')
+            self._check(response, 200)
+        finally:
+            Project.objects.filter(id=PROJECT_ID).delete()
+
+        self._report('create', rows, single_ms, bulk_ms)
+        self._report('update', rows, single_update_ms, bulk_update_ms)
+        self.stdout.write(f'bulk delete: {rows / (bulk_delete_ms / 1000):,.0f} rows/s')
+
+    def _row(self, index: int) -> dict:
+        return {
+            'project': PROJECT_ID,
+            'category': f'Line {index:05d}',
+            'original_budget': '100.00',
+            'approved_variations': '0.00',
+            'forecast_cost': '110.00',
+            'actual_spent': '10.00',
+            'cost_code': f'CC-{index % 40:03d}',
+            'status': BudgetItem.Status.ON_TRACK,
+        }
+
+    def _each(self, send, payload: list[dict]) -> None:
+        for row in payload:
+            self._check(send(row), (200, 201))
+
+    def _check(self, response, expected) -> None:
+        expected = expected if isinstance(expected, tuple) else (expected,)
+        if response.status_code not in expected:
+            raise CommandError(f'Unexpected {response.status_code}: {response.content[:500]!r}')
+
+    def _report(self, label: str, rows: int, single_ms: float, bulk_ms: float) -> None:
+        self.stdout.write(
+            f'{label}: single-row {rows / (single_ms / 1000):,.0f} rows/s, '
+            f'bulk {rows / (bulk_ms / 1000):,.0f} rows/s ({single_ms / bulk_ms:.1f}x)'
+        )
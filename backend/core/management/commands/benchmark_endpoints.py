@@ -0,0 +1,164 @@
+import json
+import platform
+import tracemalloc
+from datetime import datetime, timezone
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import override_settings
+
+from core.features.common.benchmark import benchmark_client, percentiles, timed
+from core.features.common.synthetic import SYNTHETIC_PREFIX
+from core.features.metrics.recorder import QueryCounter
+from core.features.projects.models import Project
+from core.features.projects.rollups import GROUPINGS
+from core.urls import router
+
+
+def _fetch(client, url: str):
+    response = client.get(url)
+    if response.streaming:
+        response.content_length = sum(len(chunk) for chunk in response.streaming_content)
+    else:
+        response.content_length = len(response.content)
+    return response
+
+
+class Command(BaseCommand):
+    help = 'Time every read endpoint in-process and write or compare a JSON baseline.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--project', help='Project for filtered and detail URLs (default: a synthetic one).')
+        parser.add_argument('--output', default='benchmark-baseline.json')
+        parser.add_argument('--compare', help='Baseline JSON to compare this run against.')
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=0.2,
+            help='Relative p95 slowdown that counts as a regression (default 0.2).',
+        )
+        parser.add_argument('--fail-on-regression', action='store_true')
+        parser.add_argument(
+            '--cache',
+            action='store_true',
+            help='Leave the API response cache on, so repeats measure cache hits.',
+        )
+
+    def handle(self, *args, **options):
+        project_id = options['project'] or self._default_project()
+        if project_id is None:
+            raise CommandError('No projects found; run generate_synthetic_portfolio first.')
+        client = benchmark_client()
+        results = {}
+        with override_settings(API_CACHE_ENABLED=options['cache']):
+            for label, url in self._endpoints(project_id):
+                results[label] = self._measure(client, url, options['repeat'])
+                stats = results[label]
+                self.stdout.write(
+                    f'{label}: p50 {stats["p50"]:.1f}ms p95 {stats["p95"]:.1f}ms | '
+                    f'{stats["queries"]} queries | peak {stats["peak_kb"]:,.0f} KiB | {stats["bytes"]:,} B'
+                )
+
+        meta = {**self._meta(project_id, options['repeat']), 'api_cache': options['cache']}
+        baseline = {'meta': meta, 'endpoints': results}
+        with open(options['output'], 'w') as handle:
+            json.dump(baseline, handle, indent=2, sort_keys=True)
+        self.stdout.write(f'Wrote {options["output"]}')
+
+        if options['compare']:
+            regressions = self._compare(options['compare'], results, options['threshold'])
+            if regressions and options['fail_on_regression']:
+                raise CommandError(f'{len(regressions)} endpoint(s) regressed: {", ".join(regressions)}')
+
+    def _default_project(self) -> str | None:
+        synthetic = Project.objects.filter(id__startswith=SYNTHETIC_PREFIX).order_by('id').first()
+        project = synthetic or Project.objects.order_by('id').first()
+        return project.id if project else None
+
+    def _endpoints(self, project_id: str) -> list[tuple[str, str]]:
+        """Every GET route in core/urls.py except auth and the metrics endpoint."""
+        endpoints = [('summary', '/api/summary/')]
+        endpoints += [(f'summary?group_by={key}', f'/api/summary/?group_by={key}') for key in GROUPINGS]
+        for prefix, viewset, _ in router.registry:
+            model = viewset.queryset.model
+            filtered = '' if model is Project else f'?project_id={project_id}'
+            endpoints.append((f'{prefix} list', f'/api/{prefix}/'))
+            if filtered:
+                endpoints.append((f'{prefix} list by project', f'/api/{prefix}/{filtered}'))
+            if getattr(viewset, 'cursor_ordering', None):
+                endpoints.append((f'{prefix} list cursor', f'/api/{prefix}/?pagination=cursor'))
+            pk = project_id if model is Project else (
+                model.objects.filter(project_id=project_id).values_list('pk', flat=True).first()
+            )
+            if pk is not None:
+                endpoints.append((f'{prefix} detail', f'/api/{prefix}/{pk}/'))
+            for extra in viewset.get_extra_actions():
+                if 'get' not in extra.mapping:
+                    continue
+                if extra.detail and model is Project:
+                    endpoints.append((f'{prefix} {extra.url_path}', f'/api/{prefix}/{project_id}/{extra.url_path}/'))
+                elif not extra.detail:
+                    endpoints.append((f'{prefix} {extra.url_path}', f'/api/{prefix}/{extra.url_path}/{filtered}'))
+        return endpoints
+
+    def _measure(self, client, url: str, repeat: int) -> dict:
+        response = _fetch(client, url)
+        if response.status_code != 200:
+            raise CommandError(f'GET {url} returned {response.status_code}.')
+        samples = [timed(_fetch, client, url)[0] for _ in range(repeat)]
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            _fetch(client, url)
+        tracemalloc.start()
+        try:
+            _fetch(client, url)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return {
+            'url': url,
+            'queries': counter.queries,
+            'peak_kb': round(peak / 1024, 1),
+            'bytes': response.content_length,
+            **{key: round(value, 2) for key, value in percentiles(samples).items()},
+        }
+
+    def _meta(self, project_id: str, repeat: int) -> dict:
+        rows = {
+            viewset.queryset.model._meta.label: viewset.queryset.model.objects.count()
+            for _, viewset, _ in router.registry
+        }
+        return {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'database': connection.vendor,
+            'django': django.get_version(),
+            'python': platform.python_version(),
+            'project': project_id,
+            'repeat': repeat,
+            'rows': rows,
+        }
+
+    def _compare(self, path: str, results: dict, threshold: float) -> list[str]:
+        with open(path) as handle:
+            previous = json.load(handle)['endpoints']
+        regressions = []
+        for label, stats in results.items():
+            before = previous.get(label)
+            if before is None:
+                self.stdout.write(f'{label}: new endpoint')
+                continue
+            change = (stats['p95'] - before['p95']) / before['p95'] if before['p95'] else 0.0
+            slower = change > threshold and stats['p95'] - before['p95'] > 1
+            more_queries = stats['queries'] > before['queries']
+            line = (
+                f'{label}: p95 {before["p95"]:.1f} -> {stats["p95"]:.1f}ms ({change:+.0%}), '
+                f'queries {before["queries"]} -> {stats["queries"]}'
+            )
+            if slower or more_queries:
+                regressions.append(label)
+                self.stdout.write(self.style.ERROR(f'{line}  REGRESSION'))
+            else:
+                self.stdout.write(line)
+        return regressions
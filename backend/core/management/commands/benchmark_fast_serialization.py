@@ -0,0 +1,105 @@
+import uuid
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from core.features.activity.models import ActivityLog
+from core.features.budgets.models import BudgetItem
+from core.features.common.benchmark import (
+    benchmark_client,
+    drop_projects,
+    ensure_project,
+    percentiles,
+    timed,
+)
+from core.features.projects.models import Project
+
+PROJECT_ID = 'bench-fastpath'
+
+CASES = [
+    ('budgets', '/api/budgets/'),
+    ('activity', '/api/activity/'),
+    ('activity (cursor)', '/api/activity/?pagination=cursor'),
+]
+
+
+class Command(BaseCommand):
+    help = 'Compare list throughput of the DRF serializer path and the fast tuple path.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000)
+        parser.add_argument('--page-size', type=int, default=1000)
+        parser.add_argument('--repeat', type=int, default=10)
+
+    # Measures the uncached path; cache hits would hide it.
+    @override_settings(API_CACHE_ENABLED=False)
+    def handle(self, *args, **options):
+        ensure_project(PROJECT_ID)
+        try:
+            self._seed(options['rows'])
+            client = benchmark_client()
+            for label, path in CASES:
+                separator = '&' if '?' in path else '?'
+                url = f'{path}{separator}project_id={PROJECT_ID}&page_size={options["page_size"]}'
+                with override_settings(FAST_LIST_SERIALIZATION=False):
+                    slow, slow_body = self._measure(client, url, options['repeat'])
+                with override_settings(FAST_LIST_SERIALIZATION=True):
+                    fast, fast_body = self._measure(client, url, options['repeat'])
+                if slow_body != fast_body:
+                    raise CommandError(f'{label}: fast path output differs from the serializer output.')
+                self.stdout.write(
+                    f'{label}: serializer {slow["rows_per_sec"]:,.0f} rows/s p50 {slow["p50"]:.1f}ms | '
+                    f'fast {fast["rows_per_sec"]:,.0f} rows/s p50 {fast["p50"]:.1f}ms | '
+                    f'{slow["p50"] / fast["p50"]:.1f}x faster, identical output'
+                )
+        finally:
+            drop_projects(Project.objects.filter(id=PROJECT_ID))
+
+    def _measure(self, client, url: str, repeat: int) -> tuple[dict, bytes]:
+        samples = []
+        body = b''
+        rows = 0
+        for _ in range(repeat):
+            elapsed, response = timed(client.get, url)
+            samples.append(elapsed)
+            body = response.content
+            rows = len(response.data['results'])
+        stats = percentiles(samples)
+        stats['rows_per_sec'] = rows / (stats['p50'] / 1000) if stats['p50'] else 0.0
+        return stats, body
+
+    def _seed(self, rows: int) -> None:
+        BudgetItem.objects.bulk_create(
+            [
+                BudgetItem(
+                    id=f'budget-{uuid.uuid4().hex[:12]}',
+                    project_id=PROJECT_ID,
+                    category='Structure',
+                    description=f'Budget line {index}',
+                    original_budget=Decimal('125000.50') + index,
+                    approved_variations=Decimal('1250.25'),
+                    forecast_cost=Decimal('126250.75') + index,
+                    actual_spent=Decimal('98000.10'),
+                    cost_code=f'CC-{index:05d}',
+                    status=BudgetItem.Status.ON_TRACK,
+                )
+                for index in range(rows)
+            ],
+            batch_size=1000,
+        )
+        ActivityLog.objects.bulk_create(
+            [
+                ActivityLog(
+                    id=uuid.uuid4().hex,
+                    project_id=PROJECT_ID,
+                    actor='Benchmark',
+                    action=ActivityLog.Action.UPDATE,
+                    entity_type='budget',
+                    entity_id=f'budget-{index}',
+                    metadata={'index': index, 'fields': ['forecast_cost']},
+                )
+                for index in range(rows)
+            ],
+            batch_size=1000,
+        )
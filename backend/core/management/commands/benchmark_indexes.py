@@ -0,0 +1,181 @@
+import statistics
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from core.features.activity.models import ActivityLog
+from core.features.approvals.models import Approval
+from core.features.common.benchmark import drop_projects
+from core.features.projects.models import Project
+from core.features.risks.models import Risk
+
+BENCH_PREFIX = 'bench-idx-'
+REQUESTED_FROM = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class Command(BaseCommand):
+    help = 'Seed synthetic rows and report query plans and timings for the per-project list paths.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000, help='Activity log rows to seed.')
+        parser.add_argument('--projects', type=int, default=50)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument(
+            '--compare',
+            action='store_true',
+            help='Drop the model indexes, re-run every query, then restore them.',
+        )
+        parser.add_argument('--keep', action='store_true', help='Keep the seeded rows afterwards.')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f'Database vendor: {connection.vendor}')
+        project_ids = self._seed(options['rows'], options['projects'], options['batch_size'])
+        try:
+            cases = self._cases(project_ids[len(project_ids) // 2])
+            self._run(cases, options['repeat'], 'indexed')
+            if options['compare']:
+                with self._indexes_dropped():
+                    self._run(cases, options['repeat'], 'unindexed')
+        finally:
+            if not options['keep']:
+                drop_projects(Project.objects.filter(id__startswith=BENCH_PREFIX))
+
+    def _seed(self, rows: int, projects: int, batch_size: int) -> list[str]:
+        Project.objects.filter(id__startswith=BENCH_PREFIX).delete()
+        project_ids = [f'{BENCH_PREFIX}{index:04d}' for index in range(projects)]
+        Project.objects.bulk_create(
+            Project(
+                id=project_id,
+                name=f'Benchmark project {project_id}',
+                location='Benchmark',
+                status=Project.Status.ACTIVE,
+                start_date=date(2025, 1, 1),
+                end_date=date(2027, 1, 1),
+                program_name='Benchmark',
+            )
+            for project_id in project_ids
+        )
+
+        started = time.perf_counter()
+        self._bulk_insert(
+            ActivityLog,
+            (
+                ActivityLog(
+                    id=uuid.uuid4().hex,
+                    project_id=project_ids[index % projects],
+                    actor='Benchmark',
+                    action=ActivityLog.Action.UPDATE,
+                    entity_type='budget_item',
+                    entity_id=str(index),
+                )
+                for index in range(rows)
+            ),
+            batch_size,
+        )
+        side_rows = max(rows // 20, projects)
+        approval_statuses = list(Approval.Status.values)
+        self._bulk_insert(
+            Approval,
+            (
+                Approval(
+                    id=uuid.uuid4().hex,
+                    project_id=project_ids[index % projects],
+                    entity_type='document',
+                    entity_id=str(index),
+                    status=approval_statuses[index % len(approval_statuses)],
+                    requested_by='Benchmark',
+                    requested_at=REQUESTED_FROM + timedelta(minutes=index),
+                )
+                for index in range(side_rows)
+            ),
+            batch_size,
+        )
+        risk_statuses = list(Risk.Status.values)
+        self._bulk_insert(
+            Risk,
+            (
+                Risk(
+                    id=uuid.uuid4().hex,
+                    project_id=project_ids[index % projects],
+                    title=f'Risk {index}',
+                    category='Benchmark',
+                    likelihood=index % 5 + 1,
+                    impact=index % 3 + 1,
+                    rating=(index % 5 + 1) * (index % 3 + 1),
+                    status=risk_statuses[index % len(risk_statuses)],
+                    owner='Benchmark',
+                    due_date=date(2026, 1, 1),
+                )
+                for index in range(side_rows)
+            ),
+            batch_size,
+        )
+        self._analyze()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f'Seeded {rows} activity rows and {side_rows} approvals/risks in {elapsed:.1f}s')
+        return project_ids
+
+    def _bulk_insert(self, model, objects, batch_size: int) -> None:
+        batch = []
+        for obj in objects:
+            batch.append(obj)
+            if len(batch) >= batch_size:
+                model.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            model.objects.bulk_create(batch)
+
+    def _cases(self, project_id: str) -> list[tuple[str, object, bool]]:
+        # (label, queryset, count_only). Row cases fetch one default-sized page.
+        pending = Approval.objects.filter(status=Approval.Status.PENDING)
+        return [
+            ('activity first page', ActivityLog.objects.all()[:20], False),
+            ('activity by project', ActivityLog.objects.filter(project_id=project_id)[:20], False),
+            ('approvals by project', Approval.objects.filter(project_id=project_id)[:20], False),
+            ('pending approvals by project', pending.filter(project_id=project_id)[:20], False),
+            ('pending approvals count', pending, True),
+            ('risks by project', Risk.objects.filter(project_id=project_id)[:20], False),
+            ('open risks count', Risk.objects.exclude(status=Risk.Status.CLOSED), True),
+        ]
+
+    def _run(self, cases, repeat: int, label: str) -> None:
+        self.stdout.write(self.style.MIGRATE_HEADING(f'\n== {label} =='))
+        for name, queryset, count_only in cases:
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                if count_only:
+                    queryset.all().count()
+                else:
+                    list(queryset.all())
+                timings.append((time.perf_counter() - started) * 1000)
+            self.stdout.write(f'{name}: median {statistics.median(timings):.2f}ms')
+            explained = queryset.order_by() if count_only else queryset
+            for line in explained.explain().splitlines():
+                self.stdout.write(f'    {line}')
+
+    @contextmanager
+    def _indexes_dropped(self):
+        models = (ActivityLog, Approval, Risk)
+        with connection.schema_editor() as editor:
+            for model in models:
+                for index in model._meta.indexes:
+                    editor.remove_index(model, index)
+        self._analyze()
+        try:
+            yield
+        finally:
+            with connection.schema_editor() as editor:
+                for model in models:
+                    for index in model._meta.indexes:
+                        editor.add_index(model, index)
+            self._analyze()
+
+    def _analyze(self) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
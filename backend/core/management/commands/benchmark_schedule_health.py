@@ -0,0 +1,102 @@
+import random
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import override_settings
+from django.utils import timezone
+
+from core.features.common.benchmark import benchmark_client, drop_projects, percentiles, timed
+from core.features.milestones.models import Milestone
+from core.features.milestones.schedule import schedule_health
+from core.features.projects.models import Project
+
+BENCH_PREFIX = 'bench-sched-'
+URL = '/api/milestones/schedule-health/'
+
+
+class Command(BaseCommand):
+    help = 'Seed milestones and time the schedule-health computation and endpoint.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--milestones', type=int, default=100_000)
+        parser.add_argument('--projects', type=int, default=500)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=7)
+        parser.add_argument('--keep', action='store_true', help='Keep the seeded rows afterwards.')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f'Database vendor: {connection.vendor}')
+        self._drop()
+        try:
+            self._seed(options['milestones'], options['projects'], options['batch_size'], random.Random(options['seed']))
+            queryset = Milestone.objects.filter(project__id__startswith=BENCH_PREFIX)
+            today = timezone.localdate()
+            samples = []
+            for _ in range(options['repeat']):
+                elapsed, payload = timed(schedule_health, queryset, today)
+                samples.append(elapsed)
+            self._report(f'service, {payload["totals"]["milestones"]:,} milestones', samples)
+
+            client = benchmark_client()
+            with override_settings(API_CACHE_ENABLED=False):
+                self._report('endpoint, uncached', [timed(client.get, URL)[0] for _ in range(options['repeat'])])
+            misses = timed(client.get, URL)[0]
+            self._report(f'endpoint, cached (miss {misses:.1f}ms)', [timed(client.get, URL)[0] for _ in range(options['repeat'])])
+        finally:
+            if not options['keep']:
+                self._drop()
+
+    def _report(self, label: str, samples: list[float]) -> None:
+        stats = percentiles(samples)
+        self.stdout.write(f'{label}: p50 {stats["p50"]:.1f}ms p95 {stats["p95"]:.1f}ms max {stats["max"]:.1f}ms')
+
+    def _drop(self) -> None:
+        # Seeded with bulk_create, so skip the cascade's per-row delete signals too.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {connection.ops.quote_name(Milestone._meta.db_table)} WHERE project_id LIKE %s',
+                [f'{BENCH_PREFIX}%'],
+            )
+        drop_projects(Project.objects.filter(id__startswith=BENCH_PREFIX))
+
+    def _seed(self, milestones: int, projects: int, batch_size: int, rng: random.Random) -> None:
+        started = time.perf_counter()
+        today = timezone.localdate()
+        project_ids = [f'{BENCH_PREFIX}{index:04d}' for index in range(projects)]
+        starts = {project_id: today - timedelta(days=rng.randrange(0, 720)) for project_id in project_ids}
+        Project.objects.bulk_create(
+            Project(
+                id=project_id,
+                name=f'Benchmark project {project_id}',
+                location='Benchmark',
+                status=Project.Status.ACTIVE,
+                start_date=starts[project_id],
+                end_date=starts[project_id] + timedelta(days=900),
+                program_name='Benchmark',
+            )
+            for project_id in project_ids
+        )
+        for offset in range(0, milestones, batch_size):
+            Milestone.objects.bulk_create(
+                self._milestone(index, project_ids[index % projects], starts, today, rng)
+                for index in range(offset, min(offset + batch_size, milestones))
+            )
+        self.stdout.write(f'Seeded {milestones:,} milestones over {projects} projects in {time.perf_counter() - started:.1f}s')
+
+    def _milestone(self, index: int, project_id: str, starts: dict, today: date, rng: random.Random) -> Milestone:
+        planned = starts[project_id] + timedelta(days=rng.randrange(0, 900))
+        # Most milestones before today are done, some of them late; the rest are in flight.
+        done = planned < today and rng.random() < 0.8
+        status = Milestone.Status.DONE if done else rng.choice([Milestone.Status.IN_PROGRESS, Milestone.Status.AT_RISK])
+        return Milestone(
+            id=f'{BENCH_PREFIX}{index:09d}',
+            project_id=project_id,
+            name=f'Milestone {index}',
+            planned_date=planned,
+            actual_date=min(planned + timedelta(days=rng.randrange(-10, 60)), today) if done else None,
+            status=status,
+            percent_complete=100 if done else rng.randrange(0, 100),
+        )
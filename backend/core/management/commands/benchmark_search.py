@@ -0,0 +1,127 @@
+import random
+import time
+import uuid
+from datetime import date
+from functools import reduce
+from operator import and_
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Q
+
+from core.features.common.benchmark import drop_projects, ensure_project, percentiles, timed
+from core.features.projects.models import Project
+from core.features.risks.models import Risk
+from core.features.search.index import index_rows
+from core.features.search.models import SearchEntry
+from core.features.search.query import SearchResults
+
+BENCH_PROJECT = 'bench-search'
+PAGE_SIZE = 20
+VOCABULARY = (
+    'crane scaffold concrete rebar formwork excavation shoring dewatering trench piling '
+    'facade curtain glazing roofing membrane insulation drywall ceiling flooring tiling '
+    'elevator escalator hvac ductwork chiller boiler sprinkler alarm conduit switchgear '
+    'transformer generator cabling lighting plumbing drainage sewer culvert retaining wall '
+    'asphalt paving signage fencing landscaping permit inspection survey geotechnical '
+    'contamination asbestos weather flood wind heat delay shortage supplier subcontractor '
+    'labour strike safety incident injury fatigue access logistics storage delivery customs '
+    'tariff inflation currency claim dispute variation design clash coordination approval'
+).split()
+
+
+class Command(BaseCommand):
+    help = 'Seed risks and compare full-text search against icontains over the source columns.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000, help='Risks to seed and index.')
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=7)
+        parser.add_argument('--keep', action='store_true', help='Keep the seeded rows afterwards.')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f'Database vendor: {connection.vendor}')
+        self._drop()
+        ensure_project(BENCH_PROJECT)
+        try:
+            self._seed(options['rows'], options['batch_size'], random.Random(options['seed']))
+            for query in ('asbestos', 'crane delay', 'tariff currency claim', 'nonexistentterm'):
+                self._compare(query, options['repeat'])
+        finally:
+            if not options['keep']:
+                self._drop()
+
+    def _drop(self) -> None:
+        # A cascading ORM delete would load every seeded row to send its
+        # delete signals; the seed never sent the save ones either.
+        with connection.cursor() as cursor:
+            for model in (SearchEntry, Risk):
+                cursor.execute(
+                    f'DELETE FROM {connection.ops.quote_name(model._meta.db_table)} WHERE project_id = %s',
+                    [BENCH_PROJECT],
+                )
+        drop_projects(Project.objects.filter(id=BENCH_PROJECT))
+
+    def _seed(self, rows: int, batch_size: int, rng: random.Random) -> None:
+        # Zipf-like word frequencies, so common and rare terms both occur.
+        weights = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+        statuses = list(Risk.Status.values)
+        started = time.perf_counter()
+        indexing = 0.0
+        for offset in range(0, rows, batch_size):
+            risks = [
+                Risk(
+                    id=uuid.uuid4().hex,
+                    project_id=BENCH_PROJECT,
+                    title=' '.join(rng.choices(VOCABULARY, weights, k=4)).capitalize(),
+                    category='Benchmark',
+                    likelihood=index % 5 + 1,
+                    impact=index % 3 + 1,
+                    rating=(index % 5 + 1) * (index % 3 + 1),
+                    status=statuses[index % len(statuses)],
+                    owner='Benchmark',
+                    due_date=date(2026, 1, 1),
+                    mitigation_plan=' '.join(rng.choices(VOCABULARY, weights, k=24)).capitalize() + '.',
+                )
+                for index in range(offset, min(offset + batch_size, rows))
+            ]
+            Risk.objects.bulk_create(risks)
+            # bulk_create skips the write hooks; index the batch the way a bulk write would.
+            elapsed, _ = timed(
+                index_rows,
+                Risk,
+                [
+                    {'id': risk.id, 'title': risk.title, 'mitigation_plan': risk.mitigation_plan, 'project_id': risk.project_id}
+                    for risk in risks
+                ],
+            )
+            indexing += elapsed / 1000
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        total = time.perf_counter() - started
+        self.stdout.write(
+            f'Seeded {rows:,} risks in {total:.1f}s, {indexing:.1f}s of it indexing '
+            f'({rows / indexing:,.0f} rows/s)'
+        )
+
+    def _compare(self, query: str, repeat: int) -> None:
+        words = query.split()
+        matches = reduce(and_, [Q(title__icontains=word) | Q(mitigation_plan__icontains=word) for word in words])
+
+        def scan():
+            queryset = Risk.objects.filter(matches)
+            return queryset.count(), list(queryset.order_by('-rating', 'title')[:PAGE_SIZE])
+
+        def search():
+            results = SearchResults(query, ['risk'])
+            return results.count(), results[0:PAGE_SIZE]
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'\n== "{query}" (count + first {PAGE_SIZE}) =='))
+        for label, func in (('icontains', scan), ('full-text', search)):
+            samples = []
+            for _ in range(repeat):
+                elapsed, (count, _) = timed(func)
+                samples.append(elapsed)
+            stats = percentiles(samples)
+            self.stdout.write(f'{label}: {count:,} matches | p50 {stats["p50"]:.1f}ms max {stats["max"]:.1f}ms')
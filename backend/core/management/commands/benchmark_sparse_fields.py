@@ -0,0 +1,102 @@
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from core.features.common.benchmark import (
+    benchmark_client,
+    drop_projects,
+    ensure_project,
+    percentiles,
+    timed,
+)
+from core.features.projects.models import Project
+from core.features.rfis.models import Rfi
+from core.features.risks.models import Risk
+
+PROJECT_ID = 'bench-sparse'
+LONG_TEXT = 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 20
+
+CASES = [
+    ('risks', '/api/risks/', 'id,title,category,rating,status,owner,due_date'),
+    ('rfis', '/api/rfis/', 'id,rfi_number,title,status,raised_by,raised_at,due_date'),
+]
+
+
+class Command(BaseCommand):
+    help = 'Compare payload size and latency of full and sparse risk/RFI list responses.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000)
+        parser.add_argument('--page-size', type=int, default=1000)
+        parser.add_argument('--repeat', type=int, default=10)
+
+    # Measures the uncached path; cache hits would hide it.
+    @override_settings(API_CACHE_ENABLED=False)
+    def handle(self, *args, **options):
+        ensure_project(PROJECT_ID)
+        try:
+            self._seed(options['rows'])
+            client = benchmark_client()
+            for label, path, fields in CASES:
+                base = f'{path}?project_id={PROJECT_ID}&page_size={options["page_size"]}'
+                full = self._measure(client, base, options['repeat'])
+                sparse = self._measure(client, f'{base}&fields={fields}', options['repeat'])
+                self.stdout.write(
+                    f'{label}: full {full["bytes"]:,} B p50 {full["p50"]:.1f}ms p95 {full["p95"]:.1f}ms | '
+                    f'sparse {sparse["bytes"]:,} B p50 {sparse["p50"]:.1f}ms p95 {sparse["p95"]:.1f}ms | '
+                    f'{full["bytes"] / sparse["bytes"]:.1f}x smaller'
+                )
+        finally:
+            drop_projects(Project.objects.filter(id=PROJECT_ID))
+
+    def _measure(self, client, url: str, repeat: int) -> dict:
+        samples = []
+        size = 0
+        for _ in range(repeat):
+            elapsed, response = timed(client.get, url)
+            samples.append(elapsed)
+            size = len(response.content)
+        return {'bytes': size, **percentiles(samples)}
+
+    def _seed(self, rows: int) -> None:
+        raised_from = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        Risk.objects.bulk_create(
+            [
+                Risk(
+                    id=f'risk-{uuid.uuid4().hex[:12]}',
+                    project_id=PROJECT_ID,
+                    title=f'Risk {index}',
+                    description=LONG_TEXT,
+                    category='Delivery',
+                    likelihood=3,
+                    impact=4,
+                    rating=12,
+                    status=Risk.Status.OPEN,
+                    owner='Benchmark',
+                    due_date=date(2026, 6, 30),
+                    mitigation_plan=LONG_TEXT,
+                )
+                for index in range(rows)
+            ],
+            batch_size=1000,
+        )
+        Rfi.objects.bulk_create(
+            [
+                Rfi(
+                    id=f'rfi-{uuid.uuid4().hex[:12]}',
+                    project_id=PROJECT_ID,
+                    rfi_number=f'RFI-{index:05d}',
+                    title=f'RFI {index}',
+                    question=LONG_TEXT,
+                    status=Rfi.Status.OPEN,
+                    raised_by='Benchmark',
+                    raised_at=raised_from + timedelta(minutes=index),
+                    due_date=date(2026, 6, 30),
+                    response_summary=LONG_TEXT,
+                )
+                for index in range(rows)
+            ],
+            batch_size=1000,
+        )
@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from core.features.common.benchmark import benchmark_client, percentiles, timed
+from core.features.projects.models import Project
+
+# The list calls ProjectWorkspacePage makes when a project is opened.
+WATERFALL = [
+    '/api/budgets/?project_id={id}',
+    '/api/milestones/?project_id={id}',
+    '/api/risks/?project_id={id}',
+    '/api/rfis/?project_id={id}',
+    '/api/documents/?project_id={id}',
+    '/api/media-items/?project_id={id}',
+    '/api/approvals/?project_id={id}',
+    '/api/activity/?project_id={id}',
+]
+
+
+class Command(BaseCommand):
+    help = 'Compare the eight-request project workspace waterfall with the /workspace/ bundle.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--project', help='Project id (default: the project with the most activity).')
+        parser.add_argument('--repeat', type=int, default=20)
+
+    # Measures the uncached path; cache hits would hide it.
+    @override_settings(API_CACHE_ENABLED=False)
+    def handle(self, *args, **options):
+        project_id = options['project'] or self._busiest_project()
+        if project_id is None or not Project.objects.filter(id=project_id).exists():
+            raise CommandError('No project to benchmark; load data or pass --project.')
+        client = benchmark_client()
+        waterfall = [path.format(id=project_id) for path in WATERFALL]
+        bundle = f'/api/projects/{project_id}/workspace/'
+
+        waterfall_stats = self._measure(client, waterfall, options['repeat'])
+        bundle_stats = self._measure(client, [bundle], options['repeat'])
+        self.stdout.write(f'Project {project_id}')
+        for label, stats in (('8 list requests', waterfall_stats), ('workspace bundle', bundle_stats)):
+            self.stdout.write(
+                f'{label}: p50 {stats["p50"]:.1f}ms p95 {stats["p95"]:.1f}ms | '
+                f'{stats["queries"]} queries | {stats["bytes"]:,} B'
+            )
+        self.stdout.write(f'Bundle is {waterfall_stats["p50"] / bundle_stats["p50"]:.1f}x faster at p50.')
+
+    def _measure(self, client, urls: list[str], repeat: int) -> dict:
+        samples = []
+        for _ in range(repeat):
+            elapsed, _ = timed(lambda: [client.get(url) for url in urls])
+            samples.append(elapsed)
+        with CaptureQueriesContext(connection) as queries:
+            responses = [client.get(url) for url in urls]
+        for url, response in zip(urls, responses):
+            if response.status_code != 200:
+                raise CommandError(f'{url} returned {response.status_code}.')
+        return {
+            'queries': len(queries),
+            'bytes': sum(len(response.content) for response in responses),
+            **percentiles(samples),
+        }
+
+    def _busiest_project(self) -> str | None:
+        busiest = Project.objects.annotate(rows=Count('activity_logs')).order_by('-rows', 'id').first()
+        return busiest.id if busiest else None
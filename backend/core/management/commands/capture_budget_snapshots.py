@@ -0,0 +1,31 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.features.budget_history.history import capture_snapshots
+
+
+class Command(BaseCommand):
+    help = "Append today's budget snapshot for every project and the portfolio; run it once a day."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', help='Capture as this day (YYYY-MM-DD) instead of today.')
+
+    def handle(self, *args, **options):
+        try:
+            day = date.fromisoformat(options['date']) if options['date'] else timezone.localdate()
+        except ValueError:
+            raise CommandError('Use the YYYY-MM-DD format for --date.')
+        started = time.perf_counter()
+        result = capture_snapshots(day)
+        elapsed = time.perf_counter() - started
+        if result['skipped']:
+            self.stdout.write(f'{result["skipped"]} project(s) already had a snapshot on or after {day}.')
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Captured {result["rows"]} snapshot row(s) for {day} with {result["lines"]:,} line value(s) '
+                f'in {elapsed:.1f}s.'
+            )
+        )
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from core.features.common.benchmark import benchmark_client
+from core.features.metrics.budgets import QueryBudgetExceeded, check_viewset_budgets
+from core.urls import router
+
+
+class Command(BaseCommand):
+    help = 'Fail if any API list or detail endpoint exceeds its query budget.'
+
+    # Budgets are for the queries a cache miss runs.
+    @override_settings(API_CACHE_ENABLED=False)
+    def handle(self, *args, **options):
+        try:
+            results = check_viewset_budgets(benchmark_client(), router.registry)
+        except QueryBudgetExceeded as error:
+            raise CommandError(str(error))
+        for label, queries, budget in results:
+            self.stdout.write(f'{label}: {queries}/{budget} queries')
+        self.stdout.write(self.style.SUCCESS(f'{len(results)} endpoints within budget.'))
@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from core.features.activity.partitions import add_months, ensure_partitions, is_partitioned, month_start
+
+
+class Command(BaseCommand):
+    help = 'Create the monthly activity log partitions for this month and the months ahead (PostgreSQL).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=settings.ACTIVITY_PARTITIONS_AHEAD,
+            help='Future months to create besides the current one.',
+        )
+
+    def handle(self, *args, **options):
+        if not is_partitioned():
+            self.stdout.write(f'The activity log is not partitioned on {connection.vendor}; nothing to do.')
+            return
+        current = month_start(timezone.now())
+        created = ensure_partitions(current, add_months(current, options['months_ahead']))
+        for name in created:
+            self.stdout.write(f'Created {name}')
+        self.stdout.write(self.style.SUCCESS(f'{len(created)} partition(s) created.'))
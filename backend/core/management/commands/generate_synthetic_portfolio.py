@@ -0,0 +1,51 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.features.common.synthetic import clear_portfolio, generate_portfolio
+from core.features.projects.summary import rebuild_summary
+from core.features.search.index import rebuild_index
+
+DEFAULT_COUNTS = {
+    'projects': 500,
+    'budgets': 200_000,
+    'milestones': 50_000,
+    'risks': 25_000,
+    'rfis': 25_000,
+    'documents': 25_000,
+    'media_items': 10_000,
+    'approvals': 50_000,
+    'activity': 5_000_000,
+}
+
+
+class Command(BaseCommand):
+    help = 'Bulk-insert a reproducible synthetic portfolio for load tests and benchmarks.'
+
+    def add_arguments(self, parser):
+        for key, default in DEFAULT_COUNTS.items():
+            parser.add_argument(f'--{key.replace("_", "-")}', type=int, default=default, dest=key)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--clear', action='store_true', help='Only delete the synthetic portfolio.')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        clear_portfolio()
+        if options['clear']:
+            rebuild_summary()
+            self.stdout.write(self.style.SUCCESS('Synthetic portfolio removed.'))
+            return
+
+        counts = {key: options[key] for key in DEFAULT_COUNTS}
+        generate_portfolio(counts, options['seed'], options['batch_size'], report=self._report)
+        rebuild_summary()
+        rebuild_index()
+        total = sum(counts.values())
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(f'Generated {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s).')
+        )
+
+    def _report(self, key: str, rows: int, rate: float) -> None:
+        self.stdout.write(f'{key}: {rows:,} rows at {rate:,.0f} rows/s')
@@ -0,0 +1,64 @@
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+
+from core.features.common.loader import (
+    LOAD_ORDER,
+    LoadError,
+    PortfolioLoader,
+    model_from_label,
+    preserved_timestamps,
+    read_records,
+)
+from core.features.projects.summary import rebuild_summary
+from core.features.search.index import rebuild_index
+
+FORMATS = {'.json': 'json', '.ndjson': 'ndjson', '.jsonl': 'ndjson', '.csv': 'csv'}
+
+
+class Command(BaseCommand):
+    help = 'Stream portfolio rows from JSON, NDJSON or CSV files into the database in bulk.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+', help='Input files, loaded in the order given.')
+        parser.add_argument('--format', choices=sorted(set(FORMATS.values())), help='Default: from the file extension.')
+        parser.add_argument('--model', help='Model label for flat NDJSON/CSV rows, e.g. core.budgetitem.')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--copy', action='store_true', help='Use PostgreSQL COPY instead of bulk_create.')
+        parser.add_argument('--ignore-conflicts', action='store_true', help='Skip rows whose id already exists.')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            model = model_from_label(options['model']) if options['model'] else None
+            with transaction.atomic(), preserved_timestamps(LOAD_ORDER):
+                loader = PortfolioLoader(options['batch_size'], options['copy'], options['ignore_conflicts'])
+                for path in options['paths']:
+                    fmt = options['format'] or FORMATS.get(Path(path).suffix.lower())
+                    if fmt is None:
+                        raise LoadError(f'Cannot tell the format of {path}; pass --format.')
+                    with open(path, newline='' if fmt == 'csv' else None, encoding='utf-8') as stream:
+                        for record_model, pk, fields in read_records(stream, fmt, model):
+                            loader.add(record_model, pk, fields)
+                loader.flush()
+                rebuild_summary()
+                rebuild_index()
+        except (LoadError, OSError) as error:
+            raise CommandError(str(error))
+        except IntegrityError as error:
+            raise CommandError(f'{error}. Nothing was loaded; use --ignore-conflicts to skip existing ids.')
+
+        total = 0
+        for loaded_model in LOAD_ORDER:
+            rows = loader.counts[loaded_model]
+            if not rows:
+                continue
+            total += rows
+            rate = rows / loader.seconds[loaded_model] if loader.seconds[loaded_model] else 0.0
+            self.stdout.write(f'{loaded_model._meta.label_lower}: {rows:,} rows, {rate:,.0f} rows/s inserting')
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(f'Loaded {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s overall).')
+        )
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.features.projects.summary import check_consistency, rebuild_summary
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the materialized program summary, or check it against the live aggregates.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Compare the stored summary with the live aggregates without writing.',
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            drift = check_consistency()
+            if drift:
+                for field, (stored, live) in sorted(drift.items()):
+                    self.stdout.write(f'{field}: stored={stored} live={live}')
+                raise CommandError('Program summary is out of date; run rebuild_program_summary.')
+            self.stdout.write(self.style.SUCCESS('Program summary matches the live aggregates.'))
+            return
+
+        summary = rebuild_summary()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt program summary (version {summary.version}).'))
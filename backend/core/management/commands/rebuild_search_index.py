@@ -0,0 +1,18 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.features.search.index import rebuild_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index from the project, risk, RFI and document tables.'
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        total = rebuild_index(report=self._report)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f'Indexed {total:,} rows in {elapsed:.1f}s.'))
+
+    def _report(self, model, total: int) -> None:
+        self.stdout.write(f'{model._meta.label_lower}: indexed, {total:,} entries so far')
@@ -0,0 +1,69 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_add_ids_defaults'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['-created_at'], name='activity_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['project', '-created_at'], name='activity_project_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='approval',
+            index=models.Index(fields=['project', '-requested_at'], name='approval_project_req_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='approval',
+            index=models.Index(fields=['status', 'project'], name='approval_status_project_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='approval',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['project', '-requested_at'], name='approval_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='budgetitem',
+            index=models.Index(fields=['project', 'category'], name='budget_project_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['project', '-uploaded_at'], name='document_project_uploaded_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mediaitem',
+            index=models.Index(fields=['project', '-captured_at'], name='media_project_captured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='milestone',
+            index=models.Index(fields=['project', 'planned_date'], name='milestone_project_planned_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='milestone',
+            index=models.Index(fields=['status', 'project'], name='milestone_status_project_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rfi',
+            index=models.Index(fields=['project', '-raised_at'], name='rfi_project_raised_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='risk',
+            index=models.Index(fields=['project', '-rating', 'title'], name='risk_project_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='risk',
+            index=models.Index(fields=['status', 'project'], name='risk_status_project_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='risk',
+            index=models.Index(condition=models.Q(('status', 'closed'), _negated=True), fields=['project'], name='risk_open_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_add_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgramSummary',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.PositiveSmallIntegerField(default=1, primary_key=True, serialize=False)),
+                ('total_original_budget', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('total_variations', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('total_forecast_cost', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('total_actual_spend', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('milestones_total', models.IntegerField(default=0)),
+                ('milestones_completed', models.IntegerField(default=0)),
+                ('open_risks', models.IntegerField(default=0)),
+                ('pending_approvals', models.IntegerField(default=0)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_program_summary'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='activitylog',
+            name='activity_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='activitylog',
+            name='activity_project_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='approval',
+            name='approval_project_req_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='rfi',
+            name='rfi_project_raised_idx',
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['-created_at', '-id'], name='activity_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['project', '-created_at', '-id'], name='activity_project_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='approval',
+            index=models.Index(fields=['project', '-requested_at', '-id'], name='approval_project_req_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rfi',
+            index=models.Index(fields=['project', '-raised_at', '-id'], name='rfi_project_raised_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_activity_created_at_default'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activitylog',
+            name='action',
+            field=models.CharField(choices=[('submit', 'Submit'), ('approve', 'Approve'), ('reject', 'Reject'), ('update', 'Update'), ('create', 'Create'), ('delete', 'Delete')], max_length=20),
+        ),
+    ]
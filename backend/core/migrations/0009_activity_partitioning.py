@@ -0,0 +1,89 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:05
+
+from datetime import date, datetime, timezone
+
+from django.db import migrations
+
+TABLE = 'core_activitylog'
+STAGING = 'core_activitylog_staging'
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _bound(month: date) -> str:
+    return f"'{datetime(month.year, month.month, 1, tzinfo=timezone.utc).isoformat()}'"
+
+
+def _foreign_key_name(schema_editor) -> str | None:
+    with schema_editor.connection.cursor() as cursor:
+        constraints = schema_editor.connection.introspection.get_constraints(cursor, TABLE)
+    return next((name for name, info in constraints.items() if info['foreign_key']), None)
+
+
+def _finish_table(apps, schema_editor, foreign_key: str | None, primary_key: str) -> None:
+    model = apps.get_model('core', 'ActivityLog')
+    execute = schema_editor.execute
+    execute(f'ALTER TABLE {STAGING} RENAME TO {TABLE}')
+    execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY ({primary_key})')
+    execute(
+        f'ALTER TABLE {TABLE} ADD CONSTRAINT {foreign_key or TABLE + "_project_id_fk"} '
+        f'FOREIGN KEY (project_id) REFERENCES core_project (id) DEFERRABLE INITIALLY DEFERRED'
+    )
+    for index in model._meta.indexes:
+        schema_editor.add_index(model, index)
+
+
+def partition_activity(apps, schema_editor):
+    """Rebuild the activity table as one partitioned by month of created_at.
+
+    PostgreSQL requires the partition key in the primary key, so it becomes
+    (id, created_at) in the database; ids are random, so the ORM keeps
+    treating ``id`` alone as the key. Other databases are left as they are.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    foreign_key = _foreign_key_name(schema_editor)
+    execute = schema_editor.execute
+    execute(f'CREATE TABLE {STAGING} (LIKE {TABLE} INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)')
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'SELECT MIN(created_at), MAX(created_at) FROM {TABLE}')
+        first, last = cursor.fetchone()
+    today = datetime.now(timezone.utc).date()
+    first = (first.astimezone(timezone.utc).date() if first else today).replace(day=1)
+    last = max(last.astimezone(timezone.utc).date() if last else today, today).replace(day=1)
+    month = first
+    while month <= last:
+        execute(
+            f'CREATE TABLE {TABLE}_p{month:%Y_%m} PARTITION OF {STAGING} '
+            f'FOR VALUES FROM ({_bound(month)}) TO ({_bound(_next_month(month))})'
+        )
+        month = _next_month(month)
+    execute(f'CREATE TABLE {TABLE}_default PARTITION OF {STAGING} DEFAULT')
+    execute(f'INSERT INTO {STAGING} SELECT * FROM {TABLE}')
+    execute(f'DROP TABLE {TABLE}')
+    _finish_table(apps, schema_editor, foreign_key, 'id, created_at')
+
+
+def unpartition_activity(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    foreign_key = _foreign_key_name(schema_editor)
+    execute = schema_editor.execute
+    execute(f'CREATE TABLE {STAGING} (LIKE {TABLE} INCLUDING DEFAULTS)')
+    execute(f'INSERT INTO {STAGING} SELECT * FROM {TABLE}')
+    # Dropping the parent drops every partition with it.
+    execute(f'DROP TABLE {TABLE}')
+    _finish_table(apps, schema_editor, foreign_key, 'id')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_activity_audit_actions'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_activity, unpartition_activity),
+    ]
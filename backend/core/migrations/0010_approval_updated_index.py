@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_activity_partitioning'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='approval',
+            index=models.Index(fields=['project', 'updated_at', 'id'], name='approval_project_updated_idx'),
+        ),
+    ]
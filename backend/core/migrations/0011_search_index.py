@@ -0,0 +1,110 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+TABLE = 'core_searchentry'
+FTS_TABLE = 'core_searchentry_fts'
+SOURCES = {
+    'project': ('Project', 'name', ('description',)),
+    'risk': ('Risk', 'title', ('mitigation_plan',)),
+    'rfi': ('Rfi', 'title', ('question', 'response_summary')),
+    'document': ('Document', 'title', ('description',)),
+}
+
+
+def create_text_index(apps, schema_editor):
+    """Add the full-text index the ORM doesn't model.
+
+    PostgreSQL gets a generated, weighted tsvector column with a GIN index;
+    SQLite an external-content FTS5 table kept in step by triggers. Other
+    databases search with icontains.
+    """
+    execute = schema_editor.execute
+    if schema_editor.connection.vendor == 'postgresql':
+        execute(
+            f"ALTER TABLE {TABLE} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+            f"setweight(to_tsvector('english', title), 'A') || "
+            f"setweight(to_tsvector('english', body), 'B')) STORED"
+        )
+        execute(f'CREATE INDEX search_entry_vector_idx ON {TABLE} USING gin (search_vector)')
+    elif schema_editor.connection.vendor == 'sqlite':
+        execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+            f"title, body, content='{TABLE}', content_rowid='id', tokenize='porter unicode61')"
+        )
+        execute(
+            f'CREATE TRIGGER {TABLE}_ai AFTER INSERT ON {TABLE} BEGIN '
+            f'INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id, new.title, new.body); END'
+        )
+        execute(
+            f'CREATE TRIGGER {TABLE}_ad AFTER DELETE ON {TABLE} BEGIN '
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) VALUES ('delete', old.id, old.title, old.body); END"
+        )
+        execute(
+            f'CREATE TRIGGER {TABLE}_au AFTER UPDATE ON {TABLE} BEGIN '
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) VALUES ('delete', old.id, old.title, old.body); "
+            f'INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id, new.title, new.body); END'
+        )
+
+
+def drop_text_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        for suffix in ('ai', 'ad', 'au'):
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {TABLE}_{suffix}')
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+    # On PostgreSQL the column and its index go with the table.
+
+
+def index_existing_rows(apps, schema_editor):
+    SearchEntry = apps.get_model('core', 'SearchEntry')
+    for entity_type, (model_name, title, body) in SOURCES.items():
+        model = apps.get_model('core', model_name)
+        project_column = 'id' if model_name == 'Project' else 'project_id'
+        batch = []
+        for row in model.objects.values('id', project_column, title, *body).iterator(chunk_size=5000):
+            entry = SearchEntry(
+                entity_type=entity_type,
+                entity_id=row['id'],
+                project_id=row[project_column],
+                title=row[title],
+                body='\n\n'.join(row[column] for column in body if row[column]),
+            )
+            if model_name != 'Project':
+                setattr(entry, f'{entity_type}_id', row['id'])
+            batch.append(entry)
+            if len(batch) >= 5000:
+                SearchEntry.objects.bulk_create(batch)
+                batch = []
+        SearchEntry.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_approval_updated_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('entity_type', models.CharField(choices=[('project', 'Project'), ('risk', 'Risk'), ('rfi', 'RFI'), ('document', 'Document')], max_length=20)),
+                ('entity_id', models.CharField(max_length=32)),
+                ('title', models.CharField(max_length=200)),
+                ('body', models.TextField(blank=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('document', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.document')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.project')),
+                ('rfi', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.rfi')),
+                ('risk', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.risk')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['project', 'entity_type'], name='search_project_type_idx')],
+                'constraints': [models.UniqueConstraint(fields=('entity_type', 'entity_id'), name='search_entry_unique')],
+            },
+        ),
+        migrations.RunPython(create_text_index, drop_text_index),
+        migrations.RunPython(index_existing_rows, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='budgetitem',
+            index=models.Index(fields=['project', 'forecast_cost'], name='budget_project_forecast_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='budgetitem',
+            index=models.Index(fields=['status', 'project'], name='budget_status_project_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['status'], name='project_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rfi',
+            index=models.Index(fields=['project', 'due_date'], name='rfi_project_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rfi',
+            index=models.Index(fields=['status', 'project'], name='rfi_status_project_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='risk',
+            index=models.Index(fields=['project', 'due_date'], name='risk_project_due_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_list_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BudgetSnapshot',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('day', models.DateField()),
+                ('lines', models.PositiveIntegerField(default=0)),
+                ('original_budget', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('approved_variations', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('forecast_cost', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('actual_spent', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('keyframe', models.BooleanField(default=False)),
+                ('items', models.JSONField(blank=True, default=dict)),
+                ('captured_at', models.DateTimeField(auto_now_add=True)),
+                ('project', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='budget_snapshots', to='core.project')),
+            ],
+            options={
+                'ordering': ['day'],
+                'indexes': [models.Index(condition=models.Q(('keyframe', True)), fields=['project', 'day'], name='budget_snapshot_keyframe_idx')],
+                'constraints': [models.UniqueConstraint(fields=('project', 'day'), name='budget_snapshot_unique'), models.UniqueConstraint(condition=models.Q(('project__isnull', True)), fields=('day',), name='budget_snapshot_portfolio_unique')],
+            },
+        ),
+    ]
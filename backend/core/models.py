@@ -1,5 +1,6 @@
-from core.features.projects.models import Project
+from core.features.projects.models import ProgramSummary, Project
 from core.features.budgets.models import BudgetItem
+from core.features.budget_history.models import BudgetSnapshot
 from core.features.milestones.models import Milestone
 from core.features.risks.models import Risk
 from core.features.rfis.models import Rfi
@@ -7,10 +8,13 @@ from core.features.documents.models import Document
 from core.features.media_items.models import MediaItem
 from core.features.approvals.models import Approval
 from core.features.activity.models import ActivityLog
+from core.features.search.models import SearchEntry
 
 __all__ = [
     'Project',
+    'ProgramSummary',
     'BudgetItem',
+    'BudgetSnapshot',
     'Milestone',
     'Risk',
     'Rfi',
@@ -18,4 +22,5 @@ __all__ = [
     'MediaItem',
     'Approval',
     'ActivityLog',
+    'SearchEntry',
 ]
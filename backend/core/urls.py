@@ -2,14 +2,17 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from core.features.auth.views import CsrfView, LoginView, LogoutView, MeView
-from core.features.activity.views import ActivityLogViewSet
+from core.features.activity.views import ActivityLogViewSet, project_events
 from core.features.approvals.views import ApprovalViewSet
+from core.features.common.async_views import async_read_urls, async_read_view
 from core.features.budgets.views import BudgetItemViewSet
 from core.features.documents.views import DocumentViewSet
 from core.features.media_items.views import MediaItemViewSet
+from core.features.metrics.views import MetricsView
 from core.features.milestones.views import MilestoneViewSet
 from core.features.projects.views import ProjectViewSet, ProgramSummaryView
 from core.features.rfis.views import RfiViewSet
+from core.features.search.views import SearchView
 from core.features.risks.views import RiskViewSet
 
 router = DefaultRouter()
@@ -28,6 +31,9 @@ urlpatterns = [
     path('auth/login/', LoginView.as_view(), name='login'),
     path('auth/logout/', LogoutView.as_view(), name='logout'),
     path('auth/me/', MeView.as_view(), name='me'),
-    path('summary/', ProgramSummaryView.as_view(), name='program-summary'),
-    path('', include(router.urls)),
+    path('search/', SearchView.as_view(), name='search'),
+    path('summary/', async_read_view(ProgramSummaryView.as_view()), name='program-summary'),
+    path('_metrics/', MetricsView.as_view(), name='metrics'),
+    path('projects/<str:pk>/events/', project_events, name='project-events'),
+    path('', include(async_read_urls(router.urls))),
 ]
@@ -63,6 +63,9 @@ export const fetchJson = async <T>(path: string, init?: RequestInit): Promise<T>
   return JSON.parse(text) as T
 }
 
+export const openEventStream = (path: string) =>
+  new EventSource(`${API_BASE_URL}/${ensureTrailingSlash(path)}`, { withCredentials: true })
+
 export const unwrapResults = <T>(payload: Paginated<T> | T[]): T[] => {
   if (Array.isArray(payload)) {
     return payload
@@ -43,6 +43,20 @@ export const updateBudget = async (id: string, payload: BudgetItemInput) =>
     body: JSON.stringify(toBudgetPayload(payload)),
   })
 
+export const createBudgets = async (payloads: BudgetItemInput[]) =>
+  fetchJson<BudgetItem[]>('budgets/bulk', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(payloads.map(toBudgetPayload)),
+  })
+
+export const updateBudgets = async (items: { id: string; payload: BudgetItemInput }[]) =>
+  fetchJson<BudgetItem[]>('budgets/bulk', {
+    method: 'PATCH',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(items.map(({ id, payload }) => ({ id, ...toBudgetPayload(payload) }))),
+  })
+
 export const deleteBudget = async (id: string) =>
   fetchJson<void>(`budgets/${id}`, {
     method: 'DELETE',
@@ -187,3 +201,27 @@ export const getActivityLogs = async (projectId?: string, page = 1, pageSize = 2
   }
   return payload
 }
+
+export type WorkspaceSection<T> = {
+  count: number
+  results: T[]
+}
+
+export type ProjectWorkspace = {
+  project: Project
+  sections: {
+    budgets: WorkspaceSection<BudgetItem>
+    milestones: WorkspaceSection<Milestone>
+    risks: WorkspaceSection<Risk>
+    rfis: WorkspaceSection<Rfi>
+    documents: WorkspaceSection<Document>
+    media_items: WorkspaceSection<MediaItem>
+    approvals: WorkspaceSection<Approval>
+    activity: WorkspaceSection<ActivityLog>
+  }
+}
+
+export const getProjectWorkspace = async (projectId: string, limit?: number) => {
+  const query = limit === undefined ? '' : `?limit=${limit}`
+  return fetchJson<ProjectWorkspace>(`projects/${encodeURIComponent(projectId)}/workspace${query}`)
+}
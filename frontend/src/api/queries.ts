@@ -1,4 +1,6 @@
-import { useQuery } from '@tanstack/react-query'
+import { useEffect } from 'react'
+import { useQuery, useQueryClient } from '@tanstack/react-query'
+import { openEventStream } from '@/api/client'
 import {
   getActivityLogs,
   getApprovals,
@@ -7,6 +9,7 @@ import {
   getMediaItems,
   getMilestones,
   getProgramSummary,
+  getProjectWorkspace,
   getProjects,
   getRfis,
   getRisks,
@@ -43,3 +46,26 @@ export const useActivityLogs = (projectId?: string, page = 1, pageSize = 20) =>
     queryKey: ['activity', projectId ?? 'all', page, pageSize],
     queryFn: () => getActivityLogs(projectId, page, pageSize),
   })
+
+export const useProjectWorkspace = (projectId?: string, limit?: number) =>
+  useQuery({
+    queryKey: ['workspace', projectId ?? 'none', limit ?? 'default'],
+    queryFn: () => getProjectWorkspace(projectId as string, limit),
+    enabled: Boolean(projectId),
+  })
+
+// Refetches a project's approvals and activity when the server pushes a change.
+export const useProjectEvents = (projectId?: string) => {
+  const queryClient = useQueryClient()
+  useEffect(() => {
+    if (!projectId) return undefined
+    const source = openEventStream(`projects/${projectId}/events`)
+    const refresh = (key: string) => () => {
+      queryClient.invalidateQueries({ queryKey: [key, projectId] })
+      queryClient.invalidateQueries({ queryKey: ['workspace', projectId] })
+    }
+    source.addEventListener('activity', refresh('activity'))
+    source.addEventListener('approval', refresh('approvals'))
+    return () => source.close()
+  }, [projectId, queryClient])
+}
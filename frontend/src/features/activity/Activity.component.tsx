@@ -1,6 +1,7 @@
 import Badge from '@/features/ui/badge/Badge.component'
 import Spinner from '@/features/ui/spinner/Spinner.component'
 import { useActivityLogs } from '@/api/queries'
+import type { ActivityLog } from '@/features/activity/Activity.component.types'
 
 const actionTone = (action: string) => {
   if (action === 'approve') return 'success'
@@ -9,6 +10,13 @@ const actionTone = (action: string) => {
   return 'neutral'
 }
 
+const formatMetadata = (value: ActivityLog['metadata'][string]) => {
+  if (typeof value !== 'object') return String(value)
+  return Object.entries(value)
+    .map(([field, change]) => `${field} ${change.old ?? '—'} → ${change.new ?? '—'}`)
+    .join(', ')
+}
+
 const Activity = () => {
   const { data: payload, isLoading: loading, isError } = useActivityLogs()
   const items = payload?.results ?? []
@@ -67,7 +75,7 @@ const Activity = () => {
               <div className="activity__meta">
                 {Object.entries(log.metadata ?? {}).map(([key, value]) => (
                   <span key={key}>
-                    {key}: {String(value)}
+                    {key}: {formatMetadata(value)}
                   </span>
                 ))}
               </div>
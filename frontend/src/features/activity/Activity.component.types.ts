@@ -1,10 +1,15 @@
+export type FieldChange = {
+  old: string | number | boolean | null
+  new: string | number | boolean | null
+}
+
 export type ActivityLog = {
   id: string
   project_id: string
   actor: string
-  action: 'submit' | 'approve' | 'reject' | 'update'
+  action: 'submit' | 'approve' | 'reject' | 'update' | 'create' | 'delete'
   entity_type: string
   entity_id: string
-  metadata: Record<string, string | number>
+  metadata: Record<string, string | number | Record<string, FieldChange>>
   created_at: string
 }
@@ -26,6 +26,7 @@ import {
   useDocuments,
   useMediaItems,
   useMilestones,
+  useProjectEvents,
   useProjects,
   useRfis,
   useRisks,
@@ -696,6 +697,7 @@ const ProjectWorkspace = () => {
     isError: activityError,
     isFetching: activityFetching,
   } = useActivityLogs(projectId, 1, activityFetchSize)
+  useProjectEvents(projectId)
   const activityItems = useMemo(() => activityPayload?.results ?? [], [activityPayload])
   const activityFiltered = useMemo(
     () => activityItems.filter((item) => resolveProjectId(item) === projectId),
@@ -1722,9 +1724,11 @@ const ProjectWorkspace = () => {
               <div>
                 <strong>{item.actor}</strong>
                 <div className="subtle">
-                  {(item.metadata ?? {}).note ??
-                    (item.metadata ?? {}).title ??
-                    'Update recorded'}
+                  {String(
+                    (item.metadata ?? {}).note ??
+                      (item.metadata ?? {}).title ??
+                      'Update recorded',
+                  )}
                 </div>
               </div>
               <span>{item.action}</span>